@@ -7,8 +7,9 @@ from typing import List, Optional, Dict, Any
 
 from protocol_monk.config.settings import Settings
 from protocol_monk.agent.structs import Message, ContextStats, ToolResult
+from protocol_monk.tools.output_contract import DEFAULT_READ_PAGE_LINES
 from .store import ContextStore
-from .file_tracker import FileTracker
+from .file_tracker import FileTracker, ReadFingerprint
 from . import logic
 
 
@@ -97,12 +98,70 @@ class ContextCoordinator:
 
         file_path = self._normalize_workspace_path(raw_path)
         if result.tool_name == self.FILE_READ_TOOL:
+            if _unchanged_read_of(result):
+                # Content lives in the earlier message; keep tracking that one.
+                return
             self._tracker.mark_loaded(file_path, message_id)
+            self._record_read_fingerprint(result, file_path, message_id)
             return
 
         if result.tool_name in self.FILE_MUTATION_TOOLS:
             self._tracker.remove_file(file_path)
 
+    def _record_read_fingerprint(
+        self, result: ToolResult, file_path: str, message_id: str
+    ) -> None:
+        fingerprint = (result.metadata or {}).get("read_fingerprint")
+        if not isinstance(fingerprint, dict) or not fingerprint.get("content"):
+            return
+        range_key = fingerprint.get("range_key") or [1, None]
+        line_start, line_end = range_key[0], range_key[1]
+        self._tracker.record_read(
+            file_path,
+            line_start,
+            line_end,
+            ReadFingerprint(
+                fingerprint=str(fingerprint["content"]),
+                mtime_ns=int(fingerprint.get("mtime_ns") or 0),
+                size=int(fingerprint.get("size") or 0),
+                message_id=message_id,
+                tool_call_id=result.call_id,
+            ),
+        )
+
+    def _mask_stale_reads(self, result: ToolResult) -> None:
+        """Stub out earlier reads this result supersedes (re-read or mutation)."""
+        if (
+            not result.success
+            or _unchanged_read_of(result)
+            or not getattr(self._settings, "context_mask_stale_reads", True)
+        ):
+            return
+        if (
+            result.tool_name != self.FILE_READ_TOOL
+            and result.tool_name not in self.FILE_MUTATION_TOOLS
+        ):
+            return
+
+        history = self._store.get_full_history()
+        masked = logic.mask_superseded_reads(
+            history,
+            path_key=self._normalize_workspace_path,
+            read_tool=self.FILE_READ_TOOL,
+            mutation_tools=self.FILE_MUTATION_TOOLS,
+            default_read_lines=DEFAULT_READ_PAGE_LINES,
+        )
+        if masked is history:
+            return
+        self._store.replace_history(masked)
+        masked_ids = [
+            new.metadata.get("id")
+            for old, new in zip(history, masked)
+            if old is not new
+        ]
+        self._tracker.forget_messages(masked_ids)
+        self._logger.debug("Masked %s superseded file read(s)", len(masked_ids))
+
     async def add_user_message(self, text: str) -> ContextStats:
         """
         Adds user input, calculates tokens, and auto-prunes if needed.
@@ -230,6 +289,23 @@ class ContextCoordinator:
             "request_parameters": result.request_parameters,
         }
         content = json.dumps(envelope, ensure_ascii=False, default=str)
+        tokens_saved = 0
+        if getattr(self._settings, "tool_result_envelope", "compact") == "compact":
+            full_content = content
+            content = json.dumps(
+                logic.compact_tool_envelope(
+                    envelope,
+                    inline_parameter_chars=int(
+                        getattr(self._settings, "tool_result_inline_parameter_chars", 256)
+                    ),
+                ),
+                ensure_ascii=False,
+                default=str,
+                separators=(",", ":"),
+            )
+            tokens_saved = max(
+                0, self._estimate_tokens(full_content) - self._estimate_tokens(content)
+            )
         message_id = str(uuid.uuid4())
 
         msg = Message(
@@ -246,10 +322,18 @@ class ContextCoordinator:
                 "success": result.success,
                 "duration": result.duration,
                 "request_parameters": result.request_parameters or {},
+                "envelope_tokens_saved": tokens_saved,
             },
         )
+        unchanged_since = _unchanged_read_of(result)
+        if unchanged_since:
+            msg.metadata["unchanged_since"] = unchanged_since
+        read_range = _returned_range_of(result)
+        if read_range is not None:
+            msg.metadata["read_range"] = read_range
         self._store.add(msg)
         self._record_file_tracking(result, message_id)
+        self._mask_stale_reads(result)
         self._ensure_limits()
         return self._get_stats()
 
@@ -288,3 +372,28 @@ class ContextCoordinator:
         self._store.add(msg)
         self._ensure_limits()
         return self._get_stats()
+
+
+def _returned_range_of(result: ToolResult) -> Optional[List[int]]:
+    """[first, last] line a `read_file` result actually returned, if known."""
+    if result.tool_name != ContextCoordinator.FILE_READ_TOOL:
+        return None
+    output = result.output if isinstance(result.output, dict) else {}
+    data = output.get("data")
+    actual = data.get("actual_range") if isinstance(data, dict) else None
+    if not isinstance(actual, dict):
+        return None
+    start, end = actual.get("line_start"), actual.get("line_end")
+    if not isinstance(start, int) or not isinstance(end, int):
+        return None
+    return [start, end]
+
+
+def _unchanged_read_of(result: ToolResult) -> Optional[str]:
+    """Message id a deduplicated `read_file` result points back to, if any."""
+    output = result.output if isinstance(result.output, dict) else {}
+    if output.get("result_type") != "file_read_unchanged":
+        return None
+    data = output.get("data")
+    since = data.get("unchanged_since") if isinstance(data, dict) else None
+    return str(since) if since else None
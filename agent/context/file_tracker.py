@@ -1,4 +1,17 @@
-from typing import Dict, Set
+from typing import Dict, Iterable, NamedTuple, Optional, Set, Tuple
+
+
+class ReadFingerprint(NamedTuple):
+    """What a live `read_file` result returned for one (path, range)."""
+
+    fingerprint: str
+    mtime_ns: int
+    size: int
+    message_id: str
+    tool_call_id: str
+
+
+ReadKey = Tuple[str, int, Optional[int]]
 
 
 class FileTracker:
@@ -25,6 +38,8 @@ class FileTracker:
     def __init__(self):
         # Maps file_path -> message_id that contains it
         self._loaded_files: Dict[str, str] = {}
+        # (file_path, line_start, line_end) -> fingerprint of the read result
+        self._reads: Dict[ReadKey, ReadFingerprint] = {}
 
     def is_loaded(self, file_path: str) -> bool:
         return file_path in self._loaded_files
@@ -35,12 +50,38 @@ class FileTracker:
     def remove_file(self, file_path: str) -> None:
         if file_path in self._loaded_files:
             del self._loaded_files[file_path]
+        for key in [key for key in self._reads if key[0] == file_path]:
+            del self._reads[key]
+
+    def record_read(
+        self,
+        file_path: str,
+        line_start: int,
+        line_end: Optional[int],
+        fingerprint: ReadFingerprint,
+    ) -> None:
+        self._reads[(file_path, line_start, line_end)] = fingerprint
+
+    def get_read(
+        self, file_path: str, line_start: int, line_end: Optional[int]
+    ) -> Optional[ReadFingerprint]:
+        """Return the fingerprint of a read of this range still live in history."""
+        return self._reads.get((file_path, line_start, line_end))
+
+    def forget_messages(self, message_ids: Iterable[str]) -> None:
+        """Drop reads whose content is no longer in history (e.g. masked)."""
+        dropped = set(message_ids)
+        if not dropped:
+            return
+        for key in [k for k, v in self._reads.items() if v.message_id in dropped]:
+            del self._reads[key]
 
     def count(self) -> int:
         return len(self._loaded_files)
 
     def clear(self) -> None:
         self._loaded_files.clear()
+        self._reads.clear()
 
     def sync_with_history(self, active_message_ids: Set[str]) -> None:
         """
@@ -54,3 +95,9 @@ class FileTracker:
 
         for path in to_remove:
             del self._loaded_files[path]
+
+        self.forget_messages(
+            fingerprint.message_id
+            for fingerprint in self._reads.values()
+            if fingerprint.message_id not in active_message_ids
+        )
@@ -1,5 +1,9 @@
-from typing import List, Set, Optional
+import hashlib
+import json
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, Set, Optional
 from protocol_monk.agent.structs import Message, ContextStats
+from protocol_monk.tools.output_contract import DEFAULT_READ_PAGE_LINES
 
 
 def count_tokens(text: str) -> int:
@@ -231,3 +235,173 @@ def drop_oldest_turn_chunk(messages: List[Message]) -> List[Message]:
             continue
         result.extend(chunk)
     return result
+
+
+def _parameter_reference(value: Any, encoded: str) -> Dict[str, Any]:
+    reference: Dict[str, Any] = {
+        "omitted": "sha256:" + hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16],
+        "chars": len(value) if isinstance(value, str) else len(encoded),
+    }
+    if isinstance(value, str):
+        reference["lines"] = value.count("\n") + 1
+    return reference
+
+
+def compact_tool_envelope(
+    envelope: Dict[str, Any],
+    *,
+    inline_parameter_chars: int,
+) -> Dict[str, Any]:
+    """
+    Drop null fields and timing from a tool-result envelope and replace large
+    request parameter values with a hash/length reference.
+
+    The model already has the parameters in its own tool call, so echoing
+    e.g. the full content of a `create_file` back only doubles its cost.
+    """
+    compact = {
+        key: value
+        for key, value in envelope.items()
+        if value is not None and key not in {"duration_seconds", "request_parameters"}
+    }
+    parameters = envelope.get("request_parameters")
+    if isinstance(parameters, dict) and parameters:
+        lean: Dict[str, Any] = {}
+        for name, value in parameters.items():
+            encoded = (
+                value
+                if isinstance(value, str)
+                else json.dumps(value, ensure_ascii=False, default=str)
+            )
+            if len(encoded) > inline_parameter_chars:
+                lean[name] = _parameter_reference(value, encoded)
+            else:
+                lean[name] = value
+        compact["request_parameters"] = lean
+    return compact
+
+
+def _read_range(metadata: Dict[str, Any], default_lines: int) -> tuple:
+    """
+    Lines a read actually returned: the recorded `read_range`, else the
+    requested range with the tool's default page size filled in.
+    """
+    recorded = metadata.get("read_range")
+    if (
+        isinstance(recorded, (list, tuple))
+        and len(recorded) == 2
+        and all(isinstance(value, int) for value in recorded)
+    ):
+        return int(recorded[0]), int(recorded[1])
+    parameters = metadata.get("request_parameters") or {}
+    start = parameters.get("line_start")
+    end = parameters.get("line_end")
+    start = start if isinstance(start, int) and start > 0 else 1
+    if not isinstance(end, int) or end < start:
+        end = start + default_lines - 1
+    return start, end
+
+
+def _range_covers(newer: tuple, older: tuple) -> bool:
+    new_start, new_end = newer
+    old_start, old_end = older
+    return new_start <= old_start and new_end >= old_end
+
+
+def mask_superseded_reads(
+    messages: List[Message],
+    *,
+    path_key: Callable[[str], str],
+    read_tool: str,
+    mutation_tools: Set[str],
+    default_read_lines: int = DEFAULT_READ_PAGE_LINES,
+) -> List[Message]:
+    """
+    Replace the content of stale file reads with a short stub.
+
+    A successful read is stale once a later successful mutation touches the
+    same path, or a later read of the same path returned every line it did.
+    Reads without an explicit `line_end` are paged, so their range is only
+    `default_read_lines` long. The
+    tool message itself is kept (same role, tool_call_id and name) so the
+    assistant tool_call it answers still has its result and turn chunking is
+    unaffected; only the file body is dropped.
+    """
+    # path -> [(message index, line range)] of reads not yet superseded
+    open_reads: Dict[str, List[tuple]] = {}
+    stale: Dict[int, tuple] = {}
+
+    for index, message in enumerate(messages):
+        if message.role != "tool" or not isinstance(message.metadata, dict):
+            continue
+        metadata = message.metadata
+        tool_name = metadata.get("tool_name") or message.name
+        if not metadata.get("success") or metadata.get("unchanged_since"):
+            # Dedup stubs hold no content and supersede nothing.
+            continue
+        parameters = metadata.get("request_parameters") or {}
+        raw_path = parameters.get("filepath") if isinstance(parameters, dict) else None
+        if not isinstance(raw_path, str) or not raw_path.strip():
+            continue
+        if tool_name != read_tool and tool_name not in mutation_tools:
+            continue
+
+        path = path_key(raw_path)
+        newer_id = metadata.get("id")
+        pending = open_reads.get(path, [])
+        if tool_name in mutation_tools:
+            for read_index, _ in pending:
+                stale[read_index] = (newer_id, "modified")
+            open_reads[path] = []
+            continue
+
+        read_range = _read_range(metadata, default_read_lines)
+        still_open = []
+        for read_index, older_range in pending:
+            if _range_covers(read_range, older_range):
+                stale[read_index] = (newer_id, "reread")
+            else:
+                still_open.append((read_index, older_range))
+        if not metadata.get("masked"):
+            still_open.append((index, read_range))
+        open_reads[path] = still_open
+
+    if not stale:
+        return messages
+
+    result = list(messages)
+    for index, (newer_id, reason) in stale.items():
+        message = messages[index]
+        if message.metadata.get("masked"):
+            continue
+        stub = {
+            "type": "tool_result",
+            "tool_name": message.metadata.get("tool_name") or message.name,
+            "tool_call_id": _get_tool_call_id(message),
+            "success": True,
+            "superseded_by": newer_id,
+            "reason": reason,
+            "request_parameters": message.metadata.get("request_parameters") or {},
+            "note": (
+                "File content omitted: the file was modified after this read."
+                if reason == "modified"
+                else "File content omitted: see the later read of this file."
+            ),
+        }
+        metadata = dict(message.metadata)
+        metadata.update(
+            {
+                "masked": True,
+                "superseded_by": newer_id,
+                "mask_reason": reason,
+                "masked_chars": len(message.content or ""),
+            }
+        )
+        result[index] = replace(
+            message,
+            content=json.dumps(
+                stub, ensure_ascii=False, default=str, separators=(",", ":")
+            ),
+            metadata=metadata,
+        )
+    return result
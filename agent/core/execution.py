@@ -7,6 +7,7 @@ from protocol_monk.agent.structs import ToolRequest, ToolResult
 from protocol_monk.exceptions.base import log_exception
 from protocol_monk.tools.registry import ToolRegistry
 from protocol_monk.exceptions.tools import ToolError
+from protocol_monk.tools.output_contract import RESULT_METADATA_KEY
 
 
 class ToolExecutor:
@@ -63,15 +64,18 @@ class ToolExecutor:
                 )
 
             duration = time.time() - start_time
+            output = dict(result)
+            metadata = output.pop(RESULT_METADATA_KEY, None)
             return ToolResult(
                 tool_name=request.name,
                 call_id=request.call_id,
                 success=True,
-                output=dict(result),
+                output=output,
                 duration=duration,
                 error=None,
                 output_kind="structured_json",
                 request_parameters=request.parameters,
+                metadata=dict(metadata) if isinstance(metadata, Mapping) else {},
             )
 
         except asyncio.TimeoutError:
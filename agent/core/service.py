@@ -13,6 +13,7 @@ from protocol_monk.protocol.events import EventTypes
 from protocol_monk.protocol.command_dispatcher import (
     COMPACT_PROMPT_TEMPLATE_FILENAME,
     ORTHOCAL_BRIEFING_PROMPT_TEMPLATE_FILENAME,
+    ROLLING_COMPACT_PROMPT_TEMPLATE_FILENAME,
     load_prompt_template,
     parse_slash_command,
 )
@@ -33,6 +34,17 @@ from protocol_monk.agent.context.coordinator import ContextCoordinator
 from protocol_monk.agent.core.state_machine import StateMachine, AgentState
 from protocol_monk.tools.registry import ToolRegistry
 from protocol_monk.config.settings import Settings
+from protocol_monk.agent.model_routing import InternalPassRouter
+from protocol_monk.agent.rolling_compaction import (
+    RollingCompactor,
+    merge_session_memory,
+)
+from protocol_monk.agent.speculative_dispatch import SpeculativeToolDispatcher
+from protocol_monk.agent.tool_call_repair import ToolCallRepair, repair_tool_call
+from protocol_monk.agent.token_calibration import (
+    TokenCalibrator,
+    calibration_path_for,
+)
 from protocol_monk.agent.usage_ledger import (
     UsageLedger,
     build_request_payload_for_provider,
@@ -99,11 +111,15 @@ class AgentService:
         self._skill_runtime = skill_runtime
         self._neuralsym_adapter = neuralsym_adapter
         self._usage_ledger = UsageLedger(
-            model_name=str(getattr(settings, "active_model_name", "") or "")
+            model_name=str(getattr(settings, "active_model_name", "") or ""),
+            calibrator=self._build_token_calibrator(settings),
         )
         self._orthocal_service: OrthocalWorkspaceService | None = None
         self._session_memory: SessionMemoryState | None = None
         self._orthocal_capsule: OrthocalContextCapsule | None = None
+        self._rolling_compactor = self._build_rolling_compactor(settings)
+        self._model_router = InternalPassRouter(settings)
+        self._speculative_tools: SpeculativeToolDispatcher | None = None
 
     async def start(self) -> None:
         """
@@ -120,6 +136,12 @@ class AgentService:
         )
         self._logger.info("Agent Service started and listening.")
 
+    def attach_neuralsym_adapter(
+        self, adapter: "ProtocolMonkNeuralSymAdapter | None"
+    ) -> None:
+        """Attach a NeuralSym adapter that finished loading after startup."""
+        self._neuralsym_adapter = adapter
+
     def _assistant_tool_call_payload(self, req: ToolRequest) -> Dict[str, Any]:
         return {
             "id": req.call_id,
@@ -419,6 +441,134 @@ class AgentService:
         )
         return stats
 
+    @staticmethod
+    def _build_token_calibrator(settings: Settings) -> TokenCalibrator | None:
+        if not bool(getattr(settings, "token_calibration_enabled", True)):
+            return None
+        resolved_paths = getattr(settings, "resolved_paths", None)
+        if resolved_paths is None:
+            return None
+        provider = str(getattr(settings, "llm_provider", "") or "ollama")
+        calibrator = TokenCalibrator(
+            calibration_path_for(resolved_paths.state_home, provider)
+        )
+        calibrator.load()
+        return calibrator
+
+    def _build_rolling_compactor(self, settings: Settings) -> RollingCompactor | None:
+        if not getattr(settings, "rolling_compaction_enabled", True):
+            return None
+        return RollingCompactor(
+            self._summarize_aging_history,
+            trigger_fraction=float(getattr(settings, "rolling_compaction_trigger", 0.65)),
+            target_fraction=float(getattr(settings, "rolling_compaction_target", 0.5)),
+        )
+
+    async def _summarize_aging_history(
+        self,
+        messages: List[Message],
+        memory: SessionMemoryState | None,
+    ) -> SessionMemoryState | None:
+        """Fold the oldest turn chunks into session memory (runs off the request lock)."""
+        prompt = load_prompt_template(ROLLING_COMPACT_PROMPT_TEMPLATE_FILENAME)
+        history: List[Message] = []
+        system_prompt = self._context.get_system_prompt()
+        if system_prompt is not None:
+            history.append(system_prompt)
+        if memory is not None and not memory.is_effectively_empty():
+            history.append(
+                Message(
+                    role="system",
+                    content=self._build_session_memory_injection_text(memory),
+                    timestamp=time.time(),
+                    metadata={"id": str(uuid.uuid4()), "source": "session_memory"},
+                )
+            )
+        history.append(
+            Message(
+                role="system",
+                content=prompt,
+                timestamp=time.time(),
+                metadata={"id": str(uuid.uuid4()), "mode": "rolling_compact"},
+            )
+        )
+        history.extend(messages)
+        response = await self._run_internal_model_pass(
+            history=history,
+            turn_id=f"rolling-compact-{uuid.uuid4()}",
+            round_index=0,
+            kind="rolling_compact",
+        )
+        return self._parse_session_memory_state(str(response.content or ""))
+
+    def _maybe_start_rolling_compaction(self, request_estimate: Dict[str, Any]) -> None:
+        if self._rolling_compactor is None:
+            return
+        started = self._rolling_compactor.maybe_start(
+            self._context.get_full_history(),
+            request_estimate,
+            self._session_memory,
+        )
+        if started:
+            self._logger.info(
+                "Rolling compaction started at %s/%s estimated tokens",
+                request_estimate.get("estimated_next_request_tokens"),
+                request_estimate.get("context_limit"),
+            )
+
+    async def _apply_rolling_compaction(
+        self,
+        *,
+        turn_id: str,
+        round_index: int,
+    ) -> set[str]:
+        """
+        Swap a finished background compaction in between passes: merge its
+        memory and drop the summarized messages still in history.
+        Returns the ids of the dropped messages.
+        """
+        if self._rolling_compactor is None:
+            return set()
+        result = self._rolling_compactor.take_ready()
+        if result is None:
+            return set()
+
+        history = self._context.get_full_history()
+        kept = [
+            message
+            for message in history
+            if message.metadata.get("id") not in result.message_ids
+        ]
+        dropped = {
+            message.metadata.get("id")
+            for message in history
+            if message.metadata.get("id") in result.message_ids
+        }
+        self._session_memory = merge_session_memory(self._session_memory, result.memory)
+        stats = self._context.replace_history(kept)
+
+        await self._bus.emit(
+            EventTypes.INFO,
+            {
+                "message": "Rolling compaction applied",
+                "data": {
+                    "compacted_turn_chunks": result.chunk_count,
+                    "compacted_messages": len(dropped),
+                    "already_pruned_messages": len(result.message_ids) - len(dropped),
+                    "elapsed_ms": result.elapsed_ms,
+                    "session_memory": self._session_memory.counts(),
+                },
+                "turn_id": turn_id,
+                "round_index": round_index,
+            },
+        )
+        await self._emit_context_update(
+            stats,
+            turn_id=turn_id,
+            round_index=round_index,
+        )
+        return dropped
+
     async def _estimate_request_metrics(
         self,
         history: List[Message],
@@ -430,10 +580,17 @@ class AgentService:
             tools=self._registry.get_openai_tools(),
             options=getattr(self._settings, "model_parameters", {}) or {},
         )
-        return await self._usage_ledger.estimate_request(
+        estimate = await self._usage_ledger.estimate_request(
             request_payload=request_payload,
             context_limit=int(getattr(self._settings, "context_window_limit", 0) or 0),
         )
+        # Every pass re-sends each tool result, so its compaction savings recur.
+        estimate["envelope_tokens_saved"] = sum(
+            int(message.metadata.get("envelope_tokens_saved") or 0)
+            for message in history
+            if isinstance(message.metadata, dict)
+        )
+        return estimate
 
     async def _prepare_history_for_model_call(
         self,
@@ -448,6 +605,7 @@ class AgentService:
         base_ids = {id(message) for message in base_history}
         estimate = await self._estimate_request_metrics(current_history)
         pruned_chunks = 0
+        pruning_started = time.perf_counter()
 
         while not estimate.get("within_limit", True):
             pruned_history = context_logic.drop_oldest_turn_chunk(current_history)
@@ -464,6 +622,9 @@ class AgentService:
                     "message": "Preflight pruning applied",
                     "data": {
                         "pruned_turn_chunks": pruned_chunks,
+                        "elapsed_ms": round(
+                            (time.perf_counter() - pruning_started) * 1000, 3
+                        ),
                         "estimated_next_request_tokens": estimate.get(
                             "estimated_next_request_tokens"
                         ),
@@ -521,6 +682,7 @@ class AgentService:
             raw_metrics=response.provider_metrics,
             request_estimate=request_estimate,
         )
+        await asyncio.to_thread(self._usage_ledger.save_calibration)
         await self._bus.emit(
             EventTypes.METRICS_UPDATED,
             {
@@ -542,7 +704,24 @@ class AgentService:
         round_index: int,
         persist_pruned_history: bool,
         include_runtime_injections: bool = True,
+        route_kind: str | None = None,
+        speculate_tools: bool = False,
     ) -> AgentResponse:
+        compacted_ids = await self._apply_rolling_compaction(
+            turn_id=turn_id,
+            round_index=round_index,
+        )
+        if compacted_ids:
+            base_history = [
+                message
+                for message in base_history
+                if message.metadata.get("id") not in compacted_ids
+            ]
+            full_history = [
+                message
+                for message in full_history
+                if message.metadata.get("id") not in compacted_ids
+            ]
         runtime_history = list(full_history)
         if include_runtime_injections:
             runtime_history = await self._augment_history_with_runtime_injections(
@@ -557,24 +736,84 @@ class AgentService:
             round_index=round_index,
             persist_pruned_history=persist_pruned_history,
         )
-        response = await run_thinking_loop(
-            context_history=prepared_history,
-            provider=self._provider,
-            bus=self._bus,
-            registry=self._registry,
-            settings=self._settings,
+        pass_settings, routed = self._settings, False
+        if route_kind is not None:
+            pass_settings, routed = self._model_router.route(
+                route_kind,
+                estimated_tokens=int(
+                    request_estimate.get("estimated_next_request_tokens") or 0
+                ),
+            )
+        self._finish_speculative_tools()
+        dispatcher = None
+        if speculate_tools and getattr(
+            self._settings, "speculative_tool_dispatch", True
+        ):
+            dispatcher = SpeculativeToolDispatcher(
+                self._registry,
+                self._executor,
+                auto_confirm=self._auto_confirm,
+            )
+            self._speculative_tools = dispatcher
+        started = time.perf_counter()
+        response: AgentResponse | None = None
+        try:
+            response = await run_thinking_loop(
+                context_history=prepared_history,
+                provider=self._provider,
+                bus=self._bus,
+                registry=self._registry,
+                settings=pass_settings,
+                turn_id=turn_id,
+                round_index=round_index,
+                preflight_metrics=request_estimate,
+                on_tool_call=dispatcher.offer if dispatcher is not None else None,
+            )
+        except BaseException:
+            self._finish_speculative_tools()
+            raise
+        finally:
+            # Routable passes are counted whether or not they were routed, as
+            # in _run_internal_model_pass, so the routing ratio stays honest.
+            if route_kind is not None:
+                self._usage_ledger.record_internal_pass(
+                    kind=str(route_kind),
+                    model_name=str(pass_settings.active_model_name),
+                    routed=routed,
+                    elapsed_ms=(time.perf_counter() - started) * 1000,
+                    raw_metrics=response.provider_metrics if response is not None else None,
+                    failed=response is None,
+                )
+        await self._repair_tool_calls_locally(
+            response,
             turn_id=turn_id,
             round_index=round_index,
-            preflight_metrics=request_estimate,
         )
+        if routed:
+            # Another model's prompt count says nothing about the active model's.
+            request_estimate = {
+                key: value
+                for key, value in request_estimate.items()
+                if key != "calibration_key"
+            }
         await self._record_usage_metrics(
             turn_id=turn_id,
             round_index=round_index,
             response=response,
             request_estimate=request_estimate,
         )
+        self._maybe_start_rolling_compaction(request_estimate)
         return response
 
+    def _finish_speculative_tools(self) -> None:
+        """Cancel speculative executions nobody joined and record the pass's counts."""
+        dispatcher, self._speculative_tools = self._speculative_tools, None
+        if dispatcher is None:
+            return
+        dispatcher.discard()
+        if dispatcher.stats["dispatched"]:
+            self._usage_ledger.record_speculative_tools(dispatcher.stats)
+
     @staticmethod
     def _split_tool_calls(
         tool_calls: List[ToolRequest],
@@ -589,6 +828,67 @@ class AgentService:
                 malformed.append(req)
         return valid, malformed
 
+    async def _repair_tool_calls_locally(
+        self,
+        response: AgentResponse,
+        *,
+        turn_id: str,
+        round_index: int,
+    ) -> None:
+        """
+        Fix malformed tool calls against the tool schemas before they are
+        persisted, so most never need a model repair pass.
+        """
+        if not response.tool_calls or not getattr(
+            self._settings, "tool_call_local_repair", True
+        ):
+            return
+        schemas = {}
+        for name in self._registry.list_tool_names():
+            tool = self._registry.get_tool(name)
+            if tool is not None:
+                schemas[name] = tool.parameter_schema
+        repairs = []
+        for req in response.tool_calls:
+            try:
+                repairs.append(repair_tool_call(req, schemas))
+            except Exception as exc:
+                # A repair bug must never cost the pass; keep the call as emitted.
+                log_exception(
+                    self._logger, logging.WARNING, "Local tool-call repair failed", exc
+                )
+                repairs.append(ToolCallRepair(request=req))
+        attempted = [repair for repair in repairs if repair.attempted]
+        if not attempted:
+            return
+
+        response.tool_calls = [repair.request for repair in repairs]
+        stats = self._usage_ledger.record_tool_call_repairs(attempted)
+        await self._bus.emit(
+            EventTypes.INFO,
+            {
+                "message": "Local tool-call repair applied",
+                "data": {
+                    "attempted": len(attempted),
+                    "repaired": sum(1 for repair in attempted if repair.repaired),
+                    "calls": [
+                        {
+                            "call_id": repair.request.call_id,
+                            "name": repair.request.name,
+                            "repaired": repair.repaired,
+                            "actions": repair.actions,
+                            "error": repair.error,
+                        }
+                        for repair in attempted[:5]
+                    ],
+                    "local_hit_rate": stats.get("local_hit_rate"),
+                },
+                "turn_id": turn_id,
+                "pass_id": response.pass_id,
+                "round_index": round_index,
+            },
+        )
+
     def _build_tool_call_repair_prompt(
         self, malformed_tool_calls: List[ToolRequest]
     ) -> str:
@@ -665,6 +965,7 @@ class AgentService:
                 turn_id=turn_id,
                 round_index=round_index,
             )
+        self._usage_ledger.record_model_repair_pass()
         history = self._context.get_full_history()
         repair_prompt = self._build_tool_call_repair_prompt(malformed_tool_calls)
         augmented_history = [
@@ -677,6 +978,7 @@ class AgentService:
             turn_id=turn_id,
             round_index=round_index,
             persist_pruned_history=True,
+            route_kind="tool_repair",
         )
         await self._persist_assistant_response(
             response,
@@ -720,6 +1022,7 @@ class AgentService:
                     turn_id=turn_id,
                     round_index=0,
                     persist_pruned_history=True,
+                    speculate_tools=True,
                 )
                 await self._persist_assistant_response(
                     response,
@@ -799,6 +1102,13 @@ class AgentService:
                                 confirmation_future
                             )
 
+                        # Join the execution started while the model streamed, if any.
+                        prefetched = (
+                            self._speculative_tools.take(tool_req)
+                            if self._speculative_tools is not None
+                            else None
+                        )
+
                         # Execute the tool with the confirmation future
                         try:
                             result = await run_action_loop(
@@ -813,9 +1123,12 @@ class AgentService:
                                 confirmation_future=confirmation_future,
                                 auto_approve=self._auto_confirm,
                                 set_status=self._set_status,
+                                prefetched=prefetched,
                             )
                         finally:
                             self._pending_confirmations.pop(tool_req.call_id, None)
+                            if prefetched is not None and not prefetched.done():
+                                prefetched.cancel()
 
                         # Persist every tool outcome so the next turn/model pass can reason over it.
                         stats = await self._context.add_tool_result(result)
@@ -900,6 +1213,7 @@ class AgentService:
                         turn_id=turn_id,
                         round_index=rounds,
                         persist_pruned_history=True,
+                        speculate_tools=True,
                     )
                     await self._persist_assistant_response(
                         response,
@@ -949,6 +1263,8 @@ class AgentService:
                     turn_id=turn_id,
                     round_index=rounds,
                 )
+            finally:
+                self._finish_speculative_tools()
 
     async def _emit_context_update(
         self,
@@ -1119,6 +1435,8 @@ class AgentService:
 
     def _clear_session_memory(self) -> None:
         self._session_memory = None
+        if self._rolling_compactor is not None:
+            self._rolling_compactor.invalidate()
 
     def _clear_orthocal_capsule(self) -> None:
         self._orthocal_capsule = None
@@ -1198,20 +1516,40 @@ class AgentService:
         history: List[Message],
         turn_id: str,
         round_index: int,
+        kind: str,
     ) -> AgentResponse:
         silent_bus = EventBus()
         silent_registry = ToolRegistry()
         silent_registry.seal()
-        return await run_thinking_loop(
-            context_history=history,
-            provider=self._provider,
-            bus=silent_bus,
-            registry=silent_registry,
-            settings=self._settings,
-            turn_id=turn_id,
-            round_index=round_index,
-            preflight_metrics=None,
+        pass_settings, routed = self._model_router.route(
+            kind,
+            estimated_tokens=sum(
+                context_logic.count_tokens(message.content or "") for message in history
+            ),
         )
+        started = time.perf_counter()
+        response: AgentResponse | None = None
+        try:
+            response = await run_thinking_loop(
+                context_history=history,
+                provider=self._provider,
+                bus=silent_bus,
+                registry=silent_registry,
+                settings=pass_settings,
+                turn_id=turn_id,
+                round_index=round_index,
+                preflight_metrics=None,
+            )
+            return response
+        finally:
+            self._usage_ledger.record_internal_pass(
+                kind=kind,
+                model_name=str(pass_settings.active_model_name),
+                routed=routed,
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+                raw_metrics=response.provider_metrics if response is not None else None,
+                failed=response is None,
+            )
 
     def _build_orthocal_briefing_source(
         self,
@@ -1973,6 +2311,7 @@ class AgentService:
                     history=prep_history,
                     turn_id=turn_id,
                     round_index=1,
+                    kind="orthocal_briefing",
                 )
                 generated_briefing = str(prep_response.content or "").strip()
                 if generated_briefing and not list(prep_response.tool_calls or []):
@@ -2070,6 +2409,7 @@ class AgentService:
                     history=compact_history,
                     turn_id=turn_id,
                     round_index=0,
+                    kind="compact",
                 )
                 memory = self._parse_session_memory_state(str(response.content or ""))
                 if memory is None:
@@ -2087,6 +2427,8 @@ class AgentService:
                     return
 
                 await self._context.reset()
+                if self._rolling_compactor is not None:
+                    self._rolling_compactor.invalidate()
                 self._session_memory = memory
                 stats = await self._resolve_context_stats()
                 await self._emit_context_update(stats, turn_id=turn_id, round_index=1)
@@ -62,9 +62,13 @@ async def run_thinking_loop(
     turn_id: str,
     round_index: int = 0,
     preflight_metrics: Optional[Dict[str, Any]] = None,
+    on_tool_call: Optional[Callable[[ToolRequest], Any]] = None,
 ) -> AgentResponse:
     """
     Consumes ProviderSignals and builds the response.
+
+    `on_tool_call` sees each tool call as soon as the provider yields it,
+    before the stream has ended.
     """
     pass_id = str(uuid.uuid4())
     await bus.emit(
@@ -212,6 +216,11 @@ async def run_thinking_loop(
                             ),
                         },
                     )
+                if on_tool_call is not None:
+                    try:
+                        on_tool_call(req)
+                    except Exception as e:
+                        log_exception(logger, logging.WARNING, "Tool call hook failed", e)
                 tool_requests.append(req)
                 logger.debug(f"Received Tool Call: {req.name}")
 
@@ -420,9 +429,14 @@ async def run_action_loop(
     confirmation_future: Optional[asyncio.Future] = None,
     auto_approve: bool = False,
     set_status: Optional[Callable[..., Awaitable[None]]] = None,
+    prefetched: Optional[Awaitable[ToolResult]] = None,
 ) -> ToolResult:
     """
     Manages tool execution including the Confirmation Barrier.
+
+    `prefetched` is an execution of this exact request that was started
+    early (see agent.speculative_dispatch); it is awaited in place of the
+    executor once the barrier has passed.
     """
     requested_tool_name = str(getattr(tool_req, "name", "") or "").strip()
     tool_req.name = requested_tool_name
@@ -686,5 +700,8 @@ async def run_action_loop(
         },
     )
 
-    result = await executor.execute(tool_req, registry)
+    if prefetched is not None:
+        result = await prefetched
+    else:
+        result = await executor.execute(tool_req, registry)
     return await _emit_terminal_tool_events(result, emit_start=False)
@@ -0,0 +1,111 @@
+"""Route internal model passes (compaction, repair, briefings) to a utility model."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger("ModelRouting")
+
+# Leave room for the pass's own completion inside the utility context window.
+UTILITY_CONTEXT_HEADROOM = 0.9
+
+
+class RoutedModelSettings:
+    """
+    Read-only view of Settings with the active model swapped out.
+
+    `run_thinking_loop` and the providers only read the model name, context
+    window and parameters; everything else falls through to the real settings.
+    """
+
+    def __init__(self, base: Any, model_name: str, model_config: Dict[str, Any]):
+        self._base = base
+        self._model_name = model_name
+        self._model_config = model_config
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._base, name)
+
+    @property
+    def active_model_name(self) -> str:
+        return self._model_name
+
+    @property
+    def model_family(self) -> str:
+        return self._model_config.get("family", "llama")
+
+    @property
+    def context_window_limit(self) -> int:
+        return self._model_config.get("context_window", 8000)
+
+    @property
+    def model_parameters(self) -> Dict[str, Any]:
+        params = dict(self._model_config.get("parameters", {}) or {})
+        if getattr(self._base, "llm_provider", "") == "ollama":
+            params["num_ctx"] = self.context_window_limit
+        return params
+
+
+class InternalPassRouter:
+    """
+    Pick the model for an internal pass kind.
+
+    The utility model is UTILITY_MODEL_ALIAS, or `utility_model` in the
+    provider's models.json, resolved against the same model map as the active
+    model. Passes fall back to the active model when no utility model is
+    configured, the kind is not routed, or the history would not fit the
+    utility model's context window.
+    """
+
+    def __init__(self, settings: Any):
+        self._settings = settings
+
+    def _routes(self) -> set[str]:
+        raw = str(getattr(self._settings, "utility_model_routes", "") or "")
+        return {item.strip() for item in raw.split(",") if item.strip()}
+
+    def utility_model(self) -> Optional[Tuple[str, Dict[str, Any]]]:
+        models_config = getattr(self._settings, "models_config", None) or {}
+        models = models_config.get("models") or {}
+        alias = str(
+            getattr(self._settings, "utility_model_alias", "")
+            or models_config.get("utility_model")
+            or ""
+        ).strip()
+        if not alias or not isinstance(models, dict):
+            return None
+        if alias in models:
+            return alias, models[alias]
+        for name, config in models.items():
+            if alias in name:
+                return name, config
+        logger.warning("Utility model '%s' not found in the model map", alias)
+        return None
+
+    def route(
+        self, kind: str, *, estimated_tokens: int = 0
+    ) -> Tuple[Any, bool]:
+        """Return (settings for the pass, whether it was routed to the utility model)."""
+        if kind not in self._routes():
+            return self._settings, False
+        utility = self.utility_model()
+        if utility is None:
+            return self._settings, False
+        model_name, model_config = utility
+        if model_name == getattr(self._settings, "active_model_name", None):
+            return self._settings, False
+
+        routed = RoutedModelSettings(self._settings, model_name, model_config)
+        limit = int(routed.context_window_limit or 0)
+        if limit > 0 and estimated_tokens > limit * UTILITY_CONTEXT_HEADROOM:
+            logger.info(
+                "Internal pass '%s' (~%s tokens) exceeds utility model %s context %s; "
+                "using the active model",
+                kind,
+                estimated_tokens,
+                model_name,
+                limit,
+            )
+            return self._settings, False
+        return routed, True
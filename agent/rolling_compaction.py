@@ -0,0 +1,211 @@
+"""Background compaction of aging turn chunks into session memory."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional
+
+from protocol_monk.agent.context import logic as context_logic
+from protocol_monk.agent.structs import Message, SessionMemoryState
+
+logger = logging.getLogger("RollingCompaction")
+
+# The newest chunks are the model's working set; never summarize them away.
+PROTECTED_RECENT_CHUNKS = 2
+# Keep merged memory lists bounded; the newest items win.
+MEMORY_LIST_LIMIT = 16
+
+Summarizer = Callable[
+    [List[Message], Optional[SessionMemoryState]],
+    Awaitable[Optional[SessionMemoryState]],
+]
+
+
+@dataclass
+class CompactionResult:
+    """Session memory summarizing a set of history messages, ready to swap in."""
+
+    memory: SessionMemoryState
+    message_ids: FrozenSet[str]
+    chunk_count: int
+    elapsed_ms: float
+
+
+def select_aging_chunks(
+    history: List[Message],
+    *,
+    remove_fraction: float,
+) -> List[List[Message]]:
+    """
+    Pick the oldest complete turn chunks making up `remove_fraction` of the
+    conversation, i.e. the chunks hard pruning would drop first.
+    """
+    conversation = [message for message in history if message.role != "system"]
+    chunks = context_logic._build_turn_chunks(conversation)
+    candidates = chunks[:-PROTECTED_RECENT_CHUNKS] if PROTECTED_RECENT_CHUNKS else chunks
+    total = sum(context_logic._message_tokens(message) for message in conversation)
+    wanted = total * max(0.0, min(1.0, remove_fraction))
+
+    selected: List[List[Message]] = []
+    selected_tokens = 0
+    for chunk in candidates:
+        if selected_tokens >= wanted:
+            break
+        ids = [message.metadata.get("id") for message in chunk]
+        if not all(ids):
+            # Messages without ids cannot be swapped out reliably.
+            break
+        selected.append(chunk)
+        selected_tokens += sum(context_logic._message_tokens(m) for m in chunk)
+    return selected
+
+
+def _merge_list(newer: List[str], older: List[str]) -> List[str]:
+    merged: List[str] = []
+    seen = set()
+    for item in [*newer, *older]:
+        key = str(item).strip()
+        if key and key.lower() not in seen:
+            seen.add(key.lower())
+            merged.append(key)
+    return merged[:MEMORY_LIST_LIMIT]
+
+
+def merge_session_memory(
+    current: Optional[SessionMemoryState],
+    update: SessionMemoryState,
+) -> SessionMemoryState:
+    """
+    Fold a compaction result into the live memory.
+
+    The summarizer already sees the memory it started from, but the live
+    memory may have moved on while it ran (e.g. another compaction), so
+    list items are unioned and non-empty scalar fields from `update` win.
+    """
+    if current is None or current.is_effectively_empty():
+        return update
+    return SessionMemoryState(
+        session_goal=str(update.session_goal).strip() or current.session_goal,
+        active_work=_merge_list(update.active_work, current.active_work),
+        decisions=_merge_list(update.decisions, current.decisions),
+        constraints=_merge_list(update.constraints, current.constraints),
+        open_loops=_merge_list(update.open_loops, current.open_loops),
+        important_paths=_merge_list(update.important_paths, current.important_paths),
+        carry_forward_summary=(
+            str(update.carry_forward_summary).strip()
+            or current.carry_forward_summary
+        ),
+        updated_at=datetime.now(timezone.utc).isoformat(),
+    )
+
+
+class RollingCompactor:
+    """
+    Summarize chunks that are about to age out of the context window in the
+    background, so the next pass can drop them without losing their content.
+
+    The summarization call runs in its own task; the agent only touches this
+    object between passes (`maybe_start`, `take_ready`), so a swap never
+    happens in the middle of a request. `invalidate` discards in-flight and
+    ready work after the history was reset or replaced wholesale.
+    """
+
+    def __init__(
+        self,
+        summarize: Summarizer,
+        *,
+        trigger_fraction: float,
+        target_fraction: float,
+    ):
+        self._summarize = summarize
+        self._trigger_fraction = trigger_fraction
+        self._target_fraction = target_fraction
+        self._task: Optional[asyncio.Task] = None
+        self._ready: Optional[CompactionResult] = None
+        self._generation = 0
+
+    @property
+    def busy(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def should_compact(self, estimate: Dict[str, Any]) -> bool:
+        limit = int(estimate.get("context_limit") or 0)
+        if limit <= 0:
+            return False
+        used = int(estimate.get("estimated_next_request_tokens") or 0) + int(
+            estimate.get("reserved_completion_tokens") or 0
+        )
+        return used >= limit * self._trigger_fraction
+
+    def maybe_start(
+        self,
+        history: List[Message],
+        estimate: Dict[str, Any],
+        memory: Optional[SessionMemoryState],
+    ) -> bool:
+        """Start a background compaction if the request estimate calls for one."""
+        if self.busy or self._ready is not None or not self.should_compact(estimate):
+            return False
+        limit = int(estimate.get("context_limit") or 0)
+        used = int(estimate.get("estimated_next_request_tokens") or 0) + int(
+            estimate.get("reserved_completion_tokens") or 0
+        )
+        remove_fraction = 1.0 - (limit * self._target_fraction) / max(1, used)
+        chunks = select_aging_chunks(history, remove_fraction=remove_fraction)
+        if not chunks:
+            return False
+
+        messages = [message for chunk in chunks for message in chunk]
+        self._task = asyncio.create_task(
+            self._run(
+                messages,
+                memory,
+                generation=self._generation,
+                chunk_count=len(chunks),
+            ),
+            name="rolling-compaction",
+        )
+        return True
+
+    async def _run(
+        self,
+        messages: List[Message],
+        memory: Optional[SessionMemoryState],
+        *,
+        generation: int,
+        chunk_count: int,
+    ) -> None:
+        started = time.perf_counter()
+        try:
+            summarized = await self._summarize(messages, memory)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("Rolling compaction failed: %s", exc)
+            summarized = None
+
+        if summarized is None or generation != self._generation:
+            return
+        self._ready = CompactionResult(
+            memory=summarized,
+            message_ids=frozenset(m.metadata["id"] for m in messages),
+            chunk_count=chunk_count,
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 3),
+        )
+
+    def take_ready(self) -> Optional[CompactionResult]:
+        """Hand over a finished compaction, if any, exactly once."""
+        result, self._ready = self._ready, None
+        return result
+
+    def invalidate(self) -> None:
+        """Drop in-flight and ready work; the history it covered is gone."""
+        self._generation += 1
+        self._ready = None
+        if self.busy:
+            self._task.cancel()
+        self._task = None
@@ -0,0 +1,132 @@
+"""Start read-only tool calls while the model is still streaming."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from protocol_monk.agent.core.execution import ToolExecutor
+from protocol_monk.agent.structs import ToolRequest
+from protocol_monk.agent.tool_call_repair import repair_tool_call
+from protocol_monk.tools.registry import ToolRegistry
+
+logger = logging.getLogger("SpeculativeDispatch")
+
+
+class SpeculativeToolDispatcher:
+    """
+    Execute completed tool calls of one model pass before the pass ends.
+
+    A call is dispatched when its tool is read-only, it would run without a
+    confirmation prompt, and its arguments are schema-valid as emitted. The
+    first call to a tool that is not read-only (or unknown) stops dispatch
+    for the rest of the pass, since it may change what a later read would see.
+
+    `take` hands a result over only for the exact call (id, name, parameters)
+    that was dispatched, so a call rewritten by local repair runs normally.
+    `discard` cancels whatever was never taken (cancelled pass, rejected or
+    malformed batch).
+    """
+
+    def __init__(
+        self,
+        registry: ToolRegistry,
+        executor: ToolExecutor,
+        *,
+        auto_confirm: bool,
+    ):
+        self._registry = registry
+        self._executor = executor
+        self._auto_confirm = auto_confirm
+        # call_id -> (name, parameters snapshot, task, start time)
+        self._inflight: Dict[
+            str, Tuple[str, Dict[str, Any], asyncio.Task, float]
+        ] = {}
+        self._stopped = False
+        self.stats: Dict[str, Any] = {
+            "dispatched": 0,
+            "joined": 0,
+            "discarded": 0,
+            "head_start_ms": 0.0,
+        }
+
+    def _eligible(self, request: ToolRequest, tool: Any) -> bool:
+        if tool.requires_confirmation and not self._auto_confirm:
+            return False
+        if not request.call_id or request.call_id in self._inflight:
+            return False
+        if not isinstance(request.parameters, dict):
+            return False
+        # Valid as emitted: local repair would leave it untouched.
+        schemas = {tool.name: tool.parameter_schema}
+        return not repair_tool_call(request, schemas).attempted
+
+    def offer(self, request: ToolRequest) -> bool:
+        """Dispatch `request` if it qualifies. Returns True when it was started."""
+        if self._stopped:
+            return False
+        name = str(request.name or "").strip()
+        tool = self._registry.get_tool(name) if name else None
+        if tool is None or not getattr(tool, "is_read_only", False):
+            self._stopped = True
+            return False
+        if not self._eligible(request, tool):
+            return False
+
+        snapshot = ToolRequest(
+            name=request.name,
+            parameters=copy.deepcopy(request.parameters),
+            call_id=request.call_id,
+            requires_confirmation=request.requires_confirmation,
+            metadata=dict(request.metadata or {}),
+        )
+        task = asyncio.create_task(
+            self._executor.execute(snapshot, self._registry),
+            name=f"speculative-tool-{request.call_id}",
+        )
+        self._inflight[request.call_id] = (
+            snapshot.name,
+            copy.deepcopy(snapshot.parameters),
+            task,
+            time.perf_counter(),
+        )
+        self.stats["dispatched"] += 1
+        logger.debug("Speculatively dispatched %s (%s)", request.name, request.call_id)
+        return True
+
+    def take(self, request: ToolRequest) -> Optional[asyncio.Task]:
+        """
+        Claim the in-flight execution for `request`, if it still matches.
+
+        The returned task resolves to the ToolResult the normal path would
+        have produced.
+        """
+        entry = self._inflight.pop(str(request.call_id or ""), None)
+        if entry is None:
+            return None
+        name, parameters, task, started = entry
+        if name != request.name or parameters != request.parameters:
+            task.cancel()
+            self.stats["discarded"] += 1
+            return None
+        self.stats["joined"] += 1
+        self.stats["head_start_ms"] = round(
+            self.stats["head_start_ms"] + (time.perf_counter() - started) * 1000, 3
+        )
+        return task
+
+    def discard(self) -> int:
+        """Cancel every execution that was never taken."""
+        self._stopped = True
+        count = 0
+        for _, _, task, _ in self._inflight.values():
+            if not task.done():
+                task.cancel()
+            count += 1
+        self._inflight.clear()
+        self.stats["discarded"] += count
+        return count
+
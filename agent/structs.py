@@ -106,6 +106,8 @@ class ToolResult:
     output_kind: Optional[str] = None
     error_details: Optional[Dict[str, Any]] = None
     request_parameters: Optional[Dict[str, Any]] = None
+    # Bookkeeping the tool hands to the runtime; never sent to the model.
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 
 # --- 4. Context & Config ---
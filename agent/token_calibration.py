@@ -0,0 +1,306 @@
+"""Online calibration of request token estimates from provider-reported usage."""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+logger = logging.getLogger("TokenCalibration")
+
+CALIBRATION_FILE_NAME = "token_calibration.json"
+CALIBRATION_SCHEMA_VERSION = 1
+CONTENT_TYPES = ("natural", "code", "json", "markdown", "tools")
+
+# Step size of the multiplicative ratio update; small enough that one odd
+# request cannot swing the model, large enough to converge in a few passes.
+LEARNING_RATE = 0.3
+MIN_RATIO = 0.25
+MAX_RATIO = 4.0
+# Providers that reuse a KV cache may report only the uncached prompt tokens.
+# Observations this far below our own estimate are not a usable signal.
+MIN_OBSERVED_FRACTION = 0.5
+# Once more than this share of the anchored request has been dropped, the
+# anchor says little about the new request; fall back to ratios alone.
+MAX_ANCHOR_DRIFT = 0.5
+PENDING_REQUEST_LIMIT = 8
+
+
+class MessageEstimate:
+    """Raw estimate for one request message, with its identity and content type."""
+
+    __slots__ = ("fingerprint", "content_type", "tokens")
+
+    def __init__(self, fingerprint: int, content_type: str, tokens: int):
+        self.fingerprint = fingerprint
+        self.content_type = content_type
+        self.tokens = tokens
+
+
+class TokenCalibrator:
+    """
+    Correct raw token estimates using the prompt counts providers report.
+
+    Two mechanisms work together:
+
+    - Anchoring: after a pass, the provider's `prompt_tokens` for exactly the
+      messages we sent is remembered. The next request is estimated as that
+      count plus the calibrated estimate of messages added since, minus that
+      of messages dropped since (pruning, refreshed system injections), so
+      estimator error only applies to the difference.
+    - Ratios: each content type carries a multiplicative correction fitted
+      online from observed/estimated prompt counts, weighted by how much of
+      the request each type made up. Ratios persist per model across runs.
+
+    Methods are synchronous and cheap apart from `save`, which does file I/O.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self._path = Path(path) if path is not None else None
+        self._lock = threading.Lock()
+        self._models: Dict[str, Dict[str, Any]] = {}
+        self._pending: "OrderedDict[str, Tuple[str, List[MessageEstimate], int, int]]" = (
+            OrderedDict()
+        )
+        # model -> (messages, tool_fingerprint, tool_tokens, prompt_tokens)
+        self._anchors: Dict[str, Tuple[List[MessageEstimate], int, int, int]] = {}
+        self._dirty = False
+        self._request_counter = 0
+
+    @property
+    def path(self) -> Optional[Path]:
+        return self._path
+
+    def load(self) -> None:
+        if self._path is None:
+            return
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Ignoring unreadable token calibration %s: %s", self._path, exc)
+            return
+        if not isinstance(payload, dict):
+            return
+        if payload.get("schema_version") != CALIBRATION_SCHEMA_VERSION:
+            return
+        models = payload.get("models")
+        if not isinstance(models, dict):
+            return
+        with self._lock:
+            for model_name, entry in models.items():
+                if not isinstance(entry, dict):
+                    continue
+                ratios = entry.get("ratios")
+                if not isinstance(ratios, dict):
+                    continue
+                self._models[str(model_name)] = {
+                    "ratios": {
+                        content_type: _clamp_ratio(ratios.get(content_type, 1.0))
+                        for content_type in CONTENT_TYPES
+                    },
+                    "samples": int(entry.get("samples") or 0),
+                    "updated_at": entry.get("updated_at"),
+                }
+
+    def save(self) -> None:
+        if self._path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {
+                "schema_version": CALIBRATION_SCHEMA_VERSION,
+                "models": {name: dict(entry) for name, entry in self._models.items()},
+            }
+            self._dirty = False
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                dir=self._path.parent,
+                delete=False,
+                suffix=".tmp",
+            ) as handle:
+                json.dump(payload, handle, ensure_ascii=False, indent=2)
+                tmp_path = handle.name
+            os.replace(tmp_path, self._path)
+        except OSError as exc:
+            logger.warning("Failed to write token calibration %s: %s", self._path, exc)
+
+    def ratios(self, model_name: str) -> Dict[str, float]:
+        with self._lock:
+            entry = self._models.get(model_name)
+            if entry is None:
+                return {content_type: 1.0 for content_type in CONTENT_TYPES}
+            return dict(entry["ratios"])
+
+    def estimate(
+        self,
+        *,
+        model_name: str,
+        messages: Sequence[MessageEstimate],
+        tool_tokens: int,
+        tool_fingerprint: int,
+    ) -> Dict[str, Any]:
+        """
+        Calibrate one request estimate.
+
+        Returns the calibrated prompt token count plus a `calibration_key`
+        that `observe` uses to match the provider's report to this request.
+        """
+        ratios = self.ratios(model_name)
+
+        def _calibrated(message: MessageEstimate) -> float:
+            return message.tokens * ratios.get(message.content_type, 1.0)
+
+        calibrated_total = int(
+            math.ceil(sum(map(_calibrated, messages)) + tool_tokens * ratios["tools"])
+        )
+
+        anchored_total: Optional[int] = None
+        with self._lock:
+            anchor = self._anchors.get(model_name)
+            if anchor is not None:
+                anchor_messages, anchor_tools, anchor_tool_tokens, anchor_tokens = anchor
+                current = Counter(message.fingerprint for message in messages)
+                previous = Counter(message.fingerprint for message in anchor_messages)
+                added = current - previous
+                removed = previous - current
+                added_tokens = _take(messages, added, _calibrated)
+                removed_tokens = _take(anchor_messages, removed, _calibrated)
+                anchor_raw = sum(message.tokens for message in anchor_messages)
+                removed_raw = _take(anchor_messages, removed, lambda m: m.tokens)
+                if anchor_raw > 0 and removed_raw <= anchor_raw * MAX_ANCHOR_DRIFT:
+                    tool_delta = 0.0
+                    if anchor_tools != tool_fingerprint:
+                        tool_delta = (tool_tokens - anchor_tool_tokens) * ratios["tools"]
+                    anchored_total = max(
+                        1,
+                        int(
+                            math.ceil(
+                                anchor_tokens + added_tokens - removed_tokens + tool_delta
+                            )
+                        ),
+                    )
+
+            self._request_counter += 1
+            key = f"{model_name}#{self._request_counter}"
+            self._pending[key] = (model_name, list(messages), tool_tokens, tool_fingerprint)
+            while len(self._pending) > PENDING_REQUEST_LIMIT:
+                self._pending.popitem(last=False)
+
+        return {
+            "calibration_key": key,
+            "calibrated_tokens": calibrated_total,
+            "anchored_tokens": anchored_total,
+            "estimated_tokens": (
+                anchored_total if anchored_total is not None else calibrated_total
+            ),
+            "mode": "anchored" if anchored_total is not None else "ratio",
+        }
+
+    def observe(self, calibration_key: str, prompt_tokens: Optional[int]) -> bool:
+        """Fold a provider-reported prompt count into the anchor and ratios."""
+        if not isinstance(prompt_tokens, int) or prompt_tokens <= 0:
+            return False
+        with self._lock:
+            pending = self._pending.pop(calibration_key, None)
+            if pending is None:
+                return False
+            model_name, messages, tool_tokens, tool_fingerprint = pending
+
+            raw_by_type: Dict[str, float] = {"tools": float(tool_tokens)}
+            for message in messages:
+                raw_by_type[message.content_type] = (
+                    raw_by_type.get(message.content_type, 0.0) + message.tokens
+                )
+            raw_total = sum(raw_by_type.values())
+            if raw_total <= 0:
+                return False
+
+            entry = self._models.setdefault(
+                model_name,
+                {
+                    "ratios": {content_type: 1.0 for content_type in CONTENT_TYPES},
+                    "samples": 0,
+                    "updated_at": None,
+                },
+            )
+            ratios = entry["ratios"]
+            predicted = sum(
+                tokens * ratios.get(content_type, 1.0)
+                for content_type, tokens in raw_by_type.items()
+            )
+            if predicted <= 0 or prompt_tokens < predicted * MIN_OBSERVED_FRACTION:
+                return False
+
+            self._anchors[model_name] = (
+                messages,
+                tool_fingerprint,
+                tool_tokens,
+                prompt_tokens,
+            )
+
+            # Multiplicative update: each type absorbs the correction in
+            # proportion to its share of the request.
+            log_error = math.log(prompt_tokens / predicted)
+            for content_type, tokens in raw_by_type.items():
+                if tokens <= 0 or content_type not in ratios:
+                    continue
+                share = tokens / raw_total
+                ratios[content_type] = _clamp_ratio(
+                    ratios[content_type] * math.exp(LEARNING_RATE * share * log_error)
+                )
+            entry["samples"] = int(entry.get("samples") or 0) + 1
+            entry["updated_at"] = time.time()
+            self._dirty = True
+        return True
+
+
+def _take(
+    messages: Sequence[MessageEstimate],
+    wanted: Counter,
+    weight: Any,
+) -> float:
+    """Sum `weight` over `messages` whose fingerprints appear in the multiset `wanted`."""
+    if not wanted:
+        return 0.0
+    remaining = Counter(wanted)
+    total = 0.0
+    for message in messages:
+        if remaining.get(message.fingerprint, 0) > 0:
+            remaining[message.fingerprint] -= 1
+            total += weight(message)
+    return total
+
+
+def _clamp_ratio(value: Any) -> float:
+    try:
+        ratio = float(value)
+    except (TypeError, ValueError):
+        return 1.0
+    if not math.isfinite(ratio):
+        return 1.0
+    return round(min(MAX_RATIO, max(MIN_RATIO, ratio)), 6)
+
+
+def calibration_path_for(state_home: Path | str, provider: str) -> Path:
+    """Calibration is per provider under the user state home, never the install tree."""
+    return Path(state_home).expanduser() / "providers" / provider / CALIBRATION_FILE_NAME
+
+
+def message_content_text(message: Mapping[str, Any]) -> str:
+    content = message.get("content")
+    if isinstance(content, str):
+        return content
+    return json.dumps(content, ensure_ascii=False) if content is not None else ""
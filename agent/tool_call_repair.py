@@ -0,0 +1,357 @@
+"""Deterministic, schema-driven repair of malformed tool calls."""
+
+from __future__ import annotations
+
+import ast
+import json
+import re
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from protocol_monk.agent.structs import ToolRequest
+
+# Providers wrap unparseable argument text as {"value": "<raw>"}.
+WRAPPED_ARGUMENT_KEY = "value"
+# Never try to literal_eval or re-close arbitrarily large argument blobs.
+MAX_REPAIR_TEXT_CHARS = 200_000
+# Set when a truncated member was cut away; its value is unknowable.
+TRUNCATED_TAIL_DROPPED = "dropped_truncated_member"
+_INTEGER_PATTERN = re.compile(r"[+-]?\d+")
+_TRUTHY = {"true", "yes", "1", "on"}
+_FALSY = {"false", "no", "0", "off"}
+
+
+@dataclass
+class ToolCallRepair:
+    """Outcome of a local repair attempt for one tool call."""
+
+    request: ToolRequest
+    attempted: bool = False
+    repaired: bool = False
+    actions: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def _normalize_name(name: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", str(name or "").lower())
+
+
+def _strip_code_fence(text: str) -> str:
+    lines = text.strip().splitlines()
+    if lines and lines[0].startswith("```"):
+        lines = lines[1:]
+    if lines and lines[-1].strip() == "```":
+        lines = lines[:-1]
+    return "\n".join(lines).strip()
+
+
+def _close_truncated_json(text: str) -> Tuple[Optional[Any], bool]:
+    """
+    Parse JSON that was cut off mid-stream.
+
+    Only complete members survive: the text is cut back to the last point
+    where a value had certainly ended (a closing quote or bracket, or a
+    separator) and the open containers are closed. A half-written string or
+    number is dropped rather than guessed. Returns (value, dropped_tail).
+    """
+    stack: List[str] = []
+    in_string = False
+    escaped = False
+    # (prefix length, open containers at that point)
+    cut_points: List[Tuple[int, str]] = []
+    for index, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+                cut_points.append((index + 1, "".join(stack)))
+            continue
+        if char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append(char)
+            cut_points.append((index + 1, "".join(stack)))
+        elif char in "}]":
+            if not stack:
+                return None, False
+            stack.pop()
+            cut_points.append((index + 1, "".join(stack)))
+        elif char == ",":
+            cut_points.append((index, "".join(stack)))
+
+    closers = {"{": "}", "[": "]"}
+    for length, open_stack in reversed(cut_points[-64:]):
+        if not open_stack:
+            continue
+        prefix = text[:length].rstrip().rstrip(",")
+        candidate = prefix + "".join(closers[c] for c in reversed(open_stack))
+        try:
+            return json.loads(candidate), bool(text[length:].strip(" \t\r\n,"))
+        except json.JSONDecodeError:
+            continue
+    return None, False
+
+
+def parse_tolerant_json(text: str) -> Tuple[Optional[Any], List[str]]:
+    """
+    Parse tool-call argument text the way a lenient reader would.
+
+    Returns the parsed value (or None) and the repair actions applied.
+    """
+    raw = str(text or "").strip()
+    if not raw or len(raw) > MAX_REPAIR_TEXT_CHARS:
+        return None, []
+    actions: List[str] = []
+    if raw.startswith("```"):
+        raw = _strip_code_fence(raw)
+        actions.append("stripped_code_fence")
+
+    try:
+        return json.loads(raw), actions
+    except json.JSONDecodeError:
+        pass
+
+    without_trailing_commas = re.sub(r",\s*([}\]])", r"\1", raw)
+    if without_trailing_commas != raw:
+        try:
+            return json.loads(without_trailing_commas), [
+                *actions,
+                "removed_trailing_commas",
+            ]
+        except json.JSONDecodeError:
+            pass
+
+    try:
+        # Single quotes, True/False/None: a Python literal, not JSON.
+        literal = ast.literal_eval(raw)
+    except Exception:
+        # ValueError/SyntaxError, but also TypeError for e.g. `{[1]: 2}`.
+        literal = None
+    if isinstance(literal, (dict, list)):
+        return literal, [*actions, "parsed_python_literal"]
+
+    closed, dropped_tail = _close_truncated_json(without_trailing_commas)
+    if closed is not None:
+        actions.append("closed_truncated_json")
+        if dropped_tail:
+            actions.append(TRUNCATED_TAIL_DROPPED)
+        return closed, actions
+    return None, actions
+
+
+def _type_matches(value: Any, expected: str) -> bool:
+    if expected == "integer":
+        return isinstance(value, int) and not isinstance(value, bool)
+    if expected == "number":
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if expected == "boolean":
+        return isinstance(value, bool)
+    if expected == "string":
+        return isinstance(value, str)
+    if expected == "array":
+        return isinstance(value, list)
+    if expected == "object":
+        return isinstance(value, dict)
+    return True
+
+
+def _coerce_value(value: Any, spec: Mapping[str, Any]) -> Tuple[Any, bool]:
+    """Coerce one argument to its schema type. Returns (value, ok)."""
+    expected = spec.get("type")
+    enum = spec.get("enum")
+    if isinstance(enum, list) and isinstance(value, str) and value not in enum:
+        matches = [item for item in enum if str(item).lower() == value.strip().lower()]
+        if len(matches) == 1:
+            return matches[0], True
+    if not isinstance(expected, str) or _type_matches(value, expected):
+        return value, True
+
+    if expected == "integer":
+        if isinstance(value, float) and value.is_integer():
+            return int(value), True
+        if isinstance(value, str) and _INTEGER_PATTERN.fullmatch(value.strip()):
+            return int(value.strip()), True
+    elif expected == "number" and isinstance(value, str):
+        try:
+            return float(value.strip()), True
+        except ValueError:
+            pass
+    elif expected == "boolean":
+        text = str(value).strip().lower()
+        if text in _TRUTHY:
+            return True, True
+        if text in _FALSY:
+            return False, True
+    elif expected == "string":
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value), True
+    elif expected in {"array", "object"} and isinstance(value, str):
+        parsed, parse_actions = parse_tolerant_json(value)
+        if TRUNCATED_TAIL_DROPPED not in parse_actions and _type_matches(
+            parsed, expected
+        ):
+            return parsed, True
+        if expected == "array" and value.strip():
+            return [value], True
+    return value, False
+
+
+def coerce_arguments(
+    arguments: Mapping[str, Any],
+    schema: Mapping[str, Any],
+) -> Tuple[Dict[str, Any], List[str], List[str]]:
+    """
+    Coerce arguments against a JSON object schema.
+
+    Returns (arguments, actions, problems); an empty `problems` list means
+    the arguments satisfy the schema's required keys and property types.
+    """
+    properties = schema.get("properties") or {}
+    by_normalized = {_normalize_name(name): name for name in properties}
+    result: Dict[str, Any] = {}
+    actions: List[str] = []
+    problems: List[str] = []
+
+    for key, value in arguments.items():
+        target = key
+        if key not in properties:
+            alias = by_normalized.get(_normalize_name(key))
+            if alias is not None and alias not in arguments:
+                target = alias
+                actions.append(f"renamed_argument:{key}->{alias}")
+        spec = properties.get(target)
+        if isinstance(spec, Mapping):
+            coerced, ok = _coerce_value(value, spec)
+            if not ok:
+                problems.append(f"{target}: expected {spec.get('type')}")
+            elif coerced is not value:
+                actions.append(f"coerced_argument:{target}")
+            value = coerced
+        result[target] = value
+
+    for name in schema.get("required") or []:
+        if name not in result:
+            problems.append(f"{name}: missing")
+    return result, actions, problems
+
+
+def infer_tool_name(
+    arguments: Mapping[str, Any],
+    schemas: Mapping[str, Mapping[str, Any]],
+) -> Optional[str]:
+    """
+    Name the tool whose schema the arguments fit, if exactly one does.
+
+    A fit means every required property is present and every argument is a
+    known property. Ambiguous fits (e.g. create_file vs append_to_file) are
+    left for the model to resolve.
+    """
+    if not arguments:
+        return None
+    keys = {_normalize_name(key) for key in arguments}
+    fits = []
+    for name, schema in schemas.items():
+        properties = {_normalize_name(p) for p in (schema.get("properties") or {})}
+        required = {_normalize_name(p) for p in (schema.get("required") or [])}
+        if required <= keys and keys <= properties:
+            fits.append(name)
+    return fits[0] if len(fits) == 1 else None
+
+
+def _resolve_known_name(name: str, schemas: Mapping[str, Any]) -> Optional[str]:
+    if name in schemas:
+        return name
+    # "functions.read_file", "ReadFile", "read-file"
+    normalized = _normalize_name(name.rsplit(".", 1)[-1])
+    matches = [known for known in schemas if _normalize_name(known) == normalized]
+    return matches[0] if len(matches) == 1 else None
+
+
+def repair_tool_call(
+    request: ToolRequest,
+    schemas: Mapping[str, Mapping[str, Any]],
+) -> ToolCallRepair:
+    """
+    Repair one tool call against the registered tool schemas.
+
+    Calls that already name a known tool with schema-valid arguments are
+    returned untouched (`attempted` is False).
+    """
+    name = str(request.name or "").strip()
+    arguments: Any = request.parameters if isinstance(request.parameters, dict) else {}
+    actions: List[str] = []
+
+    resolved = _resolve_known_name(name, schemas) if name else None
+    schema = schemas.get(resolved or "") or {}
+
+    wrapped = (
+        set(arguments) == {WRAPPED_ARGUMENT_KEY}
+        and isinstance(arguments[WRAPPED_ARGUMENT_KEY], str)
+        and WRAPPED_ARGUMENT_KEY not in (schema.get("properties") or {})
+    )
+    needs_repair = resolved is None or resolved != name or wrapped
+    if not needs_repair:
+        _, coerce_actions, problems = coerce_arguments(arguments, schema)
+        needs_repair = bool(problems or coerce_actions)
+    if not needs_repair:
+        return ToolCallRepair(request=request)
+
+    if wrapped:
+        parsed, parse_actions = parse_tolerant_json(arguments[WRAPPED_ARGUMENT_KEY])
+        if not isinstance(parsed, dict):
+            return ToolCallRepair(
+                request=request,
+                attempted=True,
+                actions=parse_actions,
+                error="unparseable_arguments",
+            )
+        if TRUNCATED_TAIL_DROPPED in parse_actions:
+            # Running a call with a silently missing argument (e.g. the
+            # `content` of create_file) is worse than asking the model again.
+            return ToolCallRepair(
+                request=request,
+                attempted=True,
+                actions=parse_actions,
+                error="truncated_arguments",
+            )
+        arguments = parsed
+        actions.extend(["unwrapped_argument_text", *parse_actions])
+
+    if resolved is None:
+        resolved = infer_tool_name(arguments, schemas) if not name else None
+        if resolved is None:
+            return ToolCallRepair(
+                request=request,
+                attempted=True,
+                actions=actions,
+                error="unknown_tool_name" if name else "missing_tool_name",
+            )
+        actions.append(f"inferred_tool_name:{resolved}")
+    elif resolved != name:
+        actions.append(f"normalized_tool_name:{name}->{resolved}")
+
+    coerced, coerce_actions, problems = coerce_arguments(arguments, schemas[resolved])
+    actions.extend(coerce_actions)
+    if problems:
+        return ToolCallRepair(
+            request=request,
+            attempted=True,
+            actions=actions,
+            error="; ".join(problems),
+        )
+
+    metadata = dict(request.metadata or {})
+    metadata["local_repair"] = {
+        "actions": actions,
+        "original_name": request.name,
+        "original_parameters": request.parameters,
+    }
+    return ToolCallRepair(
+        request=replace(request, name=resolved, parameters=coerced, metadata=metadata),
+        attempted=True,
+        repaired=True,
+        actions=actions,
+    )
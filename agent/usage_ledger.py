@@ -3,9 +3,17 @@ from __future__ import annotations
 import json
 import logging
 from collections import deque
-from typing import Any, Deque, Dict, List, Mapping, Optional
-
-from protocol_monk.utils.token_estimation import BetterTokenizerManager
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional
+
+from protocol_monk.agent.token_calibration import (
+    MessageEstimate,
+    TokenCalibrator,
+    message_content_text,
+)
+from protocol_monk.utils.token_estimation import (
+    BetterTokenizerManager,
+    SmartTokenEstimator,
+)
 
 logger = logging.getLogger("UsageLedger")
 
@@ -162,14 +170,38 @@ def normalize_provider_usage(
 
 
 class UsageLedger:
-    def __init__(self, *, model_name: str):
+    def __init__(
+        self,
+        *,
+        model_name: str,
+        calibrator: TokenCalibrator | None = None,
+    ):
         self._model_name = str(model_name or "")
         self._tokenizers = BetterTokenizerManager()
+        self._calibrator = calibrator
+        self._content_classifier = SmartTokenEstimator()
         self._recent_records: Deque[Dict[str, Any]] = deque(
             maxlen=RECENT_USAGE_RECORD_LIMIT
         )
         self._last_estimate: Dict[str, Any] | None = None
         self._last_record: Dict[str, Any] | None = None
+        self._envelope_tokens_saved_total = 0
+        # "kind:model" -> running latency/token totals for internal passes
+        self._route_stats: Dict[str, Dict[str, Any]] = {}
+        self._tool_call_repair: Dict[str, Any] = {
+            "calls_needing_repair": 0,
+            "repaired_locally": 0,
+            "unrepaired_locally": 0,
+            "model_repair_passes": 0,
+            "actions": {},
+            "failures": {},
+        }
+        self._speculative_tools: Dict[str, Any] = {
+            "dispatched": 0,
+            "joined": 0,
+            "discarded": 0,
+            "head_start_ms": 0.0,
+        }
 
     async def estimate_request(
         self,
@@ -178,6 +210,11 @@ class UsageLedger:
         context_limit: int,
     ) -> Dict[str, Any]:
         self._model_name = str(request_payload.get("model", self._model_name) or self._model_name)
+        if self._calibrator is not None:
+            return await self._estimate_calibrated_request(
+                request_payload=request_payload,
+                context_limit=context_limit,
+            )
         message_tokens, message_mode = await self._count_json_tokens(
             request_payload.get("messages")
         )
@@ -210,6 +247,77 @@ class UsageLedger:
         self._last_estimate = estimate
         return estimate
 
+    async def _estimate_calibrated_request(
+        self,
+        *,
+        request_payload: Mapping[str, Any],
+        context_limit: int,
+    ) -> Dict[str, Any]:
+        """Estimate per message so the calibrator can anchor and weight by type."""
+        messages = normalize_jsonable(request_payload.get("messages") or [])
+        message_estimates: List[MessageEstimate] = []
+        modes = set()
+        for message in messages:
+            text = json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+            tokens, mode = await self._count_text_tokens(text)
+            modes.add(mode)
+            content_type = (
+                self._content_classifier.detect_content_type(
+                    message_content_text(message)
+                )
+                if isinstance(message, dict)
+                else "json"
+            )
+            message_estimates.append(MessageEstimate(hash(text), content_type, tokens))
+
+        tools = normalize_jsonable(request_payload.get("tools") or [])
+        tools_text = (
+            json.dumps(tools, ensure_ascii=False, separators=(",", ":")) if tools else ""
+        )
+        tool_tokens, tool_mode = await self._count_text_tokens(tools_text)
+        modes.add(tool_mode)
+        modes.discard("empty")
+
+        message_tokens = sum(message.tokens for message in message_estimates)
+        calibration = self._calibrator.estimate(
+            model_name=self._model_name,
+            messages=message_estimates,
+            tool_tokens=tool_tokens,
+            tool_fingerprint=hash(tools_text),
+        )
+        prompt_tokens = int(calibration["estimated_tokens"])
+        reserve = reserved_completion_tokens(
+            request_payload,
+            context_limit=context_limit,
+        )
+        estimate = {
+            "provider": str(request_payload.get("provider", "") or ""),
+            "model": self._model_name,
+            "message_count": len(messages),
+            "tool_count": len(tools),
+            "message_tokens": message_tokens,
+            "tool_tokens": tool_tokens,
+            "raw_estimated_tokens": message_tokens + tool_tokens,
+            "estimated_next_request_tokens": prompt_tokens,
+            "reserved_completion_tokens": reserve,
+            "context_limit": int(context_limit or 0),
+            "within_limit": (
+                True
+                if int(context_limit or 0) <= 0
+                else prompt_tokens + reserve <= int(context_limit)
+            ),
+            "estimator_mode": modes.pop() if len(modes) == 1 else "mixed",
+            "calibration_mode": calibration["mode"],
+            "calibration_key": calibration["calibration_key"],
+        }
+        self._last_estimate = estimate
+        return estimate
+
+    def save_calibration(self) -> None:
+        """Persist fitted ratios; blocking file I/O, run it off the event loop."""
+        if self._calibrator is not None:
+            self._calibrator.save()
+
     def record_usage(
         self,
         *,
@@ -246,10 +354,19 @@ class UsageLedger:
         estimated_prompt_tokens = None
         reserved_tokens = None
         context_limit = None
+        calibration_mode = None
+        envelope_tokens_saved = 0
         if isinstance(request_estimate, Mapping):
+            envelope_tokens_saved = int(request_estimate.get("envelope_tokens_saved") or 0)
             estimated_prompt_tokens = request_estimate.get("estimated_next_request_tokens")
             reserved_tokens = request_estimate.get("reserved_completion_tokens")
             context_limit = request_estimate.get("context_limit")
+            calibration_mode = request_estimate.get("calibration_mode")
+            calibration_key = request_estimate.get("calibration_key")
+            if self._calibrator is not None and calibration_key:
+                self._calibrator.observe(
+                    str(calibration_key), normalized.get("prompt_tokens")
+                )
 
         record = {
             "turn_id": turn_id,
@@ -262,6 +379,10 @@ class UsageLedger:
             "completion_tokens": completion_tokens,
             "total_tokens": total_tokens,
             "estimated_prompt_tokens": estimated_prompt_tokens,
+            "calibration_mode": calibration_mode,
+            "envelope_tokens_saved": envelope_tokens_saved,
+            "envelope_tokens_saved_total": self._envelope_tokens_saved_total
+            + envelope_tokens_saved,
             "reserved_completion_tokens": reserved_tokens,
             "context_limit": context_limit,
             "finish_reasons": self._extract_finish_reasons(raw),
@@ -279,10 +400,108 @@ class UsageLedger:
             ),
             "raw_provider_metrics": raw,
         }
+        self._envelope_tokens_saved_total += envelope_tokens_saved
         self._recent_records.append(record)
         self._last_record = record
         return record
 
+    def record_internal_pass(
+        self,
+        *,
+        kind: str,
+        model_name: str,
+        routed: bool,
+        elapsed_ms: float,
+        raw_metrics: Mapping[str, Any] | None,
+        failed: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Accumulate latency and token counts per internal pass route.
+
+        Kept apart from `record_usage`: internal passes may run on another
+        model, so they must not feed the active model's calibration.
+        """
+        normalized = normalize_provider_usage(normalize_jsonable(dict(raw_metrics or {})))
+        key = f"{kind}:{model_name}"
+        stats = self._route_stats.setdefault(
+            key,
+            {
+                "kind": kind,
+                "model": model_name,
+                "routed": bool(routed),
+                "passes": 0,
+                "failures": 0,
+                "total_elapsed_ms": 0.0,
+                "max_elapsed_ms": 0.0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+            },
+        )
+        stats["passes"] += 1
+        stats["failures"] += int(bool(failed))
+        stats["total_elapsed_ms"] = round(stats["total_elapsed_ms"] + elapsed_ms, 3)
+        stats["max_elapsed_ms"] = max(stats["max_elapsed_ms"], round(elapsed_ms, 3))
+        stats["mean_elapsed_ms"] = round(stats["total_elapsed_ms"] / stats["passes"], 3)
+        stats["prompt_tokens"] += int(normalized.get("prompt_tokens") or 0)
+        stats["completion_tokens"] += int(normalized.get("completion_tokens") or 0)
+        stats["last_elapsed_ms"] = round(elapsed_ms, 3)
+        return dict(stats)
+
+    def route_stats(self) -> List[Dict[str, Any]]:
+        return [dict(stats) for stats in self._route_stats.values()]
+
+    def record_tool_call_repairs(self, repairs: Iterable[Any]) -> Dict[str, Any]:
+        """Count local tool-call repair attempts (see agent.tool_call_repair)."""
+        stats = self._tool_call_repair
+        for repair in repairs:
+            stats["calls_needing_repair"] += 1
+            if repair.repaired:
+                stats["repaired_locally"] += 1
+            else:
+                stats["unrepaired_locally"] += 1
+                reason = str(repair.error or "unknown")
+                stats["failures"][reason] = stats["failures"].get(reason, 0) + 1
+            for action in repair.actions:
+                kind = str(action).split(":", 1)[0]
+                stats["actions"][kind] = stats["actions"].get(kind, 0) + 1
+        return self.tool_call_repair_stats()
+
+    def record_model_repair_pass(self) -> None:
+        self._tool_call_repair["model_repair_passes"] += 1
+
+    def tool_call_repair_stats(self) -> Dict[str, Any]:
+        stats = self._tool_call_repair
+        needing = stats["calls_needing_repair"]
+        return {
+            **stats,
+            "actions": dict(stats["actions"]),
+            "failures": dict(stats["failures"]),
+            "local_hit_rate": (
+                round(stats["repaired_locally"] / needing, 3) if needing else None
+            ),
+        }
+
+    def record_speculative_tools(self, stats: Mapping[str, Any]) -> Dict[str, Any]:
+        """Add one pass's speculative dispatch counts (see agent.speculative_dispatch)."""
+        totals = self._speculative_tools
+        for key in ("dispatched", "joined", "discarded"):
+            totals[key] += int(stats.get(key) or 0)
+        totals["head_start_ms"] = round(
+            totals["head_start_ms"] + float(stats.get("head_start_ms") or 0.0), 3
+        )
+        return self.speculative_tool_stats()
+
+    def speculative_tool_stats(self) -> Dict[str, Any]:
+        totals = self._speculative_tools
+        return {
+            **totals,
+            "mean_head_start_ms": (
+                round(totals["head_start_ms"] / totals["joined"], 3)
+                if totals["joined"]
+                else None
+            ),
+        }
+
     def build_snapshot(
         self,
         *,
@@ -323,6 +542,9 @@ class UsageLedger:
             "total_tokens": int(stored_history_tokens or 0),
             "latest_record": last_record or None,
             "recent_records": recent_records,
+            "internal_pass_routes": self.route_stats(),
+            "tool_call_repair": self.tool_call_repair_stats(),
+            "speculative_tools": self.speculative_tool_stats(),
         }
         snapshot["metrics_prompt_summary"] = self.build_model_summary(snapshot)
         return snapshot
@@ -345,6 +567,9 @@ class UsageLedger:
             return 0, "empty"
 
         text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        return await self._count_text_tokens(text)
+
+    async def _count_text_tokens(self, text: str) -> tuple[int, str]:
         if not text:
             return 0, "empty"
 
@@ -6,19 +6,24 @@ import os
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from pydantic import Field, PrivateAttr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from protocol_monk.exceptions.config import ConfigError
-from protocol_monk.utils.model_discovery import discover_models
 from protocol_monk.utils.openrouter_model_map import (
     load_or_initialize_openrouter_model_map,
 )
 
+if TYPE_CHECKING:
+    from protocol_monk.utils.startup_profile import StartupProfiler
+
 logger = logging.getLogger("Settings")
 
+# Internal model passes that can be routed to the utility model.
+UTILITY_MODEL_ROUTE_KINDS = ("compact", "rolling_compact", "tool_repair", "orthocal_briefing")
+
 
 @dataclass
 class ResolvedPaths:
@@ -76,9 +81,71 @@ class Settings(BaseSettings):
     document_vision_model: str = Field(
         default="", validation_alias="DOCUMENT_VISION_MODEL"
     )
+    document_pdf_index_enabled: bool = Field(
+        default=True, validation_alias="DOCUMENT_PDF_INDEX_ENABLED"
+    )
+    document_vision_concurrency: int = Field(
+        default=4, validation_alias="DOCUMENT_VISION_CONCURRENCY"
+    )
+    document_vision_max_edge: int = Field(
+        default=1568, validation_alias="DOCUMENT_VISION_MAX_EDGE"
+    )
+    document_vision_image_format: str = Field(
+        default="jpeg", validation_alias="DOCUMENT_VISION_IMAGE_FORMAT"
+    )
+    document_vision_image_quality: int = Field(
+        default=85, validation_alias="DOCUMENT_VISION_IMAGE_QUALITY"
+    )
+    document_vision_cache_enabled: bool = Field(
+        default=True, validation_alias="DOCUMENT_VISION_CACHE_ENABLED"
+    )
+    document_vision_cache_max_mb: int = Field(
+        default=128, validation_alias="DOCUMENT_VISION_CACHE_MAX_MB"
+    )
+    token_calibration_enabled: bool = Field(
+        default=True, validation_alias="TOKEN_CALIBRATION_ENABLED"
+    )
+    tool_result_envelope: str = Field(
+        default="compact", validation_alias="TOOL_RESULT_ENVELOPE"
+    )
+    tool_result_inline_parameter_chars: int = Field(
+        default=256, validation_alias="TOOL_RESULT_INLINE_PARAMETER_CHARS"
+    )
+    rolling_compaction_enabled: bool = Field(
+        default=True, validation_alias="ROLLING_COMPACTION_ENABLED"
+    )
+    rolling_compaction_trigger: float = Field(
+        default=0.65, validation_alias="ROLLING_COMPACTION_TRIGGER"
+    )
+    rolling_compaction_target: float = Field(
+        default=0.5, validation_alias="ROLLING_COMPACTION_TARGET"
+    )
+    utility_model_alias: str = Field(default="", validation_alias="UTILITY_MODEL_ALIAS")
+    utility_model_routes: str = Field(
+        default=",".join(UTILITY_MODEL_ROUTE_KINDS),
+        validation_alias="UTILITY_MODEL_ROUTES",
+    )
+    tool_call_local_repair: bool = Field(
+        default=True, validation_alias="TOOL_CALL_LOCAL_REPAIR"
+    )
+    speculative_tool_dispatch: bool = Field(
+        default=True, validation_alias="SPECULATIVE_TOOL_DISPATCH"
+    )
+    context_mask_stale_reads: bool = Field(
+        default=True, validation_alias="CONTEXT_MASK_STALE_READS"
+    )
+    tool_line_encoding: str = Field(
+        default="auto", validation_alias="TOOL_LINE_ENCODING"
+    )
+    tool_line_encoding_by_family: Dict[str, str] = Field(
+        default_factory=dict, validation_alias="TOOL_LINE_ENCODING_BY_FAMILY"
+    )
     pruning_threshold: float = 0.8
     trace_max_sessions: int = 200
     trace_max_total_mb: int = 250
+    trace_compress_old: bool = False
+    trace_format: str = "jsonl"
+    trace_codec: str = "auto"
 
     # === Computed Fields ===
     system_prompt: Optional[str] = None
@@ -108,6 +175,9 @@ class Settings(BaseSettings):
     force_model_discovery: bool = Field(
         default=False, validation_alias="FORCE_MODEL_DISCOVERY"
     )
+    background_model_refresh: bool = Field(
+        default=True, validation_alias="BACKGROUND_MODEL_REFRESH"
+    )
     active_model_alias: str = Field(default="", validation_alias="ACTIVE_MODEL_ALIAS")
 
     # Computed fields
@@ -148,6 +218,90 @@ class Settings(BaseSettings):
             raise ConfigError("TRACE_MAX_SESSIONS must be >= 1.")
         if self.trace_max_total_mb < 1:
             raise ConfigError("TRACE_MAX_TOTAL_MB must be >= 1.")
+        if self.document_vision_concurrency < 1:
+            raise ConfigError("DOCUMENT_VISION_CONCURRENCY must be >= 1.")
+        if self.document_vision_max_edge < 64:
+            raise ConfigError("DOCUMENT_VISION_MAX_EDGE must be >= 64.")
+        self.document_vision_image_format = (
+            self.document_vision_image_format or "jpeg"
+        ).strip().lower()
+        if self.document_vision_image_format not in {"jpeg", "webp", "original"}:
+            raise ConfigError(
+                "DOCUMENT_VISION_IMAGE_FORMAT must be 'jpeg', 'webp' or 'original'. "
+                f"Got: {self.document_vision_image_format}"
+            )
+        if not 1 <= self.document_vision_image_quality <= 100:
+            raise ConfigError("DOCUMENT_VISION_IMAGE_QUALITY must be between 1 and 100.")
+        if self.document_vision_cache_max_mb < 1:
+            raise ConfigError("DOCUMENT_VISION_CACHE_MAX_MB must be >= 1.")
+        self.tool_result_envelope = (
+            self.tool_result_envelope or "compact"
+        ).strip().lower()
+        if self.tool_result_envelope not in {"compact", "full"}:
+            raise ConfigError(
+                "TOOL_RESULT_ENVELOPE must be 'compact' or 'full'. "
+                f"Got: {self.tool_result_envelope}"
+            )
+        # Compaction has to start before the hard prune drops the same chunks.
+        if not 0.0 < self.rolling_compaction_trigger < self.pruning_threshold:
+            raise ConfigError(
+                "ROLLING_COMPACTION_TRIGGER must be between 0 and the pruning "
+                f"threshold ({self.pruning_threshold}). "
+                f"Got: {self.rolling_compaction_trigger}"
+            )
+        if not 0.0 < self.rolling_compaction_target < self.rolling_compaction_trigger:
+            raise ConfigError(
+                "ROLLING_COMPACTION_TARGET must be between 0 and "
+                f"ROLLING_COMPACTION_TRIGGER ({self.rolling_compaction_trigger}). "
+                f"Got: {self.rolling_compaction_target}"
+            )
+        routes = [
+            item.strip().lower()
+            for item in str(self.utility_model_routes or "").split(",")
+            if item.strip()
+        ]
+        unknown_routes = sorted(set(routes) - set(UTILITY_MODEL_ROUTE_KINDS))
+        if unknown_routes:
+            raise ConfigError(
+                "UTILITY_MODEL_ROUTES entries must be one of "
+                f"{', '.join(UTILITY_MODEL_ROUTE_KINDS)}. "
+                f"Invalid: {', '.join(unknown_routes)}"
+            )
+        self.utility_model_routes = ",".join(routes)
+        self.utility_model_alias = str(self.utility_model_alias or "").strip()
+        if self.tool_result_inline_parameter_chars < 0:
+            raise ConfigError("TOOL_RESULT_INLINE_PARAMETER_CHARS must be >= 0.")
+        line_encodings = {"records", "columnar", "numbered"}
+        self.tool_line_encoding = (self.tool_line_encoding or "auto").strip().lower()
+        if self.tool_line_encoding not in line_encodings | {"auto"}:
+            raise ConfigError(
+                "TOOL_LINE_ENCODING must be 'auto', 'records', 'columnar' or "
+                f"'numbered'. Got: {self.tool_line_encoding}"
+            )
+        self.tool_line_encoding_by_family = {
+            str(family).strip().lower(): str(encoding).strip().lower()
+            for family, encoding in (self.tool_line_encoding_by_family or {}).items()
+        }
+        invalid_families = sorted(
+            family
+            for family, encoding in self.tool_line_encoding_by_family.items()
+            if encoding not in line_encodings
+        )
+        if invalid_families:
+            raise ConfigError(
+                "TOOL_LINE_ENCODING_BY_FAMILY values must be 'records', 'columnar' "
+                f"or 'numbered'. Invalid families: {', '.join(invalid_families)}"
+            )
+        self.trace_format = (self.trace_format or "jsonl").strip().lower()
+        if self.trace_format not in {"jsonl", "indexed"}:
+            raise ConfigError(
+                f"TRACE_FORMAT must be 'jsonl' or 'indexed'. Got: {self.trace_format}"
+            )
+        self.trace_codec = (self.trace_codec or "auto").strip().lower()
+        if self.trace_codec not in {"auto", "zstd", "gzip"}:
+            raise ConfigError(
+                f"TRACE_CODEC must be 'auto', 'zstd' or 'gzip'. Got: {self.trace_codec}"
+            )
 
         state_home = Path.home().expanduser().resolve(strict=False) / ".protocol_monk"
         self.resolved_paths = ResolvedPaths(
@@ -283,12 +437,19 @@ class Settings(BaseSettings):
             "or set OPENROUTER_MODELS_JSON_PATH to a valid curated map."
         )
 
-    async def initialize(self) -> None:
+    async def initialize(self, profiler: "StartupProfiler | None" = None) -> None:
         """
         Post-choice runtime initialization for provider/model state.
         """
-        self.validate_runtime_ready()
-        await self._discover_models()
+        if profiler is None:
+            self.validate_runtime_ready()
+            await self._discover_models()
+            return
+
+        with profiler.phase("settings.validate_runtime_ready"):
+            self.validate_runtime_ready()
+        with profiler.phase("settings._discover_models"):
+            await self._discover_models()
 
     async def _discover_models(self) -> None:
         """Load model config for the selected provider."""
@@ -302,11 +463,15 @@ class Settings(BaseSettings):
                     self.openrouter_models_json_path
                 )
             else:
+                # Deferred so OpenRouter sessions never import the Ollama SDK.
+                from protocol_monk.utils.model_discovery import discover_models
+
                 logger.info("Discovering models from Ollama...")
                 model_config = await discover_models(
                     models_json_path=self.models_json_path,
                     ollama_host=self.ollama_host,
                     force_refresh=self.force_model_discovery,
+                    verify_in_background=self.background_model_refresh,
                 )
 
             self.models_config = model_config
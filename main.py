@@ -1,7 +1,16 @@
+import sys
+import time
+
+# Anchor for startup tracing: measures the cost of the imports below.
+_IMPORT_STARTED_AT = time.perf_counter()
+_MODULES_AT_IMPORT_START = len(sys.modules)
+
+import argparse
 import asyncio
 import logging
 import os
 from pathlib import Path
+from typing import Any, Callable
 
 # 1. Import Config
 from protocol_monk.config.settings import load_settings
@@ -26,12 +35,15 @@ from protocol_monk.agent.core.service import AgentService
 from protocol_monk.utils.scratch import ScratchManager
 from protocol_monk.utils.logger import EventLogger
 from protocol_monk.utils.session_transcript import SessionTranscriptSink
+from protocol_monk.utils.startup_profile import StartupProfiler
 from protocol_monk.providers.factory import create_provider
 from protocol_monk.skill_runtime import SkillRuntime
-from protocol_monk.plugins.neuralsym import build_protocol_monk_neuralsym_adapter
 
-# 6. Import UI Components
-from protocol_monk.ui.rich.boot import BootAnimation, BootPhase
+# Heavy subsystems (NeuralSym, Rich boot animation, OpenRouter catalog, vision
+# clients) are imported where they are first used to keep boot fast.
+
+_IMPORTS_FINISHED_AT = time.perf_counter()
+_MODULES_IMPORTED = len(sys.modules) - _MODULES_AT_IMPORT_START
 
 logging.basicConfig(
     level=logging.INFO,
@@ -112,13 +124,79 @@ def _validate_context_tracking_tools(registry: ToolRegistry) -> tuple[list[str],
     return expected, missing
 
 
+async def _load_neuralsym_adapter(settings, agent_service: AgentService):
+    """Build NeuralSym off the boot path and attach it once it is ready."""
+    try:
+        from protocol_monk.plugins.neuralsym import (
+            build_protocol_monk_neuralsym_adapter,
+        )
+
+        adapter = await build_protocol_monk_neuralsym_adapter(settings)
+    except Exception as exc:
+        log_exception(logger, logging.WARNING, "NeuralSym startup failed", exc)
+        return None
+    agent_service.attach_neuralsym_adapter(adapter)
+    return adapter
+
+
+async def _shutdown_neuralsym(task: asyncio.Task | None) -> None:
+    if task is None:
+        return
+    if not task.done():
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        return
+    adapter = task.result()
+    if adapter is not None:
+        await adapter.stop()
+
+
+def _startup_metrics_path(settings) -> Path:
+    return settings.resolved_paths.state_home / "startup_metrics.json"
+
+
+async def _publish_startup_metrics(
+    bus: EventBus, settings, profiler: StartupProfiler
+) -> None:
+    """Broadcast the boot trace; persist it only when profiling was requested."""
+    metrics = profiler.to_dict()
+    if profiler.enabled:
+        metrics_path = _startup_metrics_path(settings)
+        try:
+            profiler.write_json(metrics_path)
+        except OSError as exc:
+            logger.warning("Failed to write startup metrics to %s: %s", metrics_path, exc)
+        else:
+            metrics["path"] = str(metrics_path)
+    await bus.emit(EventTypes.STARTUP_METRICS, metrics)
+
+
+def _print_startup_timeline(profiler: StartupProfiler, title: str) -> None:
+    if profiler.enabled:
+        print(profiler.render_timeline(title), file=sys.stderr, flush=True)
+
+
 async def run_session_app(
     settings,
     *,
     skip_wizard: bool = False,
     requested_ui_backend: str = "rich",
+    profiler: StartupProfiler | None = None,
+    provider_factory: Callable[[Any], Any] = create_provider,
+    headless: bool = False,
 ) -> int:
-    """Run the terminal session against an already-loaded settings object."""
+    """
+    Run the terminal session against an already-loaded settings object.
+
+    `headless` stops once the runtime is wired (no boot animation, UI, or
+    network-only background refreshes); the startup benchmark uses it together
+    with a stub `provider_factory`.
+    """
+    profiler = profiler or StartupProfiler()
+    transcript_sink: SessionTranscriptSink | None = None
     try:
         root_level = getattr(logging, settings.log_level.upper(), logging.INFO)
         logging.getLogger().setLevel(root_level)
@@ -143,21 +221,27 @@ async def run_session_app(
                 pass  # User cancelled, use defaults
 
         # Initialize provider/model state only after setup choices are applied.
-        await settings.initialize()
+        with profiler.phase("settings.initialize"):
+            await settings.initialize(profiler=profiler)
         _log_startup_diagnostics(settings)
 
-        provider = create_provider(settings)
-        await _validate_provider_ready(provider, settings)
+        with profiler.phase("create_provider"):
+            provider = provider_factory(settings)
+        with profiler.phase("validate_provider_ready"):
+            await _validate_provider_ready(provider, settings)
 
         ui_backend, ui_note = _resolve_ui_backend(requested_ui_backend)
         _apply_rich_log_suppression(ui_backend, root_level)
 
-        boot: BootAnimation | None = None
+        boot = None
 
         # Run boot animation for Rich UI
-        if ui_backend == "rich":
-            boot = BootAnimation()
-            await boot.run_animation(duration_per_art=0.5)
+        if ui_backend == "rich" and not headless:
+            with profiler.phase("ui.rich.boot", kind="import"):
+                from protocol_monk.ui.rich.boot import BootAnimation, BootPhase
+            with profiler.phase("boot animation"):
+                boot = BootAnimation()
+                await boot.run_animation(duration_per_art=0.5)
 
         # Phase 2: Wiring Components
 
@@ -170,8 +254,14 @@ async def run_session_app(
             settings.workspace_root,
             max_sessions=settings.trace_max_sessions,
             max_total_bytes=settings.trace_max_total_bytes,
+            compress_pruned=settings.trace_compress_old,
+            transcript_format=settings.trace_format,
+            codec=settings.trace_codec,
         )
-        await transcript_sink.start()
+        with profiler.phase("transcript sink"):
+            await transcript_sink.start()
+        if transcript_sink.prune_task is not None:
+            profiler.track_task("transcript retention pruning", transcript_sink.prune_task)
 
         # Start the EventLogger only in debug runs to avoid duplicate UI output.
         if settings.log_level == "DEBUG":
@@ -180,7 +270,8 @@ async def run_session_app(
 
         # B. Tools (The Hands)
         registry = ToolRegistry()
-        register_default_tools(registry, settings)
+        with profiler.phase("register_default_tools"):
+            register_default_tools(registry, settings)
         registered_tools = registry.list_tool_names()
 
         await bus.emit(
@@ -268,11 +359,14 @@ async def run_session_app(
         # D. Scratch Manager (Cleanup)
         with ScratchManager(settings.resolved_paths.scratch_root) as _:
             skill_runtime = SkillRuntime(settings.resolved_paths.skills_root)
-            neuralsym_adapter = await build_protocol_monk_neuralsym_adapter(settings)
 
             # E. Memory Systems (The Brain)
             context_store = ContextStore()
             file_tracker = FileTracker()
+            read_file_tool = registry.get_tool("read_file")
+            if hasattr(read_file_tool, "attach_file_tracker"):
+                # Lets read_file skip re-sending ranges still live in context.
+                read_file_tool.attach_file_tracker(file_tracker)
 
             coordinator = ContextCoordinator(
                 store=context_store, tracker=file_tracker, settings=settings
@@ -286,15 +380,28 @@ async def run_session_app(
                 provider=provider,
                 settings=settings,
                 skill_runtime=skill_runtime,
-                neuralsym_adapter=neuralsym_adapter,
             )
 
+            # NeuralSym advice is optional; load it while the user types.
+            neuralsym_task = asyncio.create_task(
+                _load_neuralsym_adapter(settings, agent_service),
+                name="neuralsym-startup",
+            )
+            profiler.track_task("neuralsym load", neuralsym_task)
+
             try:
-                await agent_service.start()
+                with profiler.phase("agent_service.start"):
+                    await agent_service.start()
 
                 # Phase 4: Starting UI
                 if boot is not None:
                     boot.update_phase(BootPhase.UI, "Ready")
+                profiler.mark("ready")
+                await _publish_startup_metrics(bus, settings, profiler)
+                _print_startup_timeline(profiler, "Startup timeline (ready)")
+
+                if headless:
+                    return 0
 
                 if ui_backend == "cli":
                     from protocol_monk.ui.cli import PromptToolkitCLI
@@ -311,21 +418,55 @@ async def run_session_app(
 
                 return 0
             finally:
-                if neuralsym_adapter is not None:
-                    await neuralsym_adapter.stop()
+                await _shutdown_neuralsym(neuralsym_task)
+                _print_startup_timeline(profiler, "Startup timeline (final)")
 
     except Exception as exc:
         log_exception(logger, logging.CRITICAL, "Startup failed", exc)
         return 1
+    finally:
+        if transcript_sink is not None:
+            await transcript_sink.stop()
+
+
+def build_startup_profiler(*, enabled: bool = False) -> StartupProfiler:
+    """Create a tracer anchored at the start of this module's imports."""
+    profiler = StartupProfiler(enabled=enabled, origin=_IMPORT_STARTED_AT)
+    profiler.record(
+        "protocol_monk.main imports",
+        started_at=_IMPORT_STARTED_AT,
+        ended_at=_IMPORTS_FINISHED_AT,
+        kind="import",
+        modules_loaded=_MODULES_IMPORTED,
+    )
+    return profiler
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="protocol_monk")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        default=_env_flag("PROTOCOL_MONK_PROFILE_STARTUP"),
+        help=(
+            "Print a per-phase import/initialization timeline to stderr and "
+            "save it to ~/.protocol_monk/startup_metrics.json."
+        ),
+    )
+    return parser.parse_args(argv)
 
 
-async def main():
+async def main(argv: list[str] | None = None):
     """Main entry point for Protocol Monk."""
-    settings = load_settings(APP_ROOT)
+    args = _parse_args(argv)
+    profiler = build_startup_profiler(enabled=args.profile_startup)
+    with profiler.phase("load_settings"):
+        settings = load_settings(APP_ROOT)
     return await run_session_app(
         settings,
         skip_wizard=_env_flag("PROTOCOL_MONK_SKIP_WIZARD"),
         requested_ui_backend=os.getenv("PROTOCOL_MONK_UI", "rich"),
+        profiler=profiler,
     )
 
 
@@ -9,10 +9,13 @@ from .bootstrap import (
     bootstrap_observations_from_session_path,
     convert_session_records_to_observations,
     load_admissible_session_records,
+    read_admissible_session_records,
 )
 from .config import NeuralSymSettings, load_neuralsym_settings
 from .importer import (
+    SessionBackfillResult,
     SessionImportResult,
+    backfill_sessions_to_workspace_state,
     import_session_to_workspace_state,
     import_session_to_workspace_state_async,
 )
@@ -31,7 +34,9 @@ __all__ = [
     "NeuralSymRuntime",
     "NeuralSymSettings",
     "ProtocolMonkNeuralSymAdapter",
+    "SessionBackfillResult",
     "SessionImportResult",
+    "backfill_sessions_to_workspace_state",
     "bootstrap_observations_from_session_path",
     "build_protocol_monk_neuralsym_adapter",
     "build_mission_control_input",
@@ -41,4 +46,5 @@ __all__ = [
     "import_session_to_workspace_state_async",
     "load_admissible_session_records",
     "load_neuralsym_settings",
+    "read_admissible_session_records",
 ]
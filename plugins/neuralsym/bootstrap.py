@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import gzip
 import json
+import os
+import uuid
 from pathlib import Path
-from typing import Annotated, Any, Literal, TypeAlias
+from typing import Annotated, Any, Iterator, Literal, TypeAlias
 
 from pydantic import Field, TypeAdapter
 
+from protocol_monk.utils.transcript_format import (
+    IndexedTranscriptReader,
+    is_indexed_transcript,
+)
+
 from .models import (
     AssistantPassObservation,
     CorrelationRef,
@@ -29,6 +37,9 @@ ADMISSIBLE_SESSION_EVENT_TYPES = frozenset(
     }
 )
 
+# Namespace for ids of observations derived from transcript records.
+_IMPORTED_OBSERVATION_NAMESPACE = uuid.UUID("6f1c4f5e-2b7a-4d8e-9c31-5a0e7d2b9f40")
+
 
 class SessionCorrelation(NeuralSymBaseModel):
     """Correlation fields lifted from transcript records."""
@@ -170,19 +181,141 @@ AdmissibleSessionRecordAdapter = TypeAdapter(AdmissibleSessionRecord)
 def load_admissible_session_records(session_path: str | Path) -> list[AdmissibleSessionRecord]:
     """Load only the transcript events NeuralSym can consume safely."""
 
+    records, _end_offset = read_admissible_session_records(session_path)
+    return records
+
+
+def read_admissible_session_records(
+    session_path: str | Path,
+    *,
+    start_offset: int = 0,
+    hold_open_tool_calls: bool = False,
+) -> tuple[list[AdmissibleSessionRecord], int]:
+    """
+    Stream admissible records from `start_offset` and return the resume offset.
+
+    Offsets are byte positions for JSONL transcripts (plain or .gz) and record
+    numbers for indexed ones. Lines are streamed, and lines whose event type
+    is visibly not admissible are skipped before JSON decoding. An unfinished
+    trailing line is left for the next read.
+
+    With `hold_open_tool_calls`, the resume offset stops at the first tool call
+    that has started but not completed, and records from there on are left
+    for the next read. Appended transcripts then convert exactly as a full
+    import would.
+    """
+
     path = Path(session_path)
-    records: list[AdmissibleSessionRecord] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        raw = line.strip()
+    positioned: list[tuple[int, AdmissibleSessionRecord]] = []
+    end_offset = start_offset
+    for line_offset, next_offset, raw in _iter_positioned_lines(path, start_offset):
+        if not raw.endswith(b"\n") and not is_indexed_transcript(path):
+            break
+        end_offset = next_offset
+        raw = raw.strip()
         if not raw:
             continue
+        peeked_event_type = _peek_event_type(raw)
+        if peeked_event_type is not None and peeked_event_type not in ADMISSIBLE_SESSION_EVENT_TYPES:
+            continue
         data = json.loads(raw)
         if not isinstance(data, dict):
             continue
         if data.get("event_type") not in ADMISSIBLE_SESSION_EVENT_TYPES:
             continue
-        records.append(AdmissibleSessionRecordAdapter.validate_python(data))
-    return records
+        positioned.append((line_offset, AdmissibleSessionRecordAdapter.validate_python(data)))
+
+    if hold_open_tool_calls:
+        open_starts: dict[tuple[str, str, str], int] = {}
+        for line_offset, record in positioned:
+            if isinstance(record, ToolExecutionStartRecord):
+                open_starts.setdefault(_tool_key(record), line_offset)
+            elif isinstance(record, ToolExecutionCompleteRecord):
+                open_starts.pop(_tool_key(record), None)
+        if open_starts:
+            end_offset = min(open_starts.values())
+            positioned = [item for item in positioned if item[0] < end_offset]
+
+    return [record for _line_offset, record in positioned], end_offset
+
+
+_EVENT_TYPE_MARKER = b'"event_type":"'
+# Transcript records serialize event_type before correlation and payload.
+_EVENT_TYPE_PEEK_BYTES = 512
+
+
+def _peek_event_type(raw: bytes) -> str | None:
+    """Read event_type from the line head without decoding; None if unsure."""
+
+    head = raw[:_EVENT_TYPE_PEEK_BYTES]
+    start = head.find(_EVENT_TYPE_MARKER)
+    if start == -1:
+        return None
+    start += len(_EVENT_TYPE_MARKER)
+    end = head.find(b'"', start)
+    if end == -1:
+        return None
+    return head[start:end].decode("utf-8", errors="replace")
+
+
+def gzip_uncompressed_size(path: Path) -> int | None:
+    """
+    Read the uncompressed length from a gzip trailer (ISIZE).
+
+    Exact for the single-member archives transcript retention writes, as long
+    as they are under 4 GiB; None when the trailer cannot be read.
+    """
+
+    try:
+        with open(path, "rb") as handle:
+            handle.seek(-4, os.SEEK_END)
+            trailer = handle.read(4)
+    except OSError:
+        return None
+    if len(trailer) != 4:
+        return None
+    return int.from_bytes(trailer, "little")
+
+
+def _iter_positioned_lines(
+    path: Path, start_offset: int
+) -> Iterator[tuple[int, int, bytes]]:
+    """
+    Yield `(offset, next_offset, raw_line)` from `start_offset`.
+
+    Indexed transcripts only yield admissible lines, read from the blocks the
+    index says hold them; `next_offset` then skips the records in between.
+    """
+
+    if is_indexed_transcript(path):
+        reader = IndexedTranscriptReader(path)
+        pending: tuple[int, bytes] | None = None
+        for record_number, raw in reader.iter_numbered_lines(
+            start_record=start_offset,
+            event_types=ADMISSIBLE_SESSION_EVENT_TYPES,
+        ):
+            if pending is not None:
+                yield pending[0], record_number, pending[1]
+            pending = (record_number, raw)
+        if pending is not None:
+            yield pending[0], max(reader.record_count, pending[0] + 1), pending[1]
+        return
+
+    if path.name.endswith(".gz"):
+        # Archives never grow, so a checkpoint at the end means nothing new;
+        # anything else has to decompress from the start to reach the offset.
+        if start_offset and start_offset == gzip_uncompressed_size(path):
+            return
+        opener = gzip.open
+    else:
+        opener = open
+    with opener(path, "rb") as handle:
+        handle.seek(start_offset)
+        offset = start_offset
+        for raw in iter(handle.readline, b""):
+            next_offset = offset + len(raw)
+            yield offset, next_offset, raw
+            offset = next_offset
 
 
 def bootstrap_observations_from_session_path(
@@ -218,6 +351,7 @@ def convert_session_records_to_observations(
         if isinstance(record, UserInputSubmittedRecord):
             observations.append(
                 UserInputObservation(
+                    id=_record_observation_id(record, "user_input"),
                     workspace_id=workspace_id,
                     timestamp=record.timestamp,
                     request_id=record.payload.request_id or correlation.turn_id or "",
@@ -237,6 +371,7 @@ def convert_session_records_to_observations(
             ]
             observations.append(
                 AssistantPassObservation(
+                    id=_record_observation_id(record, "assistant_pass"),
                     workspace_id=workspace_id,
                     timestamp=record.timestamp,
                     response_pass_id=record.payload.pass_id or correlation.pass_id or "",
@@ -255,6 +390,7 @@ def convert_session_records_to_observations(
             complete_payload = completes.get(_tool_key(record))
             observations.append(
                 ToolResultObservation(
+                    id=_record_observation_id(record, "tool_result"),
                     workspace_id=workspace_id,
                     timestamp=record.timestamp,
                     tool_name=record.payload.tool_name,
@@ -274,6 +410,7 @@ def convert_session_records_to_observations(
             if record.payload.error_code == "user_rejected":
                 observations.append(
                     ExplicitUserPreferenceObservation(
+                        id=_record_observation_id(record, "explicit_user_override"),
                         workspace_id=workspace_id,
                         timestamp=record.timestamp,
                         signal_kind="explicit_user_override",
@@ -287,6 +424,12 @@ def convert_session_records_to_observations(
     return observations
 
 
+def _record_observation_id(record: SessionRecordBase, kind: str) -> str:
+    """Derive a stable id so re-importing the same record yields the same observation."""
+
+    return str(uuid.uuid5(_IMPORTED_OBSERVATION_NAMESPACE, f"{record.session_id}:{record.sequence}:{kind}"))
+
+
 def _tool_key(record: ToolExecutionStartRecord | ToolResultRecord | ToolExecutionCompleteRecord) -> tuple[str, str, str]:
     correlation = record.correlation
     payload = record.payload
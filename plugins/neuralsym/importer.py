@@ -3,17 +3,33 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from pydantic import Field
 
+from protocol_monk.utils.transcript_format import (
+    IndexedTranscriptReader,
+    is_indexed_transcript,
+)
+
 from .advisor import MissionControlAdvisor, NoOpAdvisor
 from .bootstrap import (
-    bootstrap_observations_from_session_path,
-    load_admissible_session_records,
+    convert_session_records_to_observations,
+    gzip_uncompressed_size,
+    read_admissible_session_records,
+)
+from .models import (
+    AdviceSnapshot,
+    NeuralSymBaseModel,
+    Observation,
+    RuntimeState,
+    SessionImportCheckpoint,
+    WorkspaceProfile,
 )
-from .models import AdviceSnapshot, NeuralSymBaseModel, RuntimeState, WorkspaceProfile
 from .storage import NeuralSymStorage
 from .workspace import resolve_state_dir, resolve_workspace_id, resolve_workspace_root
 
@@ -28,6 +44,8 @@ class SessionImportResult(NeuralSymBaseModel):
     imported_observations: int = Field(ge=0)
     total_observations: int = Field(ge=0)
     skipped_duplicate: bool = False
+    resumed_from_offset: int = Field(default=0, ge=0)
+    checkpoint_offset: int = Field(default=0, ge=0)
     policy_signal_count: int = Field(ge=0)
     feedback_event_count: int = Field(ge=0)
     directive_count: int = Field(ge=0)
@@ -70,11 +88,30 @@ async def import_session_to_workspace_state_async(
     storage = NeuralSymStorage(state_dir)
     storage.ensure_state_dir()
 
-    records = load_admissible_session_records(session_path)
-    session_id = records[0].session_id if records else None
-
+    resolved_session_path = Path(session_path).resolve()
+    checkpoint_key = str(resolved_session_path)
     runtime_state = storage.load_runtime_state() or RuntimeState(workspace_id=workspace_id)
-    if session_id is not None and session_id in runtime_state.imported_session_ids:
+    checkpoint = _resolve_import_checkpoint(runtime_state, resolved_session_path)
+    start_offset = checkpoint.offset if checkpoint is not None else 0
+
+    records, end_offset = read_admissible_session_records(
+        resolved_session_path,
+        start_offset=start_offset,
+        hold_open_tool_calls=True,
+    )
+    session_id = (
+        checkpoint.session_id
+        if checkpoint is not None and checkpoint.session_id
+        else (records[0].session_id if records else None)
+    )
+
+    # Sessions imported before checkpoints existed have no resume point.
+    legacy_duplicate = (
+        checkpoint is None
+        and session_id is not None
+        and session_id in runtime_state.imported_session_ids
+    )
+    if legacy_duplicate or (not records and end_offset == start_offset):
         profile = storage.load_workspace_profile() or WorkspaceProfile(
             workspace_id=workspace_id,
             workspace_root=str(workspace_path),
@@ -83,21 +120,29 @@ async def import_session_to_workspace_state_async(
         return SessionImportResult(
             workspace_id=workspace_id,
             state_dir=str(state_dir),
-            session_path=str(Path(session_path).resolve()),
+            session_path=str(resolved_session_path),
             session_id=session_id,
             imported_observations=0,
             total_observations=len(storage.load_observations()),
             skipped_duplicate=True,
+            resumed_from_offset=start_offset,
+            checkpoint_offset=start_offset,
             policy_signal_count=len(profile.policy_signals),
             feedback_event_count=len(profile.feedback_events),
             directive_count=len(snapshot.directives),
         )
 
-    imported_observations = bootstrap_observations_from_session_path(
-        session_path,
+    imported_observations = convert_session_records_to_observations(
+        records,
         workspace_id=workspace_id,
     )
     existing_observations = storage.load_observations()
+    # Observation ids are derived from (session, sequence), so a record that
+    # was already imported through another path is not added twice.
+    seen_ids = {observation.id for observation in existing_observations}
+    imported_observations = [
+        observation for observation in imported_observations if observation.id not in seen_ids
+    ]
     all_observations = [*existing_observations, *imported_observations]
     storage.save_observations(all_observations)
 
@@ -124,6 +169,13 @@ async def import_session_to_workspace_state_async(
         )
     runtime_state.imported_observation_count += len(imported_observations)
     runtime_state.last_imported_at = time.time()
+    runtime_state.import_checkpoints[checkpoint_key] = SessionImportCheckpoint(
+        session_id=session_id,
+        offset=end_offset,
+        imported_records=(checkpoint.imported_records if checkpoint is not None else 0)
+        + len(records),
+        updated_at=runtime_state.last_imported_at,
+    )
 
     storage.save_workspace_profile(profile)
     storage.save_advice_snapshot(snapshot)
@@ -132,12 +184,240 @@ async def import_session_to_workspace_state_async(
     return SessionImportResult(
         workspace_id=workspace_id,
         state_dir=str(state_dir),
-        session_path=str(Path(session_path).resolve()),
+        session_path=str(resolved_session_path),
         session_id=session_id,
         imported_observations=len(imported_observations),
         total_observations=len(all_observations),
         skipped_duplicate=False,
+        resumed_from_offset=start_offset,
+        checkpoint_offset=end_offset,
         policy_signal_count=len(profile.policy_signals),
         feedback_event_count=len(profile.feedback_events),
         directive_count=len(snapshot.directives),
     )
+
+
+class SessionBackfillResult(NeuralSymBaseModel):
+    """Structured result for a bulk multi-session backfill."""
+
+    workspace_id: str
+    state_dir: str
+    sessions_scanned: int = Field(ge=0)
+    sessions_imported: int = Field(ge=0)
+    sessions_skipped: int = Field(ge=0)
+    records_processed: int = Field(ge=0)
+    imported_observations: int = Field(ge=0)
+    total_observations: int = Field(ge=0)
+    workers: int = Field(ge=1)
+    elapsed_seconds: float = Field(ge=0)
+    records_per_second: float = Field(ge=0)
+    policy_signal_count: int = Field(ge=0)
+    feedback_event_count: int = Field(ge=0)
+    directive_count: int = Field(ge=0)
+
+
+class _ConvertedSession(NeuralSymBaseModel):
+    """Worker output for one transcript in a backfill."""
+
+    session_path: str
+    session_id: str | None = None
+    start_offset: int = 0
+    end_offset: int = 0
+    record_count: int = 0
+    observations: list[Observation] = Field(default_factory=list)
+
+
+def _convert_session_for_backfill(
+    session_path: str,
+    workspace_id: str,
+    start_offset: int,
+) -> _ConvertedSession:
+    """Parse and convert one transcript; runs in a worker process."""
+
+    records, end_offset = read_admissible_session_records(
+        session_path,
+        start_offset=start_offset,
+        hold_open_tool_calls=True,
+    )
+    return _ConvertedSession(
+        session_path=session_path,
+        session_id=records[0].session_id if records else None,
+        start_offset=start_offset,
+        end_offset=end_offset,
+        record_count=len(records),
+        observations=convert_session_records_to_observations(
+            records, workspace_id=workspace_id
+        ),
+    )
+
+
+def backfill_sessions_to_workspace_state(
+    *,
+    session_paths: list[str | Path],
+    workspace_root: str | Path,
+    state_dirname: str = ".protocol_monk/neuralsym",
+    advice_token_budget: int = 256,
+    max_workers: int | None = None,
+    advisor: MissionControlAdvisor | NoOpAdvisor | None = None,
+) -> SessionBackfillResult:
+    """
+    Import many transcripts at once into workspace NeuralSym storage.
+
+    Transcripts are parsed and converted in a process pool, using the same
+    per-transcript checkpoints as single imports. The new observations are
+    merged with the stored ones in timestamp order, written once as a
+    compacted store, and the advice snapshot is rebuilt once at the end.
+    """
+
+    started_at = time.perf_counter()
+    workspace_path = resolve_workspace_root(workspace_root)
+    workspace_id = resolve_workspace_id(workspace_path)
+    state_dir = resolve_state_dir(workspace_path, state_dirname)
+    storage = NeuralSymStorage(state_dir)
+    storage.ensure_state_dir()
+    runtime_state = storage.load_runtime_state() or RuntimeState(workspace_id=workspace_id)
+
+    jobs: list[tuple[str, int, SessionImportCheckpoint | None]] = []
+    queued_paths: set[Path] = set()
+    for raw_path in session_paths:
+        resolved = Path(raw_path).resolve()
+        if resolved in queued_paths:
+            continue
+        queued_paths.add(resolved)
+        checkpoint = _resolve_import_checkpoint(runtime_state, resolved)
+        jobs.append((str(resolved), checkpoint.offset if checkpoint else 0, checkpoint))
+
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(jobs) or 1))
+    if workers == 1:
+        converted = [
+            _convert_session_for_backfill(path, workspace_id, offset)
+            for path, offset, _checkpoint in jobs
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            converted = list(
+                executor.map(
+                    _convert_session_for_backfill,
+                    [path for path, _offset, _checkpoint in jobs],
+                    [workspace_id] * len(jobs),
+                    [offset for _path, offset, _checkpoint in jobs],
+                )
+            )
+
+    imported_session_ids = set(runtime_state.imported_session_ids)
+    new_observations: list[Observation] = []
+    records_processed = 0
+    sessions_imported = 0
+    imported_at = time.time()
+    for (_path, _offset, checkpoint), result in zip(jobs, converted):
+        records_processed += result.record_count
+        session_id = (
+            checkpoint.session_id
+            if checkpoint is not None and checkpoint.session_id
+            else result.session_id
+        )
+        legacy_duplicate = (
+            checkpoint is None
+            and session_id is not None
+            and session_id in imported_session_ids
+        )
+        if legacy_duplicate or result.end_offset == result.start_offset:
+            continue
+
+        sessions_imported += 1
+        new_observations.extend(result.observations)
+        if session_id is not None:
+            imported_session_ids.add(session_id)
+        runtime_state.import_checkpoints[result.session_path] = SessionImportCheckpoint(
+            session_id=session_id,
+            offset=result.end_offset,
+            imported_records=(checkpoint.imported_records if checkpoint is not None else 0)
+            + result.record_count,
+            updated_at=imported_at,
+        )
+
+    # Ids are derived from (session, sequence), which also drops records seen
+    # earlier through a copy of the same transcript.
+    existing_observations = storage.load_observations()
+    seen_ids = {observation.id for observation in existing_observations}
+    unique_new_observations: list[Observation] = []
+    for observation in new_observations:
+        if observation.id in seen_ids:
+            continue
+        seen_ids.add(observation.id)
+        unique_new_observations.append(observation)
+    new_observations = unique_new_observations
+    merged = [*existing_observations, *new_observations]
+    # sorted() is stable, so same-timestamp observations keep transcript order.
+    all_observations = sorted(merged, key=lambda observation: observation.timestamp)
+
+    profile = storage.load_workspace_profile() or WorkspaceProfile(
+        workspace_id=workspace_id,
+        workspace_root=str(workspace_path),
+    )
+    if new_observations:
+        storage.save_observations(all_observations)
+        resolved_advisor = advisor or MissionControlAdvisor(
+            advice_token_budget=advice_token_budget
+        )
+        profile, snapshot = asyncio.run(
+            resolved_advisor.build_snapshot(
+                profile=profile,
+                observations=all_observations,
+                turn_id=None,
+                round_index=None,
+            )
+        )
+        runtime_state.imported_session_ids = sorted(imported_session_ids)
+        runtime_state.imported_observation_count += len(new_observations)
+        runtime_state.last_imported_at = imported_at
+        storage.save_workspace_profile(profile)
+        storage.save_advice_snapshot(snapshot)
+        storage.save_runtime_state(runtime_state)
+    else:
+        snapshot = storage.load_advice_snapshot() or AdviceSnapshot(workspace_id=workspace_id)
+        if sessions_imported:
+            # Checkpoints moved past non-admissible records only.
+            storage.save_runtime_state(runtime_state)
+
+    elapsed = time.perf_counter() - started_at
+    return SessionBackfillResult(
+        workspace_id=workspace_id,
+        state_dir=str(state_dir),
+        sessions_scanned=len(jobs),
+        sessions_imported=sessions_imported,
+        sessions_skipped=len(jobs) - sessions_imported,
+        records_processed=records_processed,
+        imported_observations=len(new_observations),
+        total_observations=len(all_observations),
+        workers=workers,
+        elapsed_seconds=round(elapsed, 6),
+        records_per_second=round(records_processed / elapsed, 3) if elapsed > 0 else 0.0,
+        policy_signal_count=len(profile.policy_signals),
+        feedback_event_count=len(profile.feedback_events),
+        directive_count=len(snapshot.directives),
+    )
+
+
+def _resolve_import_checkpoint(
+    runtime_state: RuntimeState, session_path: Path
+) -> SessionImportCheckpoint | None:
+    checkpoint = runtime_state.import_checkpoints.get(str(session_path))
+    if checkpoint is not None and checkpoint.offset > _transcript_extent(session_path):
+        # The transcript was rewritten or truncated; the old offset is meaningless.
+        return None
+    return checkpoint
+
+
+def _transcript_extent(path: Path) -> int:
+    """Upper bound for a valid checkpoint offset in `path`."""
+
+    if is_indexed_transcript(path):
+        return IndexedTranscriptReader(path).record_count
+    if path.name.endswith(".gz"):
+        size = gzip_uncompressed_size(path)
+        return sys.maxsize if size is None else size
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
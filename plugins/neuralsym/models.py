@@ -253,6 +253,16 @@ class ProviderResolutionInfo(NeuralSymBaseModel):
     available: bool = False
 
 
+class SessionImportCheckpoint(NeuralSymBaseModel):
+    """Resume point for incrementally importing one transcript."""
+
+    session_id: str | None = None
+    # Byte offset for JSONL transcripts, record number for indexed ones.
+    offset: int = Field(default=0, ge=0)
+    imported_records: int = Field(default=0, ge=0)
+    updated_at: float | None = None
+
+
 class RuntimeState(NeuralSymBaseModel):
     """Persisted runtime counters and provider resolution state."""
 
@@ -266,5 +276,6 @@ class RuntimeState(NeuralSymBaseModel):
     last_advice_refresh_at: float | None = None
     imported_session_ids: list[str] = Field(default_factory=list)
     imported_observation_count: int = 0
+    import_checkpoints: dict[str, SessionImportCheckpoint] = Field(default_factory=dict)
     last_imported_at: float | None = None
     resolution: ProviderResolutionInfo = Field(default_factory=ProviderResolutionInfo)
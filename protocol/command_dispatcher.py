@@ -10,6 +10,7 @@ from typing import Any
 AUTO_CONFIRM_ALIASES = {"/aa", "/auto-approve", "/autoapprove"}
 SIGNOFF_KEYWORDS = {"quit", "exit", "bye"}
 COMPACT_PROMPT_TEMPLATE_FILENAME = "compact_system_prompt.txt"
+ROLLING_COMPACT_PROMPT_TEMPLATE_FILENAME = "rolling_compact_prompt.txt"
 ORTHOCAL_BRIEFING_PROMPT_TEMPLATE_FILENAME = "orthocal_briefing_prompt.txt"
 SESSION_SIGNOFF_PROMPT_FILENAME = "session_signoff_prompt.txt"
 
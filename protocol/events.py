@@ -13,6 +13,7 @@ class EventTypes(str, Enum):
     WARNING = "warning"
     ERROR = "error"
     METRICS_UPDATED = "metrics_updated"
+    STARTUP_METRICS = "startup_metrics"
 
     # 2. Conversation Events (Downstream)
     STREAM_CHUNK = "stream_chunk"
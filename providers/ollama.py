@@ -79,7 +79,6 @@ class OllamaProvider(BaseProvider):
             # 3. Process the streaming response
             seen_tool_call_ids: Dict[str, int] = {}
             generated_tool_call_count = 0
-            pending_tool_requests: List[ToolRequest] = []
             tool_call_diagnostics: Dict[str, int] = {
                 "missing_id_generated": 0,
                 "duplicate_id_normalized": 0,
@@ -99,7 +98,8 @@ class OllamaProvider(BaseProvider):
                 if thinking:
                     yield ProviderSignal(type="thinking", data=thinking)
 
-                # Handle tool calls - buffer until stream completion
+                # Handle tool calls - Ollama delivers each call complete, so emit
+                # it right away and let the agent start read-only tools early.
                 if msg.tool_calls:
                     for tc in msg.tool_calls:
                         tool_name = self._extract_tool_call_name(tc)
@@ -164,15 +164,10 @@ class OllamaProvider(BaseProvider):
                             requires_confirmation=False,
                             metadata=tool_metadata,
                         )
-                        pending_tool_requests.append(req)
-
-                # Handle final metrics when done - emit buffered tool calls first
-                if chunk.done:
-                    # Emit all buffered tool calls before metrics
-                    for req in pending_tool_requests:
                         yield ProviderSignal(type="tool_call", data=req)
-                    pending_tool_requests.clear()
 
+                # Handle final metrics when done
+                if chunk.done:
                     metrics = {
                         "provider": "ollama",
                         "request_model": model_name,
@@ -188,10 +183,6 @@ class OllamaProvider(BaseProvider):
                     }
                     yield ProviderSignal(type="metrics", data=metrics)
 
-            # Defensive: flush any remaining tool calls if stream ended without chunk.done
-            for req in pending_tool_requests:
-                yield ProviderSignal(type="tool_call", data=req)
-
         except asyncio.CancelledError:
             if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("Ollama stream cancelled by caller.", exc_info=True)
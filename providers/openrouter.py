@@ -183,6 +183,23 @@ class OpenRouterProvider(BaseProvider):
                         for req in ready:
                             yield ProviderSignal(type="tool_call", data=req)
                         pending_tool_calls.clear()
+                    elif len(pending_tool_calls) > 1:
+                        # Fragments stream in index order: once a later call has
+                        # started, the earlier ones are complete and can run.
+                        newest = max(pending_tool_calls)
+                        complete = {
+                            index: pending_tool_calls.pop(index)
+                            for index in sorted(pending_tool_calls)
+                            if index < newest
+                        }
+                        ready, generated_tool_call_count = self._flush_ready_tool_calls(
+                            complete,
+                            seen_tool_call_ids=seen_tool_call_ids,
+                            generated_tool_call_count=generated_tool_call_count,
+                            diagnostics=telemetry["tool_call_diagnostics"],
+                        )
+                        for req in ready:
+                            yield ProviderSignal(type="tool_call", data=req)
 
             # Flush remaining calls at stream end (if provider omitted finish_reason).
             ready, generated_tool_call_count = self._flush_ready_tool_calls(
@@ -1,27 +1,65 @@
 #!/usr/bin/env python3
-"""Analyze session transcripts for common event-loop anomalies."""
+"""Analyze session transcripts for event-loop anomalies or latency and throughput."""
 
 from __future__ import annotations
 
 import argparse
 import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Allow direct execution via `python protocol_monk/scripts/...py` from the repo root.
+if __package__ in {None, ""}:
+    repo_root = Path(__file__).resolve().parents[2]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+
+from protocol_monk.utils.transcript_format import (
+    IndexedTranscriptReader,
+    is_indexed_transcript,
+    iter_transcript_records,
+    list_session_transcripts,
+)
+
+TOOL_LIFECYCLE_EVENTS = {
+    "tool_execution_start",
+    "tool_result",
+    "tool_execution_complete",
+}
+
+
+def _iter_records(
+    session_path: Path,
+    *,
+    event_types: Optional[Iterable[str]] = None,
+    turn_ids: Optional[Iterable[str]] = None,
+) -> Iterator[Dict[str, Any]]:
+    wanted_turns = set(turn_ids) if turn_ids else None
+    if is_indexed_transcript(session_path):
+        # Seek straight to the blocks holding the requested turns/event types.
+        yield from IndexedTranscriptReader(session_path).iter_records(
+            event_types=event_types, turn_ids=wanted_turns
+        )
+        return
+    for record in iter_transcript_records(session_path, event_types=event_types):
+        if (
+            wanted_turns is None
+            or str(_extract_field(record, "turn_id") or "") in wanted_turns
+        ):
+            yield record
 
 
-def _load_records(session_path: Path) -> List[Dict[str, Any]]:
-    records: List[Dict[str, Any]] = []
-    for line in session_path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            payload = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if isinstance(payload, dict):
-            records.append(payload)
-    return records
+def _load_records(
+    session_path: Path,
+    *,
+    event_types: Optional[Iterable[str]] = None,
+    turn_ids: Optional[Iterable[str]] = None,
+) -> List[Dict[str, Any]]:
+    return list(_iter_records(session_path, event_types=event_types, turn_ids=turn_ids))
 
 
 def _extract_field(record: Dict[str, Any], key: str) -> Any:
@@ -38,15 +76,31 @@ def _extract_field(record: Dict[str, Any], key: str) -> Any:
     return None
 
 
-def analyze_records(records: List[Dict[str, Any]]) -> Dict[str, Any]:
-    anomalies: List[Dict[str, Any]] = []
-    user_turns: Dict[str, int] = {}
-    responses_by_turn: Dict[str, int] = {}
-    anonymous_user_turns = 0
-    anonymous_responses = 0
-    lifecycle: Dict[Tuple[str, str, str], Dict[str, bool]] = {}
+class SessionAnomalyAnalyzer:
+    """
+    Single-pass anomaly detection over transcript records.
+
+    Per-turn bookkeeping (user input vs. response counts and tool lifecycles)
+    is checked and dropped as soon as the turn's status returns to idle, so
+    memory stays bounded by the turns still in flight rather than by the
+    length of the session.
+    """
+
+    def __init__(self) -> None:
+        self.record_count = 0
+        self.anomalies: List[Dict[str, Any]] = []
+        self.closed_turn_count = 0
+        self._user_turns: Dict[str, int] = {}
+        self._responses_by_turn: Dict[str, int] = {}
+        self._anonymous_user_turns = 0
+        self._anonymous_responses = 0
+        # turn_id -> (pass_id, tool_call_id) -> lifecycle flags
+        self._lifecycle: Dict[str, Dict[Tuple[str, str], Dict[str, bool]]] = {}
+
+    def feed(self, record: Dict[str, Any]) -> None:
+        index = self.record_count
+        self.record_count += 1
 
-    for index, record in enumerate(records):
         event_type = record.get("event_type")
         payload = record.get("payload")
         payload_dict = payload if isinstance(payload, dict) else {}
@@ -56,67 +110,22 @@ def analyze_records(records: List[Dict[str, Any]]) -> Dict[str, Any]:
 
         if event_type == "user_input_submitted":
             if turn_id:
-                user_turns[turn_id] = user_turns.get(turn_id, 0) + 1
+                self._user_turns[turn_id] = self._user_turns.get(turn_id, 0) + 1
             else:
-                anonymous_user_turns += 1
+                self._anonymous_user_turns += 1
 
         elif event_type == "response_complete":
             if turn_id:
-                responses_by_turn[turn_id] = responses_by_turn.get(turn_id, 0) + 1
-            else:
-                anonymous_responses += 1
-
-            tool_calls = payload_dict.get("tool_calls") or []
-            seen_ids = set()
-            for raw_tool_call in tool_calls:
-                if not isinstance(raw_tool_call, dict):
-                    continue
-                tool_name = str(raw_tool_call.get("name") or "").strip()
-                if not tool_name:
-                    anomalies.append(
-                        {
-                            "type": "malformed_tool_call_missing_name",
-                            "index": index,
-                            "turn_id": turn_id or None,
-                            "pass_id": pass_id or payload_dict.get("pass_id"),
-                            "tool_call_id": raw_tool_call.get("id")
-                            or raw_tool_call.get("call_id"),
-                            "metadata": raw_tool_call.get("metadata"),
-                        }
-                    )
-                call_id = (
-                    str(raw_tool_call.get("id") or raw_tool_call.get("call_id") or "")
-                    .strip()
-                )
-                if not call_id:
-                    continue
-                if call_id in seen_ids:
-                    anomalies.append(
-                        {
-                            "type": "duplicate_tool_ids_in_pass",
-                            "index": index,
-                            "turn_id": turn_id or None,
-                            "pass_id": pass_id or payload_dict.get("pass_id"),
-                            "tool_call_id": call_id,
-                        }
-                    )
-                seen_ids.add(call_id)
-
-            content = str(payload_dict.get("content") or "").strip()
-            has_tool_calls = bool(tool_calls)
-            if not content and not has_tool_calls:
-                anomalies.append(
-                    {
-                        "type": "empty_final_pass",
-                        "index": index,
-                        "turn_id": turn_id or None,
-                        "pass_id": pass_id or payload_dict.get("pass_id"),
-                    }
+                self._responses_by_turn[turn_id] = (
+                    self._responses_by_turn.get(turn_id, 0) + 1
                 )
+            else:
+                self._anonymous_responses += 1
+            self._check_response(index, turn_id, pass_id, payload_dict)
 
         elif event_type == "stream_chunk":
             if not pass_id:
-                anomalies.append(
+                self.anomalies.append(
                     {
                         "type": "stream_chunk_missing_pass_id",
                         "index": index,
@@ -124,24 +133,20 @@ def analyze_records(records: List[Dict[str, Any]]) -> Dict[str, Any]:
                     }
                 )
 
-        elif event_type in {
-            "tool_execution_start",
-            "tool_result",
-            "tool_execution_complete",
-        }:
+        elif event_type in TOOL_LIFECYCLE_EVENTS:
             if not tool_call_id:
-                anomalies.append(
+                self.anomalies.append(
                     {
                         "type": "tool_lifecycle_missing_tool_call_id",
                         "index": index,
                         "event_type": event_type,
                     }
                 )
-                continue
+                return
 
-            lifecycle_key = (turn_id or "", pass_id or "", tool_call_id)
-            state = lifecycle.setdefault(
-                lifecycle_key, {"start": False, "result": False, "complete": False}
+            state = self._lifecycle.setdefault(turn_id, {}).setdefault(
+                (pass_id, tool_call_id),
+                {"start": False, "result": False, "complete": False},
             )
             if event_type == "tool_execution_start":
                 state["start"] = True
@@ -150,119 +155,698 @@ def analyze_records(records: List[Dict[str, Any]]) -> Dict[str, Any]:
             elif event_type == "tool_execution_complete":
                 state["complete"] = True
 
-    for turn_id, count in user_turns.items():
-        response_count = responses_by_turn.get(turn_id, 0)
-        if response_count < count:
-            anomalies.append(
-                {
-                    "type": "user_turn_without_response_complete",
-                    "turn_id": turn_id,
-                    "missing_count": count - response_count,
-                }
-            )
+        elif event_type == "status_changed":
+            if turn_id and str(payload_dict.get("status") or "") == "idle":
+                self._close_turn(turn_id)
 
-    if anonymous_user_turns > anonymous_responses:
-        anomalies.append(
-            {
-                "type": "anonymous_turn_count_mismatch",
-                "missing_count": anonymous_user_turns - anonymous_responses,
-            }
-        )
+    def finish(self) -> Dict[str, Any]:
+        """Close every turn still open and return the analysis result."""
+        for turn_id in list(dict.fromkeys([*self._user_turns, *self._lifecycle])):
+            self._close_turn(turn_id, finished=False)
 
-    for (turn_id, pass_id, tool_call_id), state in lifecycle.items():
-        if state["start"] and not state["result"]:
-            anomalies.append(
+        if self._anonymous_user_turns > self._anonymous_responses:
+            self.anomalies.append(
                 {
-                    "type": "tool_lifecycle_missing_result",
-                    "turn_id": turn_id or None,
-                    "pass_id": pass_id or None,
-                    "tool_call_id": tool_call_id,
+                    "type": "anonymous_turn_count_mismatch",
+                    "missing_count": self._anonymous_user_turns
+                    - self._anonymous_responses,
                 }
             )
-        if state["start"] and not state["complete"]:
-            anomalies.append(
+
+        return {
+            "record_count": self.record_count,
+            "anomaly_count": len(self.anomalies),
+            "anomalies": self.anomalies,
+        }
+
+    def _check_response(
+        self,
+        index: int,
+        turn_id: str,
+        pass_id: str,
+        payload_dict: Dict[str, Any],
+    ) -> None:
+        tool_calls = payload_dict.get("tool_calls") or []
+        seen_ids = set()
+        for raw_tool_call in tool_calls:
+            if not isinstance(raw_tool_call, dict):
+                continue
+            tool_name = str(raw_tool_call.get("name") or "").strip()
+            if not tool_name:
+                self.anomalies.append(
+                    {
+                        "type": "malformed_tool_call_missing_name",
+                        "index": index,
+                        "turn_id": turn_id or None,
+                        "pass_id": pass_id or payload_dict.get("pass_id"),
+                        "tool_call_id": raw_tool_call.get("id")
+                        or raw_tool_call.get("call_id"),
+                        "metadata": raw_tool_call.get("metadata"),
+                    }
+                )
+            call_id = (
+                str(raw_tool_call.get("id") or raw_tool_call.get("call_id") or "")
+                .strip()
+            )
+            if not call_id:
+                continue
+            if call_id in seen_ids:
+                self.anomalies.append(
+                    {
+                        "type": "duplicate_tool_ids_in_pass",
+                        "index": index,
+                        "turn_id": turn_id or None,
+                        "pass_id": pass_id or payload_dict.get("pass_id"),
+                        "tool_call_id": call_id,
+                    }
+                )
+            seen_ids.add(call_id)
+
+        content = str(payload_dict.get("content") or "").strip()
+        if not content and not tool_calls:
+            self.anomalies.append(
                 {
-                    "type": "tool_lifecycle_missing_complete",
+                    "type": "empty_final_pass",
+                    "index": index,
                     "turn_id": turn_id or None,
-                    "pass_id": pass_id or None,
-                    "tool_call_id": tool_call_id,
+                    "pass_id": pass_id or payload_dict.get("pass_id"),
                 }
             )
-        if (state["result"] or state["complete"]) and not state["start"]:
-            anomalies.append(
+
+    def _close_turn(self, turn_id: str, *, finished: bool = True) -> None:
+        count = self._user_turns.pop(turn_id, 0)
+        response_count = self._responses_by_turn.pop(turn_id, 0)
+        if response_count < count:
+            self.anomalies.append(
                 {
-                    "type": "tool_lifecycle_missing_start",
-                    "turn_id": turn_id or None,
-                    "pass_id": pass_id or None,
-                    "tool_call_id": tool_call_id,
+                    "type": "user_turn_without_response_complete",
+                    "turn_id": turn_id,
+                    "missing_count": count - response_count,
                 }
             )
 
+        for (pass_id, tool_call_id), state in self._lifecycle.pop(turn_id, {}).items():
+            refs = {
+                "turn_id": turn_id or None,
+                "pass_id": pass_id or None,
+                "tool_call_id": tool_call_id,
+            }
+            if state["start"] and not state["result"]:
+                self.anomalies.append({"type": "tool_lifecycle_missing_result", **refs})
+            if state["start"] and not state["complete"]:
+                self.anomalies.append({"type": "tool_lifecycle_missing_complete", **refs})
+            if (state["result"] or state["complete"]) and not state["start"]:
+                self.anomalies.append({"type": "tool_lifecycle_missing_start", **refs})
+
+        if finished:
+            self.closed_turn_count += 1
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile of an already sorted, non-empty list."""
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return sorted_values[lower]
+    weight = rank - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+def summarize_latencies(samples_ms: Iterable[float]) -> Dict[str, Any]:
+    values = sorted(samples_ms)
+    if not values:
+        return {"count": 0}
     return {
-        "record_count": len(records),
-        "anomaly_count": len(anomalies),
-        "anomalies": anomalies,
+        "count": len(values),
+        "mean_ms": round(sum(values) / len(values), 3),
+        "p50_ms": round(_percentile(values, 50), 3),
+        "p90_ms": round(_percentile(values, 90), 3),
+        "p99_ms": round(_percentile(values, 99), 3),
+        "max_ms": round(values[-1], 3),
     }
 
 
-def _resolve_session_path(
+def _positive_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value) if value > 0 else None
+
+
+class SessionPerformanceAnalyzer:
+    """
+    Single-pass latency and throughput accounting over transcript records.
+
+    Passes are timed from THINKING_STARTED to the first STREAM_CHUNK (TTFT)
+    and to RESPONSE_COMPLETE (decode window). Tool latency comes from the
+    `duration` on TOOL_EXECUTION_COMPLETE, which excludes the confirmation
+    wait measured between TOOL_CONFIRMATION_REQUESTED and _SUBMITTED.
+    Like SessionAnomalyAnalyzer, a turn's open state is folded into a
+    summary row and dropped once its status returns to idle.
+    """
+
+    def __init__(self) -> None:
+        self.turns: List[Dict[str, Any]] = []
+        self.tool_samples_ms: Dict[str, List[float]] = {}
+        self._open_turns: Dict[str, Dict[str, Any]] = {}
+        # pass_id -> {"turn_id", "started", "first_chunk", "tokens_per_second"}
+        self._open_passes: Dict[str, Dict[str, Any]] = {}
+        # tool_call_id -> (turn_id, requested timestamp)
+        self._pending_confirmations: Dict[str, Tuple[str, float]] = {}
+
+    def feed(self, record: Dict[str, Any]) -> None:
+        event_type = record.get("event_type")
+        timestamp = record.get("timestamp")
+        if not isinstance(timestamp, (int, float)):
+            return
+        payload = record.get("payload")
+        payload_dict = payload if isinstance(payload, dict) else {}
+        turn_id = str(_extract_field(record, "turn_id") or "").strip()
+        pass_id = str(_extract_field(record, "pass_id") or "").strip()
+        tool_call_id = str(_extract_field(record, "tool_call_id") or "").strip()
+
+        if event_type == "user_input_submitted" and turn_id:
+            self._turn(turn_id, timestamp)
+
+        elif event_type == "thinking_started" and pass_id:
+            self._turn(turn_id, timestamp)["passes"] += 1
+            self._open_passes[pass_id] = {
+                "turn_id": turn_id,
+                "started": timestamp,
+                "first_chunk": None,
+                "tokens_per_second": None,
+            }
+
+        elif event_type == "stream_chunk":
+            state = self._open_passes.get(pass_id)
+            if state is not None and state["first_chunk"] is None:
+                state["first_chunk"] = timestamp
+                turn = self._turn(state["turn_id"], timestamp)
+                ttft_ms = (timestamp - state["started"]) * 1000
+                turn["ttft_ms"].append(ttft_ms)
+
+        elif event_type == "metrics_updated":
+            state = self._open_passes.get(pass_id)
+            usage = payload_dict.get("record")
+            if state is not None and isinstance(usage, dict):
+                state["tokens_per_second"] = _positive_number(
+                    usage.get("tokens_per_second")
+                )
+
+        elif event_type == "response_complete":
+            self._complete_pass(pass_id, turn_id, timestamp, payload_dict)
+
+        elif event_type == "tool_confirmation_requested" and tool_call_id:
+            self._pending_confirmations[tool_call_id] = (turn_id, timestamp)
+
+        elif event_type == "tool_confirmation_submitted" and tool_call_id:
+            pending = self._pending_confirmations.pop(tool_call_id, None)
+            if pending is not None:
+                owner_turn, requested = pending
+                self._turn(owner_turn, timestamp)["confirmation_wait_ms"] += (
+                    timestamp - requested
+                ) * 1000
+
+        elif event_type == "tool_execution_complete":
+            duration = payload_dict.get("duration")
+            if isinstance(duration, (int, float)) and not isinstance(duration, bool):
+                duration_ms = float(duration) * 1000
+                tool_name = str(payload_dict.get("tool_name") or "<unknown>")
+                self.tool_samples_ms.setdefault(tool_name, []).append(duration_ms)
+                turn = self._turn(turn_id, timestamp)
+                turn["tool_calls"] += 1
+                turn["tool_ms"] += duration_ms
+
+        elif event_type == "info":
+            if payload_dict.get("message") == "Preflight pruning applied":
+                data = payload_dict.get("data")
+                data = data if isinstance(data, dict) else {}
+                turn = self._turn(turn_id, timestamp)
+                turn["pruned_turn_chunks"] += int(data.get("pruned_turn_chunks") or 0)
+                elapsed_ms = _positive_number(data.get("elapsed_ms"))
+                if elapsed_ms is not None:
+                    turn["preflight_pruning_ms"] += elapsed_ms
+
+        elif event_type == "status_changed":
+            if turn_id and str(payload_dict.get("status") or "") == "idle":
+                self._close_turn(turn_id, timestamp)
+
+    def finish(self) -> Dict[str, Any]:
+        for turn_id in list(self._open_turns):
+            self._close_turn(turn_id, None)
+
+        passes = sum(turn["passes"] for turn in self.turns)
+        tokens = sum(turn["completion_tokens"] for turn in self.turns)
+        decode_seconds = sum(turn["decode_seconds"] for turn in self.turns)
+        ttft_samples = [turn["ttft_ms"] for turn in self.turns if turn["ttft_ms"] is not None]
+        return {
+            "turn_count": len(self.turns),
+            "pass_count": passes,
+            "ttft": summarize_latencies(ttft_samples),
+            "completion_tokens": tokens,
+            "tokens_per_second": (
+                round(tokens / decode_seconds, 3) if decode_seconds > 0 else None
+            ),
+            "confirmation_wait_ms": round(
+                sum(turn["confirmation_wait_ms"] for turn in self.turns), 3
+            ),
+            "preflight_pruning_ms": round(
+                sum(turn["preflight_pruning_ms"] for turn in self.turns), 3
+            ),
+            "tools": {
+                name: summarize_latencies(samples)
+                for name, samples in sorted(self.tool_samples_ms.items())
+            },
+            "turns": [self._turn_row(turn) for turn in self.turns],
+            "tool_samples_ms": self.tool_samples_ms,
+        }
+
+    def _turn(self, turn_id: str, timestamp: float) -> Dict[str, Any]:
+        turn = self._open_turns.get(turn_id)
+        if turn is None:
+            turn = {
+                "turn_id": turn_id or None,
+                "started": timestamp,
+                "ended": None,
+                "passes": 0,
+                "ttft_ms": [],
+                "completion_tokens": 0,
+                "decode_seconds": 0.0,
+                "tool_calls": 0,
+                "tool_ms": 0.0,
+                "confirmation_wait_ms": 0.0,
+                "preflight_pruning_ms": 0.0,
+                "pruned_turn_chunks": 0,
+            }
+            self._open_turns[turn_id] = turn
+        return turn
+
+    def _complete_pass(
+        self,
+        pass_id: str,
+        turn_id: str,
+        timestamp: float,
+        payload_dict: Dict[str, Any],
+    ) -> None:
+        state = self._open_passes.pop(pass_id, None)
+        if state is None:
+            return
+        turn = self._turn(state["turn_id"] or turn_id, timestamp)
+        tokens = payload_dict.get("completion_tokens")
+        if not isinstance(tokens, int) or isinstance(tokens, bool) or tokens <= 0:
+            return
+        turn["completion_tokens"] += tokens
+        # Prefer the provider's own eval timing; fall back to the stream window.
+        if state["tokens_per_second"]:
+            turn["decode_seconds"] += tokens / state["tokens_per_second"]
+        elif state["first_chunk"] is not None and timestamp > state["first_chunk"]:
+            turn["decode_seconds"] += timestamp - state["first_chunk"]
+
+    def _close_turn(self, turn_id: str, timestamp: Optional[float]) -> None:
+        turn = self._open_turns.pop(turn_id, None)
+        if turn is None:
+            return
+        turn["ended"] = timestamp
+        # Only the first pass's TTFT is what the user waited on.
+        turn["ttft_ms"] = turn["ttft_ms"][0] if turn["ttft_ms"] else None
+        for pass_id in [
+            key for key, state in self._open_passes.items() if state["turn_id"] == turn_id
+        ]:
+            del self._open_passes[pass_id]
+        for call_id in [
+            key
+            for key, (owner, _requested) in self._pending_confirmations.items()
+            if owner == turn_id
+        ]:
+            del self._pending_confirmations[call_id]
+        self.turns.append(turn)
+
+    @staticmethod
+    def _turn_row(turn: Dict[str, Any]) -> Dict[str, Any]:
+        def _ms(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value, 3)
+
+        return {
+            "turn_id": turn["turn_id"],
+            "duration_ms": (
+                None
+                if turn["ended"] is None
+                else _ms((turn["ended"] - turn["started"]) * 1000)
+            ),
+            "passes": turn["passes"],
+            "ttft_ms": _ms(turn["ttft_ms"]),
+            "completion_tokens": turn["completion_tokens"],
+            "tokens_per_second": (
+                round(turn["completion_tokens"] / turn["decode_seconds"], 3)
+                if turn["decode_seconds"] > 0
+                else None
+            ),
+            "tool_calls": turn["tool_calls"],
+            "tool_ms": _ms(turn["tool_ms"]),
+            "confirmation_wait_ms": _ms(turn["confirmation_wait_ms"]),
+            "preflight_pruning_ms": _ms(turn["preflight_pruning_ms"]),
+            "pruned_turn_chunks": turn["pruned_turn_chunks"],
+        }
+
+
+def analyze_records(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    analyzer = SessionAnomalyAnalyzer()
+    for record in records:
+        analyzer.feed(record)
+    return analyzer.finish()
+
+
+def analyze_session_file(
+    session_path: str | Path,
     *,
-    session: str | None,
-    workspace: str | None,
-    latest: bool,
-) -> Path:
-    if session:
-        return Path(session).expanduser().resolve()
+    event_types: Optional[List[str]] = None,
+    turn_ids: Optional[List[str]] = None,
+    performance: bool = False,
+) -> Dict[str, Any]:
+    """Stream one transcript through the analyzers; safe to run in a worker."""
+    path = Path(session_path)
+    anomalies = SessionAnomalyAnalyzer()
+    perf = SessionPerformanceAnalyzer() if performance else None
+    for record in _iter_records(path, event_types=event_types, turn_ids=turn_ids):
+        anomalies.feed(record)
+        if perf is not None:
+            perf.feed(record)
+    result = anomalies.finish()
+    result["session"] = str(path)
+    if perf is not None:
+        result["performance"] = perf.finish()
+    return result
+
+
+def _analyze_session_job(
+    job: Tuple[str, Optional[List[str]], Optional[List[str]], bool],
+) -> Dict[str, Any]:
+    session_path, event_types, turn_ids, performance = job
+    return analyze_session_file(
+        session_path,
+        event_types=event_types,
+        turn_ids=turn_ids,
+        performance=performance,
+    )
+
+
+def analyze_session_files(
+    session_paths: List[Path],
+    *,
+    event_types: Optional[List[str]] = None,
+    turn_ids: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    performance: bool = False,
+) -> List[Dict[str, Any]]:
+    """Analyze many transcripts, in a process pool when more than one worker fits."""
+    jobs = [(str(path), event_types, turn_ids, performance) for path in session_paths]
+    worker_count = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+    if worker_count == 1:
+        return [_analyze_session_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        return list(executor.map(_analyze_session_job, jobs))
+
+
+def aggregate_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    counts_by_type: Dict[str, int] = {}
+    for result in results:
+        for anomaly in result["anomalies"]:
+            counts_by_type[anomaly["type"]] = counts_by_type.get(anomaly["type"], 0) + 1
+    report = {
+        "session_count": len(results),
+        "record_count": sum(result["record_count"] for result in results),
+        "anomaly_count": sum(result["anomaly_count"] for result in results),
+        "anomaly_counts_by_type": dict(
+            sorted(counts_by_type.items(), key=lambda item: (-item[1], item[0]))
+        ),
+        "sessions": results,
+    }
+    if any("performance" in result for result in results):
+        report["performance"] = aggregate_performance(
+            [result["performance"] for result in results if "performance" in result]
+        )
+    return report
+
+
+def aggregate_performance(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge per-session performance reports, pooling raw samples for percentiles."""
+    tool_samples: Dict[str, List[float]] = {}
+    for report in reports:
+        for name, samples in report.get("tool_samples_ms", {}).items():
+            tool_samples.setdefault(name, []).extend(samples)
+    turns = [turn for report in reports for turn in report["turns"]]
+    tokens = sum(report["completion_tokens"] for report in reports)
+    decode_seconds = sum(
+        report["completion_tokens"] / report["tokens_per_second"]
+        for report in reports
+        if report["tokens_per_second"]
+    )
+    return {
+        "turn_count": len(turns),
+        "pass_count": sum(report["pass_count"] for report in reports),
+        "ttft": summarize_latencies(
+            turn["ttft_ms"] for turn in turns if turn["ttft_ms"] is not None
+        ),
+        "completion_tokens": tokens,
+        "tokens_per_second": (
+            round(tokens / decode_seconds, 3) if decode_seconds > 0 else None
+        ),
+        "confirmation_wait_ms": round(
+            sum(report["confirmation_wait_ms"] for report in reports), 3
+        ),
+        "preflight_pruning_ms": round(
+            sum(report["preflight_pruning_ms"] for report in reports), 3
+        ),
+        "tools": {
+            name: summarize_latencies(samples)
+            for name, samples in sorted(tool_samples.items())
+        },
+    }
+
+
+def _drop_raw_samples(results: List[Dict[str, Any]]) -> None:
+    """Raw per-call samples are only needed for merging; keep them out of output."""
+    for result in results:
+        if "performance" in result:
+            result["performance"].pop("tool_samples_ms", None)
+
 
+def _resolve_sessions_dir(workspace: str | None) -> Path:
     workspace_root = Path(workspace or Path.cwd()).expanduser().resolve()
     sessions_dir = workspace_root / ".protocol_monk" / "sessions"
     if not sessions_dir.exists():
         raise FileNotFoundError(f"Session directory not found: {sessions_dir}")
+    return sessions_dir
 
-    candidates = sorted(
-        sessions_dir.glob("*.jsonl"),
-        key=lambda path: path.stat().st_mtime if path.exists() else 0,
-        reverse=True,
-    )
+
+def _resolve_session_paths(
+    *,
+    sessions: List[str] | None,
+    workspace: str | None,
+    all_sessions: bool,
+) -> List[Path]:
+    if sessions:
+        return [Path(session).expanduser().resolve() for session in sessions]
+
+    sessions_dir = _resolve_sessions_dir(workspace)
+    candidates = list_session_transcripts(sessions_dir)
     if not candidates:
         raise FileNotFoundError(f"No session files found in {sessions_dir}")
 
-    if latest or not session:
-        return candidates[0]
-    return candidates[0]
+    if all_sessions:
+        return candidates
+    return candidates[:1]
+
+
+def _print_session_result(result: Dict[str, Any]) -> None:
+    print(f"Session: {result['session']}")
+    print(f"Records: {result['record_count']}")
+    print(f"Anomalies: {result['anomaly_count']}")
+    for anomaly in result["anomalies"]:
+        print(f"- {anomaly['type']}: {json.dumps(anomaly, ensure_ascii=False)}")
+
+
+def _print_aggregate(report: Dict[str, Any]) -> None:
+    for result in report["sessions"]:
+        print(
+            f"{result['anomaly_count']:>6}  {result['record_count']:>9}  "
+            f"{result['session']}"
+        )
+    print(
+        f"Sessions: {report['session_count']}  Records: {report['record_count']}  "
+        f"Anomalies: {report['anomaly_count']}"
+    )
+    for anomaly_type, count in report["anomaly_counts_by_type"].items():
+        print(f"- {anomaly_type}: {count}")
+
+
+def _fmt(value: Any, spec: str = ".1f") -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def _print_performance(report: Dict[str, Any]) -> None:
+    turns = report.get("turns")
+    if turns:
+        header = (
+            f"{'turn':<14} {'total ms':>10} {'passes':>6} {'ttft ms':>9} "
+            f"{'tok/s':>8} {'tools':>5} {'tool ms':>9} {'confirm ms':>10} "
+            f"{'prune ms':>9}"
+        )
+        print(header)
+        print("-" * len(header))
+        for turn in turns:
+            print(
+                f"{str(turn['turn_id'] or '-')[:14]:<14} "
+                f"{_fmt(turn['duration_ms']):>10} "
+                f"{turn['passes']:>6} "
+                f"{_fmt(turn['ttft_ms']):>9} "
+                f"{_fmt(turn['tokens_per_second']):>8} "
+                f"{turn['tool_calls']:>5} "
+                f"{_fmt(turn['tool_ms']):>9} "
+                f"{_fmt(turn['confirmation_wait_ms']):>10} "
+                f"{_fmt(turn['preflight_pruning_ms']):>9}"
+            )
+        print()
+
+    if report["tools"]:
+        header = (
+            f"{'tool':<24} {'calls':>6} {'p50 ms':>9} {'p90 ms':>9} "
+            f"{'p99 ms':>9} {'max ms':>9}"
+        )
+        print(header)
+        print("-" * len(header))
+        for name, stats in report["tools"].items():
+            print(
+                f"{name[:24]:<24} {stats['count']:>6} "
+                f"{_fmt(stats.get('p50_ms')):>9} {_fmt(stats.get('p90_ms')):>9} "
+                f"{_fmt(stats.get('p99_ms')):>9} {_fmt(stats.get('max_ms')):>9}"
+            )
+        print()
+
+    ttft = report["ttft"]
+    print(f"Turns: {report['turn_count']}  Passes: {report['pass_count']}")
+    print(
+        f"TTFT ms: p50 {_fmt(ttft.get('p50_ms'))}  p90 {_fmt(ttft.get('p90_ms'))}  "
+        f"max {_fmt(ttft.get('max_ms'))}"
+    )
+    print(
+        f"Completion tokens: {report['completion_tokens']}  "
+        f"tokens/sec: {_fmt(report['tokens_per_second'])}"
+    )
+    print(f"Confirmation wait ms: {_fmt(report['confirmation_wait_ms'])}")
+    print(f"Preflight pruning ms: {_fmt(report['preflight_pruning_ms'])}")
+
+
+def _performance_view(result: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "session": result["session"],
+        "record_count": result["record_count"],
+        "performance": result["performance"],
+    }
 
 
 def main(argv: List[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--latest", action="store_true", help="Analyze latest session file")
-    parser.add_argument("--session", type=str, help="Path to a specific session JSONL file")
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        dest="all_sessions",
+        help="Analyze every transcript in the workspace and aggregate the report",
+    )
+    parser.add_argument(
+        "--session",
+        action="append",
+        dest="sessions",
+        help=(
+            "Path to a session transcript (.jsonl, .jsonl.gz or .blocks); "
+            "repeat to aggregate several"
+        ),
+    )
     parser.add_argument(
         "--workspace",
         type=str,
         help="Workspace root containing .protocol_monk/sessions",
     )
+    parser.add_argument(
+        "--event-type",
+        action="append",
+        dest="event_types",
+        help="Only analyze records of this event type (repeatable)",
+    )
+    parser.add_argument(
+        "--turn",
+        action="append",
+        dest="turn_ids",
+        help="Only analyze records correlated with this turn_id (repeatable)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes when analyzing several transcripts (default: CPU count)",
+    )
+    parser.add_argument(
+        "--perf",
+        action="store_true",
+        help=(
+            "Report time-to-first-token, tokens/sec, tool latency percentiles, "
+            "confirmation wait and preflight pruning time instead of anomalies"
+        ),
+    )
     parser.add_argument("--json", action="store_true", help="Emit machine-readable JSON")
     args = parser.parse_args(argv)
 
-    session_path = _resolve_session_path(
-        session=args.session,
+    session_paths = _resolve_session_paths(
+        sessions=args.sessions,
         workspace=args.workspace,
-        latest=args.latest,
+        all_sessions=args.all_sessions,
+    )
+    results = analyze_session_files(
+        session_paths,
+        event_types=args.event_types,
+        turn_ids=args.turn_ids,
+        workers=args.workers,
+        performance=args.perf,
     )
-    records = _load_records(session_path)
-    result = analyze_records(records)
-    result["session"] = str(session_path)
 
+    if args.perf:
+        report = aggregate_results(results) if len(results) > 1 else None
+        _drop_raw_samples(results)
+        if report is None:
+            if args.json:
+                print(json.dumps(_performance_view(results[0]), ensure_ascii=False, indent=2))
+            else:
+                print(f"Session: {results[0]['session']}")
+                _print_performance(results[0]["performance"])
+            return 0
+        output = {
+            "session_count": report["session_count"],
+            "record_count": report["record_count"],
+            "performance": report["performance"],
+            "sessions": [_performance_view(result) for result in results],
+        }
+        if args.json:
+            print(json.dumps(output, ensure_ascii=False, indent=2))
+        else:
+            print(f"Sessions: {report['session_count']}")
+            _print_performance(report["performance"])
+        return 0
+
+    if len(results) == 1:
+        result = results[0]
+        if args.json:
+            print(json.dumps(result, ensure_ascii=False, indent=2))
+        else:
+            _print_session_result(result)
+        return 0 if result["anomaly_count"] == 0 else 1
+
+    report = aggregate_results(results)
     if args.json:
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        print(json.dumps(report, ensure_ascii=False, indent=2))
     else:
-        print(f"Session: {session_path}")
-        print(f"Records: {result['record_count']}")
-        print(f"Anomalies: {result['anomaly_count']}")
-        for anomaly in result["anomalies"]:
-            print(f"- {anomaly['type']}: {json.dumps(anomaly, ensure_ascii=False)}")
-
-    return 0 if result["anomaly_count"] == 0 else 1
+        _print_aggregate(report)
+    return 0 if report["anomaly_count"] == 0 else 1
 
 
 if __name__ == "__main__":
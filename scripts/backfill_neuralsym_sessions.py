@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Backfill NeuralSym workspace state from many session transcripts at once."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from protocol_monk.plugins.neuralsym.importer import backfill_sessions_to_workspace_state
+from protocol_monk.utils.transcript_format import list_session_transcripts
+
+
+def _resolve_session_paths(
+    *,
+    sessions: list[str] | None,
+    session_workspace: str | None,
+) -> list[Path]:
+    if sessions:
+        return [Path(session).expanduser().resolve() for session in sessions]
+
+    workspace_root = Path(session_workspace or Path.cwd()).expanduser().resolve()
+    sessions_dir = workspace_root / ".protocol_monk" / "sessions"
+    if not sessions_dir.exists():
+        raise FileNotFoundError(f"Session directory not found: {sessions_dir}")
+
+    candidates = list_session_transcripts(sessions_dir)
+    if not candidates:
+        raise FileNotFoundError(f"No session files found in {sessions_dir}")
+    # Oldest first, so a partial run leaves the earliest history imported.
+    return list(reversed(candidates))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--session",
+        action="append",
+        dest="sessions",
+        help="Specific session transcript to include (repeatable)",
+    )
+    parser.add_argument(
+        "--session-workspace",
+        type=str,
+        help="Workspace root containing .protocol_monk/sessions (default: cwd)",
+    )
+    parser.add_argument(
+        "--workspace",
+        type=str,
+        required=True,
+        help="Workspace root that should receive the NeuralSym state",
+    )
+    parser.add_argument(
+        "--state-dirname",
+        type=str,
+        default=".protocol_monk/neuralsym",
+        help="Workspace-local NeuralSym state directory",
+    )
+    parser.add_argument(
+        "--advice-token-budget",
+        type=int,
+        default=256,
+        help="Advisory token budget recorded in mission-control input",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for parsing transcripts (default: CPU count)",
+    )
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable JSON")
+    args = parser.parse_args(argv)
+
+    session_paths = _resolve_session_paths(
+        sessions=args.sessions,
+        session_workspace=args.session_workspace,
+    )
+    result = backfill_sessions_to_workspace_state(
+        session_paths=session_paths,
+        workspace_root=args.workspace,
+        state_dirname=args.state_dirname,
+        advice_token_budget=args.advice_token_budget,
+        max_workers=args.workers,
+    )
+
+    if args.json:
+        print(result.model_dump_json(indent=2))
+    else:
+        print(f"Workspace: {args.workspace}")
+        print(f"State dir: {result.state_dir}")
+        print(
+            f"Sessions: {result.sessions_scanned} scanned, "
+            f"{result.sessions_imported} imported, {result.sessions_skipped} skipped"
+        )
+        print(f"Records processed: {result.records_processed}")
+        print(f"Imported observations: {result.imported_observations}")
+        print(f"Total observations: {result.total_observations}")
+        print(
+            f"Throughput: {result.records_per_second:.1f} records/sec "
+            f"({result.elapsed_seconds:.2f}s, {result.workers} worker(s))"
+        )
+        print(f"Policy signals: {result.policy_signal_count}")
+        print(f"Feedback events: {result.feedback_event_count}")
+        print(f"Directives: {result.directive_count}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
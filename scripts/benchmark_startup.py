@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Benchmark headless Protocol Monk startup against a stub provider.
+
+Each run boots the runtime (settings, model map, provider check, tool
+registry, agent wiring) without the wizard, boot animation or UI, and reads
+the startup trace that `main.run_session_app` records. By default every run
+is a fresh interpreter so import costs are included.
+
+Usage examples:
+  python -m protocol_monk.scripts.benchmark_startup --runs 10
+  python -m protocol_monk.scripts.benchmark_startup --runs 20 --in-process --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+# Allow direct execution via `python protocol_monk/scripts/...py` from the repo root.
+if __package__ in {None, ""}:
+    repo_root = Path(__file__).resolve().parents[2]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+
+from protocol_monk import main as app_main
+from protocol_monk.agent.structs import Message, ProviderSignal
+from protocol_monk.providers.base import BaseProvider
+from protocol_monk.utils.startup_profile import StartupProfiler
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+class StubProvider(BaseProvider):
+    """Provider that is always ready and never streams anything."""
+
+    def __init__(self, settings: Any):
+        self.settings = settings
+
+    def build_request_payload(
+        self,
+        messages: List[Message],
+        model_name: str,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        return {"model": model_name, "messages": [], "tools": tools or []}
+
+    async def stream_chat(
+        self,
+        messages: List[Message],
+        model_name: str,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[ProviderSignal]:
+        return
+        yield  # pragma: no cover - makes this an async generator
+
+    async def validate_connection(self) -> bool:
+        return True
+
+
+def _percentile(values: List[float], percent: float) -> Optional[float]:
+    """Nearest-rank percentile."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+async def _boot_once(provider: str, *, cold: bool) -> Dict[str, Any]:
+    # Cold runs anchor at the start of main's imports; warm runs at "now".
+    profiler = app_main.build_startup_profiler() if cold else StartupProfiler()
+    settings = app_main.load_settings(app_main.APP_ROOT)
+    with tempfile.TemporaryDirectory(prefix="monk-startup-bench-") as workspace:
+        settings.apply_session_choices(provider=provider, workspace=workspace)
+        if provider == "openrouter" and not settings.openrouter_api_key:
+            # Only the stub provider sees this key; it satisfies the readiness check.
+            settings.openrouter_api_key = "benchmark-stub"
+        exit_code = await app_main.run_session_app(
+            settings,
+            skip_wizard=True,
+            requested_ui_backend="cli",
+            profiler=profiler,
+            provider_factory=StubProvider,
+            headless=True,
+        )
+    metrics = profiler.to_dict()
+    metrics["exit_code"] = exit_code
+    return metrics
+
+
+def _run_child(provider: str) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "protocol_monk.scripts.benchmark_startup",
+            "--child",
+            "--provider",
+            provider,
+        ],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    lines = [line for line in completed.stdout.splitlines() if line.strip()]
+    if completed.returncode != 0 or not lines:
+        raise RuntimeError(
+            f"Startup benchmark child failed ({completed.returncode}): "
+            f"{completed.stderr.strip()[-2000:]}"
+        )
+    return json.loads(lines[-1])
+
+
+def summarize_runs(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate per-run startup metrics into p50/p95 per phase."""
+    series: Dict[str, List[float]] = {"time_to_ready_ms": [], "import_ms": []}
+    for run in runs:
+        for key in ("time_to_ready_ms", "import_ms"):
+            if isinstance(run.get(key), (int, float)):
+                series[key].append(float(run[key]))
+        for phase in run.get("phases", []):
+            if phase.get("background") or phase.get("duration_ms") is None:
+                continue
+            series.setdefault(f"phase:{phase['name']}", []).append(
+                float(phase["duration_ms"])
+            )
+
+    return {
+        "runs": len(runs),
+        "failed_runs": sum(1 for run in runs if run.get("exit_code") != 0),
+        "metrics": {
+            name: {
+                "count": len(values),
+                "p50_ms": _percentile(values, 50),
+                "p95_ms": _percentile(values, 95),
+                "max_ms": max(values) if values else None,
+            }
+            for name, values in series.items()
+        },
+    }
+
+
+def _print_summary(summary: Dict[str, Any], *, mode: str) -> None:
+    print(f"Startup benchmark: {summary['runs']} run(s), {mode}")
+    if summary["failed_runs"]:
+        print(f"Failed runs: {summary['failed_runs']}")
+    name_width = max(len(name) for name in summary["metrics"]) if summary["metrics"] else 10
+    print(f"{'metric':<{name_width}}  {'p50 ms':>10}  {'p95 ms':>10}  {'max ms':>10}")
+    for name, stats in summary["metrics"].items():
+        cells = [
+            "-" if stats[key] is None else f"{stats[key]:.1f}"
+            for key in ("p50_ms", "p95_ms", "max_ms")
+        ]
+        print(f"{name:<{name_width}}  {cells[0]:>10}  {cells[1]:>10}  {cells[2]:>10}")
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10, help="Number of boot runs")
+    parser.add_argument(
+        "--provider",
+        choices=["openrouter", "ollama"],
+        default="openrouter",
+        help=(
+            "Model-map path to exercise. openrouter reads the curated local map; "
+            "ollama performs live model discovery."
+        ),
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Reuse one interpreter (warm imports) instead of a fresh process per run.",
+    )
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable JSON")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(asyncio.run(_boot_once(args.provider, cold=True))))
+        return 0
+
+    runs: List[Dict[str, Any]] = []
+    for _ in range(max(1, args.runs)):
+        if args.in_process:
+            runs.append(asyncio.run(_boot_once(args.provider, cold=False)))
+        else:
+            runs.append(_run_child(args.provider))
+
+    summary = summarize_runs(runs)
+    mode = "in-process" if args.in_process else "fresh process per run"
+    if args.json:
+        print(json.dumps({"mode": mode, **summary}, indent=2))
+    else:
+        _print_summary(summary, mode=mode)
+    return 0 if summary["failed_runs"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
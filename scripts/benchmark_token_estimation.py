@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Benchmark SmartTokenEstimator throughput on code, JSON and prose corpora.
+
+Each corpus is a list of documents (one per file, or synthesized for JSON)
+estimated one at a time, the way the context coordinator estimates messages.
+`cold` uses a fresh estimator per run; `warm` re-estimates the same documents
+so every lookup is a memo hit; `rescan` re-estimates edited copies, which miss
+the whole-text memo but reuse the word and line memos.
+
+Usage examples:
+  python -m protocol_monk.scripts.benchmark_token_estimation
+  python -m protocol_monk.scripts.benchmark_token_estimation \\
+      --corpus logs=/tmp/tool_output.txt --runs 5 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Allow direct execution via `python protocol_monk/scripts/...py` from the repo root.
+if __package__ in {None, ""}:
+    repo_root = Path(__file__).resolve().parents[2]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+
+from protocol_monk.utils.token_estimation import SmartTokenEstimator
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _read_documents(paths: List[Path]) -> List[str]:
+    documents = []
+    for path in paths:
+        try:
+            documents.append(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError):
+            continue
+    return [document for document in documents if document]
+
+
+def _code_corpus() -> List[str]:
+    return _read_documents(sorted(PACKAGE_ROOT.rglob("*.py")))
+
+
+def _prose_corpus() -> List[str]:
+    return _read_documents(sorted(PACKAGE_ROOT.rglob("*.md")))
+
+
+def _json_corpus(count: int = 400) -> List[str]:
+    """Tool-result shaped JSON documents, plus any JSON files shipped in the tree."""
+    rng = random.Random(7)
+    words = "alpha beta gamma delta path value status result line error token".split()
+    documents = _read_documents(sorted(PACKAGE_ROOT.rglob("*.json")))
+    for index in range(count):
+        rows = [
+            {
+                "id": rng.randint(0, 10**6),
+                "name": " ".join(rng.choices(words, k=rng.randint(1, 6))),
+                "path": "/".join(rng.choices(words, k=3)) + ".py",
+                "ok": rng.random() > 0.2,
+                "score": round(rng.random() * 100, 3),
+            }
+            for _ in range(rng.randint(5, 60))
+        ]
+        documents.append(
+            json.dumps({"tool": "search", "call": index, "rows": rows}, indent=2)
+        )
+    return documents
+
+
+def _edited(documents: List[str]) -> List[str]:
+    return [f"{document}\n# edit {index}" for index, document in enumerate(documents)]
+
+
+def _time_pass(estimate: Callable[[str], int], documents: List[str]) -> float:
+    started = time.perf_counter()
+    for document in documents:
+        estimate(document)
+    return time.perf_counter() - started
+
+
+def benchmark_corpus(
+    documents: List[str], *, model_family: str, runs: int
+) -> Dict[str, Any]:
+    total_bytes = sum(len(document.encode("utf-8")) for document in documents)
+    megabytes = total_bytes / (1024 * 1024)
+    timings: Dict[str, List[float]] = {"cold": [], "warm": [], "rescan": []}
+    tokens = 0
+    for _ in range(max(1, runs)):
+        estimator = SmartTokenEstimator(model_family)
+        timings["cold"].append(_time_pass(estimator.estimate_tokens, documents))
+        timings["warm"].append(_time_pass(estimator.estimate_tokens, documents))
+        edited = _edited(documents)
+        timings["rescan"].append(_time_pass(estimator.estimate_tokens, edited))
+        tokens = sum(estimator.estimate_tokens(document) for document in documents)
+
+    result: Dict[str, Any] = {
+        "documents": len(documents),
+        "bytes": total_bytes,
+        "estimated_tokens": tokens,
+    }
+    for mode, samples in timings.items():
+        seconds = statistics.median(samples)
+        result[f"{mode}_ms"] = round(seconds * 1000, 3)
+        result[f"{mode}_mb_per_s"] = round(megabytes / seconds, 2) if seconds else None
+    return result
+
+
+def _print_table(results: Dict[str, Dict[str, Any]]) -> None:
+    header = (
+        f"{'corpus':<10} {'docs':>6} {'KiB':>9} {'tokens':>9} "
+        f"{'cold MB/s':>10} {'warm MB/s':>10} {'rescan MB/s':>12}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, row in results.items():
+        print(
+            f"{name[:10]:<10} {row['documents']:>6} {row['bytes'] / 1024:>9.1f} "
+            f"{row['estimated_tokens']:>9} {row['cold_mb_per_s']:>10} "
+            f"{row['warm_mb_per_s']:>10} {row['rescan_mb_per_s']:>12}"
+        )
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--corpus",
+        action="append",
+        default=[],
+        metavar="NAME=PATH",
+        help="Extra corpus: a file, or a directory whose files are documents (repeatable)",
+    )
+    parser.add_argument("--model-family", default="qwen", help="Estimator rule set")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per corpus (median)")
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable JSON")
+    args = parser.parse_args(argv)
+
+    corpora: Dict[str, List[str]] = {
+        "code": _code_corpus(),
+        "json": _json_corpus(),
+        "prose": _prose_corpus(),
+    }
+    for spec in args.corpus:
+        name, _, raw_path = spec.partition("=")
+        path = Path(raw_path or name).expanduser()
+        files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+        corpora[name if raw_path else path.stem] = _read_documents(files)
+
+    results = {
+        name: benchmark_corpus(
+            documents, model_family=args.model_family, runs=args.runs
+        )
+        for name, documents in corpora.items()
+        if documents
+    }
+
+    if args.json:
+        print(json.dumps({"model_family": args.model_family, "results": results}, indent=2))
+    else:
+        _print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
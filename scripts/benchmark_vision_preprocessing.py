@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Benchmark vision payload size and latency across image preprocessing settings.
+
+For each image and each max-edge setting this measures preprocessing time and
+the bytes that would be sent to the vision model. With `--live` it also calls
+the configured Ollama vision helper (result cache disabled) and records
+end-to-end latency, so size can be compared against prefill cost.
+
+Usage examples:
+  python -m protocol_monk.scripts.benchmark_vision_preprocessing screenshot.png
+  python -m protocol_monk.scripts.benchmark_vision_preprocessing scan.png \\
+      --max-edge 0 --max-edge 2048 --max-edge 1024 --live --runs 3 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Allow direct execution via `python protocol_monk/scripts/...py` from the repo root.
+if __package__ in {None, ""}:
+    repo_root = Path(__file__).resolve().parents[2]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+
+from protocol_monk.tools.document_operations.image_preprocessing import (
+    VISION_IMAGE_FORMATS,
+    prepare_vision_image,
+)
+
+DEFAULT_MAX_EDGES = [0, 2048, 1568, 1024, 768]
+# Larger than any real image; stands in for "send the original".
+UNBOUNDED_EDGE = 1 << 30
+
+
+def _measure_preprocessing(
+    image_bytes: bytes, *, max_edge: int, image_format: str, quality: int
+) -> Dict[str, Any]:
+    started = time.perf_counter()
+    prepared = prepare_vision_image(
+        image_bytes,
+        max_edge=max_edge or UNBOUNDED_EDGE,
+        image_format="original" if max_edge == 0 else image_format,
+        quality=quality,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return {
+        **prepared.to_metadata(),
+        "base64_bytes": (prepared.sent_bytes + 2) // 3 * 4,
+        "preprocess_ms": round(elapsed_ms, 3),
+    }
+
+
+async def _measure_live(
+    image_path: Path,
+    *,
+    max_edge: int,
+    image_format: str,
+    quality: int,
+    runs: int,
+) -> Dict[str, Any]:
+    from protocol_monk.config.settings import load_settings
+    from protocol_monk.tools.document_operations.vision_helper_service import (
+        VisionHelperService,
+    )
+
+    settings = load_settings(Path(__file__).resolve().parents[1])
+    settings.document_vision_cache_enabled = False
+    settings.document_vision_max_edge = max_edge or UNBOUNDED_EDGE
+    settings.document_vision_image_format = (
+        "original" if max_edge == 0 else image_format
+    )
+    settings.document_vision_image_quality = quality
+    service = VisionHelperService(settings)
+
+    latencies: List[float] = []
+    for _ in range(max(1, runs)):
+        started = time.perf_counter()
+        await service.analyze_image(
+            image_path,
+            purpose="Describe this image faithfully and transcribe visible text.",
+        )
+        latencies.append((time.perf_counter() - started) * 1000)
+    return {
+        "latency_ms_median": round(statistics.median(latencies), 3),
+        "latency_ms_min": round(min(latencies), 3),
+        "latency_ms_max": round(max(latencies), 3),
+    }
+
+
+def _print_table(results: List[Dict[str, Any]]) -> None:
+    header = (
+        f"{'image':<28} {'max_edge':>8} {'size':>11} {'sent KiB':>9} "
+        f"{'orig KiB':>9} {'prep ms':>8} {'latency ms':>11}"
+    )
+    print(header)
+    print("-" * len(header))
+    for row in results:
+        size = row.get("sent_size")
+        size_text = f"{size[0]}x{size[1]}" if size else "-"
+        latency = row.get("latency_ms_median")
+        print(
+            f"{Path(row['image']).name[:28]:<28} "
+            f"{row['max_edge'] or 'orig':>8} "
+            f"{size_text:>11} "
+            f"{row['sent_bytes'] / 1024:>9.1f} "
+            f"{row['original_bytes'] / 1024:>9.1f} "
+            f"{row['preprocess_ms']:>8.1f} "
+            f"{'-' if latency is None else f'{latency:.1f}':>11}"
+        )
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("images", nargs="+", help="Image or PDF files to measure")
+    parser.add_argument(
+        "--max-edge",
+        type=int,
+        action="append",
+        dest="max_edges",
+        help="Max edge in pixels to test (repeatable; 0 sends the original bytes)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=[fmt for fmt in VISION_IMAGE_FORMATS if fmt != "original"],
+        default="jpeg",
+        help="Re-encode format",
+    )
+    parser.add_argument("--quality", type=int, default=85, help="Encoder quality")
+    parser.add_argument(
+        "--pdf-page",
+        type=int,
+        default=1,
+        help="Page to rasterize when an input is a PDF",
+    )
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Also call the configured vision model and record latency",
+    )
+    parser.add_argument("--runs", type=int, default=1, help="Live calls per setting")
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable JSON")
+    args = parser.parse_args(argv)
+
+    max_edges = args.max_edges or DEFAULT_MAX_EDGES
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="monk-vision-bench-") as temp_dir:
+        for raw_path in args.images:
+            image_path = Path(raw_path).expanduser().resolve()
+            if image_path.suffix.lower() == ".pdf":
+                image_path = _rasterize_pdf_page(
+                    image_path, page_number=args.pdf_page, temp_root=Path(temp_dir)
+                )
+            image_bytes = image_path.read_bytes()
+            for max_edge in max_edges:
+                row: Dict[str, Any] = {"image": str(raw_path), "max_edge": max_edge}
+                row.update(
+                    _measure_preprocessing(
+                        image_bytes,
+                        max_edge=max_edge,
+                        image_format=args.format,
+                        quality=args.quality,
+                    )
+                )
+                if args.live:
+                    row.update(
+                        asyncio.run(
+                            _measure_live(
+                                image_path,
+                                max_edge=max_edge,
+                                image_format=args.format,
+                                quality=args.quality,
+                                runs=args.runs,
+                            )
+                        )
+                    )
+                results.append(row)
+
+    if args.json:
+        print(json.dumps({"format": args.format, "results": results}, indent=2))
+    else:
+        _print_table(results)
+    return 0
+
+
+def _rasterize_pdf_page(path: Path, *, page_number: int, temp_root: Path) -> Path:
+    """Render a PDF page the same way read_pdf does before vision fallback."""
+    import fitz
+
+    document = fitz.open(path)
+    try:
+        page = document.load_page(max(0, page_number - 1))
+        rendered_path = temp_root / f"{path.stem}_page_{page_number}.png"
+        page.get_pixmap(alpha=False).save(rendered_path)
+        return rendered_path
+    finally:
+        document.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -72,6 +72,20 @@ def _parse_args() -> argparse.Namespace:
         default=20,
         help="HTTP timeout in seconds.",
     )
+    parser.add_argument(
+        "--catalog-cache",
+        default="",
+        help=(
+            "Catalog cache path used for ETag/Last-Modified revalidation. "
+            "Defaults to <state home>/providers/openrouter/catalog_cache.json "
+            "(~/.protocol_monk by default)."
+        ),
+    )
+    parser.add_argument(
+        "--no-catalog-cache",
+        action="store_true",
+        help="Always download the full catalog and do not update the cache.",
+    )
     parser.add_argument(
         "--respect-catalog-tool-support",
         action="store_true",
@@ -142,12 +156,25 @@ def main() -> int:
     )
     api_key = str(args.api_key or settings.openrouter_api_key or "").strip()
     requested_default = str(args.default_model or "").strip() or None
+    catalog_cache_path = None
+    if not args.no_catalog_cache:
+        catalog_cache_path = _resolve_output_path(
+            args.catalog_cache,
+            project_root=settings.project_root,
+            default_path=(
+                settings.resolved_paths.state_home
+                / "providers"
+                / "openrouter"
+                / "catalog_cache.json"
+            ),
+        )
 
     discovery = OpenRouterModelDiscovery(
         output_path,
         base_url=args.base_url,
         api_key=api_key,
         timeout_seconds=args.timeout,
+        catalog_cache_path=catalog_cache_path,
     )
 
     try:
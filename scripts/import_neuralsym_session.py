@@ -8,6 +8,7 @@ import json
 from pathlib import Path
 
 from protocol_monk.plugins.neuralsym.importer import import_session_to_workspace_state
+from protocol_monk.utils.transcript_format import list_session_transcripts
 
 
 def _resolve_session_path(
@@ -24,11 +25,7 @@ def _resolve_session_path(
     if not sessions_dir.exists():
         raise FileNotFoundError(f"Session directory not found: {sessions_dir}")
 
-    candidates = sorted(
-        sessions_dir.glob("*.jsonl"),
-        key=lambda path: path.stat().st_mtime if path.exists() else 0,
-        reverse=True,
-    )
+    candidates = list_session_transcripts(sessions_dir)
     if not candidates:
         raise FileNotFoundError(f"No session files found in {sessions_dir}")
 
@@ -39,7 +36,7 @@ def _resolve_session_path(
 
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("--session", type=str, help="Path to a specific session JSONL file")
+    parser.add_argument("--session", type=str, help="Path to a specific session transcript (.jsonl, .jsonl.gz or .blocks)")
     parser.add_argument(
         "--session-workspace",
         type=str,
@@ -88,6 +85,9 @@ def main(argv: list[str] | None = None) -> int:
         print(f"Imported observations: {result.imported_observations}")
         print(f"Total observations: {result.total_observations}")
         print(f"Skipped duplicate: {result.skipped_duplicate}")
+        print(
+            f"Checkpoint: {result.resumed_from_offset} -> {result.checkpoint_offset}"
+        )
         print(f"Policy signals: {result.policy_signal_count}")
         print(f"Feedback events: {result.feedback_event_count}")
         print(f"Directives: {result.directive_count}")
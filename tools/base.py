@@ -44,6 +44,14 @@ class BaseTool(ABC):
         """
         return True
 
+    @property
+    def is_read_only(self) -> bool:
+        """
+        Whether running this tool has no side effects, so it may be started
+        speculatively while the model is still streaming. Default is False.
+        """
+        return False
+
     @abstractmethod
     async def run(self, **kwargs) -> Dict[str, Any]:
         """The execution logic."""
@@ -0,0 +1,110 @@
+"""Downscale and re-encode images before they are sent to a vision model."""
+
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+VISION_IMAGE_FORMATS = ("jpeg", "webp", "original")
+
+
+@dataclass
+class PreparedImage:
+    data: bytes
+    original_bytes: int
+    original_size: Optional[Tuple[int, int]]
+    sent_size: Optional[Tuple[int, int]]
+    encoding: str
+    resized: bool = False
+
+    @property
+    def sent_bytes(self) -> int:
+        return len(self.data)
+
+    def to_metadata(self) -> Dict[str, Any]:
+        return {
+            "original_bytes": self.original_bytes,
+            "sent_bytes": self.sent_bytes,
+            "original_size": list(self.original_size) if self.original_size else None,
+            "sent_size": list(self.sent_size) if self.sent_size else None,
+            "encoding": self.encoding,
+            "resized": self.resized,
+        }
+
+
+def prepare_vision_image(
+    image_bytes: bytes,
+    *,
+    max_edge: int,
+    image_format: str = "jpeg",
+    quality: int = 85,
+) -> PreparedImage:
+    """
+    Fit the image within `max_edge` pixels and re-encode it.
+
+    The original bytes are kept whenever Pillow is unavailable, the image
+    cannot be decoded, `image_format` is `original`, or re-encoding would not
+    make an unresized image smaller.
+    """
+    passthrough = PreparedImage(
+        data=image_bytes,
+        original_bytes=len(image_bytes),
+        original_size=None,
+        sent_size=None,
+        encoding="original",
+    )
+    try:
+        from PIL import Image
+    except Exception:
+        return passthrough
+
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            original_size = image.size
+            passthrough.original_size = original_size
+            passthrough.sent_size = original_size
+            if image_format == "original":
+                return passthrough
+
+            image.load()
+            working = image
+            resized = max(original_size) > max_edge
+            if resized:
+                working = image.copy()
+                working.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+            working = _flatten_for_encoding(working, image_format)
+
+            buffer = io.BytesIO()
+            save_format = "JPEG" if image_format == "jpeg" else "WEBP"
+            working.save(buffer, format=save_format, quality=int(quality))
+            encoded = buffer.getvalue()
+            sent_size = working.size
+    except Exception:
+        return passthrough
+
+    if not resized and len(encoded) >= len(image_bytes):
+        return passthrough
+
+    return PreparedImage(
+        data=encoded,
+        original_bytes=len(image_bytes),
+        original_size=original_size,
+        sent_size=sent_size,
+        encoding=image_format,
+        resized=resized,
+    )
+
+
+def _flatten_for_encoding(image: Any, image_format: str) -> Any:
+    """JPEG has no alpha or palette modes; composite onto white first."""
+    if image.mode in {"RGB", "L"}:
+        return image
+    if image_format == "webp" and image.mode == "RGBA":
+        return image
+    from PIL import Image
+
+    rgba = image.convert("RGBA")
+    background = Image.new("RGB", rgba.size, (255, 255, 255))
+    background.paste(rgba, mask=rgba.getchannel("A"))
+    return background
@@ -0,0 +1,152 @@
+"""Persistent per-document index of PDF text-layer extraction results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+PDF_TEXT_INDEX_VERSION = 1
+
+
+class PdfTextIndexStore:
+    """
+    Keep extracted text blocks for whole PDFs, keyed by path, mtime and size.
+
+    An index holds `page_count`, `document_metadata` and a `pages` mapping of
+    page number (as a string) to `{"text_blocks", "needs_vision",
+    "fallback_warning"}`. Recently used indexes stay in memory; every index is
+    also written to one JSON file under `cache_dir`, and the oldest files are
+    dropped beyond `max_documents`. Methods block and are meant to run in a
+    worker thread.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        *,
+        max_documents: int = 256,
+        memory_documents: int = 8,
+    ):
+        self._cache_dir = Path(cache_dir)
+        self._max_documents = max(1, int(max_documents))
+        self._memory_documents = max(1, int(memory_documents))
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Return the index for `path` if it matches the file on disk."""
+        fingerprint = self._fingerprint(path)
+        if fingerprint is None:
+            return None
+        key = self._key(path)
+
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None and cached.get("fingerprint") == fingerprint:
+                self._memory.move_to_end(key)
+                return cached
+
+        entry_path = self._entry_path(key)
+        try:
+            index = json.loads(entry_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Discarding unreadable PDF text index %s: %s", entry_path, exc)
+            entry_path.unlink(missing_ok=True)
+            return None
+        if (
+            not isinstance(index, dict)
+            or index.get("version") != PDF_TEXT_INDEX_VERSION
+            or index.get("fingerprint") != fingerprint
+        ):
+            return None
+
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        self._remember(key, index)
+        return index
+
+    def save(
+        self,
+        path: Path,
+        *,
+        page_count: int,
+        document_metadata: Dict[str, Any],
+        pages: Dict[str, Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        index = {
+            "version": PDF_TEXT_INDEX_VERSION,
+            "path": str(path),
+            "fingerprint": self._fingerprint(path),
+            "page_count": page_count,
+            "document_metadata": document_metadata,
+            "pages": pages,
+        }
+        key = self._key(path)
+        self._remember(key, index)
+
+        entry_path = self._entry_path(key)
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                dir=self._cache_dir,
+                delete=False,
+                suffix=".tmp",
+            ) as handle:
+                json.dump(index, handle, ensure_ascii=False, separators=(",", ":"))
+                tmp_path = handle.name
+            os.replace(tmp_path, entry_path)
+        except OSError as exc:
+            logger.warning("Failed to write PDF text index %s: %s", entry_path, exc)
+            return index
+        self._evict()
+        return index
+
+    def _remember(self, key: str, index: Dict[str, Any]) -> None:
+        with self._lock:
+            self._memory[key] = index
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._memory_documents:
+                self._memory.popitem(last=False)
+
+    def _evict(self) -> None:
+        entries = []
+        for entry_path in self._cache_dir.glob("*.json"):
+            try:
+                entries.append((entry_path.stat().st_mtime, entry_path))
+            except OSError:
+                continue
+        if len(entries) <= self._max_documents:
+            return
+        entries.sort()
+        for _mtime, entry_path in entries[: len(entries) - self._max_documents]:
+            entry_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _fingerprint(path: Path) -> Optional[Dict[str, int]]:
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            return None
+        return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return hashlib.sha256(str(Path(path).resolve()).encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.json"
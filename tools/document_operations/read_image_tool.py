@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
 from protocol_monk.exceptions.tools import ToolError
 from protocol_monk.tools.base import BaseTool
-from protocol_monk.tools.document_operations.vision_helper_service import VisionHelperService
 from protocol_monk.tools.output_contract import build_tool_output
 
+if TYPE_CHECKING:
+    from protocol_monk.tools.document_operations.vision_helper_service import (
+        VisionHelperService,
+    )
+
 
 class ReadImageTool(BaseTool):
     """Analyze image files with an Ollama-backed vision helper model."""
@@ -87,7 +91,12 @@ class ReadImageTool(BaseTool):
                 "width": width,
                 "height": height,
                 "mode": mode,
-                "analysis_method": "vision_helper",
+                "analysis_method": (
+                    "vision_cache"
+                    if helper_result.get("cache_hit")
+                    else "vision_helper"
+                ),
+                "vision_input": helper_result.get("vision_input"),
                 "description": helper_result["description"],
                 "detected_text_blocks": helper_result["detected_text_blocks"],
                 "observations": helper_result["observations"],
@@ -144,5 +153,9 @@ class ReadImageTool(BaseTool):
     @property
     def _vision(self) -> VisionHelperService:
         if self._vision_helper is None:
+            from protocol_monk.tools.document_operations.vision_helper_service import (
+                VisionHelperService,
+            )
+
             self._vision_helper = VisionHelperService(self.settings)
         return self._vision_helper
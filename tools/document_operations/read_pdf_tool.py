@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
 from protocol_monk.exceptions.tools import ToolError
 from protocol_monk.tools.base import BaseTool
-from protocol_monk.tools.document_operations.vision_helper_service import VisionHelperService
+from protocol_monk.tools.document_operations.pdf_text_index import PdfTextIndexStore
 from protocol_monk.tools.output_contract import build_range_pagination, build_tool_output
 
+if TYPE_CHECKING:
+    from protocol_monk.tools.document_operations.vision_helper_service import (
+        VisionHelperService,
+    )
+
 
 class ReadPdfTool(BaseTool):
     """Read PDFs with text-first extraction and vision fallback for sparse pages."""
@@ -16,14 +22,28 @@ class ReadPdfTool(BaseTool):
     MAX_FILE_SIZE_BYTES = 25 * 1024 * 1024
     DEFAULT_PAGE_LIMIT = 3
     SPARSE_TEXT_THRESHOLD = 30
+    DEFAULT_VISION_CONCURRENCY = 4
 
     def __init__(
         self,
         settings,
         vision_helper: Optional[VisionHelperService] = None,
+        text_index: Optional[PdfTextIndexStore] = None,
     ):
         super().__init__(settings)
         self._vision_helper = vision_helper
+        self._text_index = text_index
+        if self._text_index is None:
+            self._text_index = self._build_text_index_store(settings)
+
+    @staticmethod
+    def _build_text_index_store(settings) -> Optional[PdfTextIndexStore]:
+        if not getattr(settings, "document_pdf_index_enabled", True):
+            return None
+        resolved_paths = getattr(settings, "resolved_paths", None)
+        if resolved_paths is None:
+            return None
+        return PdfTextIndexStore(resolved_paths.state_home / "cache" / "pdf_text")
 
     @property
     def name(self) -> str:
@@ -83,7 +103,7 @@ class ReadPdfTool(BaseTool):
         self._validate_file(full_path)
 
         try:
-            import fitz
+            import fitz  # noqa: F401 - used by _extract_pages
         except Exception as exc:  # pragma: no cover
             raise ToolError(
                 "PyMuPDF is not installed.",
@@ -91,9 +111,25 @@ class ReadPdfTool(BaseTool):
                 details={"error": str(exc)},
             )
 
-        document = fitz.open(full_path)
-        try:
-            page_count = len(document)
+        vision_concurrency = max(
+            1,
+            int(
+                getattr(self.settings, "document_vision_concurrency", None)
+                or self.DEFAULT_VISION_CONCURRENCY
+            ),
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_root = Path(temp_dir)
+            # PyMuPDF parsing and rasterizing is CPU-bound; keep it off the loop.
+            extraction = await asyncio.to_thread(
+                self._extract_pages,
+                full_path,
+                page_start=page_start,
+                page_limit=page_limit,
+                temp_root=temp_root,
+            )
+            page_count = extraction["page_count"]
             if page_count == 0:
                 return build_tool_output(
                     result_type="pdf_read",
@@ -108,6 +144,98 @@ class ReadPdfTool(BaseTool):
                     pagination=None,
                 )
 
+            semaphore = asyncio.Semaphore(vision_concurrency)
+
+            async def _resolve_page(plan: Dict[str, Any]) -> Dict[str, Any]:
+                if plan["rendered_path"] is None:
+                    return {
+                        "page_number": plan["page_number"],
+                        "extraction_method": "text_layer",
+                        "text_blocks": plan["native_blocks"],
+                        "warnings": [],
+                    }
+                async with semaphore:
+                    return await self._analyze_page_with_vision(
+                        plan["rendered_path"],
+                        page_number=plan["page_number"],
+                        fallback_warning=plan["fallback_warning"],
+                        native_blocks=plan["native_blocks"] or None,
+                    )
+
+            # gather preserves argument order, so pages come back in page order.
+            pages: List[Dict[str, Any]] = list(
+                await asyncio.gather(
+                    *(_resolve_page(plan) for plan in extraction["pages"])
+                )
+            )
+
+        page_end = extraction["page_end"]
+        used_vision_helper = any(
+            page["extraction_method"] in {"vision_helper", "vision_cache", "mixed"}
+            for page in pages
+        )
+        pagination = build_range_pagination(
+            mode="page_range",
+            total_items=page_count,
+            returned_start=page_start,
+            returned_end=page_end,
+            page_size=max(1, page_limit),
+            start_key="page_start",
+            end_key="page_end",
+            total_key="page_count",
+        )
+        summary = f"Read pages {page_start}-{page_end} from {full_path.name}."
+        return build_tool_output(
+            result_type="pdf_read",
+            summary=summary,
+            data={
+                "filepath": str(full_path),
+                "page_count": page_count,
+                "document_metadata": extraction["document_metadata"],
+                "used_vision_helper": used_vision_helper,
+                "pages": pages,
+            },
+            pagination=pagination,
+        )
+
+    def _extract_pages(
+        self,
+        path: Path,
+        *,
+        page_start: int,
+        page_limit: int,
+        temp_root: Path,
+    ) -> Dict[str, Any]:
+        """
+        Resolve the requested range from the text-layer index.
+
+        Runs in a worker thread. The document is only opened when it has no
+        current index, or to rasterize pages that need the vision helper, so
+        the async side only has to await the model.
+        """
+        import fitz
+
+        document = None
+        try:
+            index = self._text_index.load(path) if self._text_index else None
+            if index is None:
+                document = fitz.open(path)
+                page_numbers = None
+                if self._text_index is None:
+                    # Nothing to persist: extract only the requested pages.
+                    last_page = min(len(document), page_start + page_limit - 1)
+                    page_numbers = range(page_start, last_page + 1)
+                index = self._build_text_index(document, path, page_numbers)
+
+            page_count = int(index["page_count"])
+            if page_count == 0:
+                return {
+                    "page_count": 0,
+                    "page_end": 0,
+                    "document_metadata": {},
+                    "pages": [],
+                }
+
             if page_start > page_count:
                 raise ToolError(
                     f"Requested page_start {page_start} exceeds total pages {page_count}.",
@@ -116,75 +244,83 @@ class ReadPdfTool(BaseTool):
                 )
 
             actual_end = min(page_count, page_start + page_limit - 1)
-            pages: List[Dict[str, Any]] = []
-            used_vision_helper = False
-
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_root = Path(temp_dir)
-                for page_number in range(page_start, actual_end + 1):
+            plans: List[Dict[str, Any]] = []
+            for page_number in range(page_start, actual_end + 1):
+                entry = index["pages"][str(page_number)]
+                rendered_path: Optional[Path] = None
+                if entry["needs_vision"]:
+                    if document is None:
+                        document = fitz.open(path)
+                    rendered_path = temp_root / f"page_{page_number}.png"
                     page = document.load_page(page_number - 1)
-                    native_blocks = self._extract_text_blocks(page)
-                    native_text = " ".join(block["text"] for block in native_blocks).strip()
-
-                    if not native_blocks:
-                        page_record = await self._analyze_page_with_vision(
-                            page,
-                            page_number=page_number,
-                            temp_root=temp_root,
-                            fallback_warning="No native text layer detected.",
-                        )
-                        if page_record["extraction_method"] == "vision_helper":
-                            used_vision_helper = True
-                        pages.append(page_record)
-                        continue
-
-                    if self._is_sparse_text(native_text):
-                        page_record = await self._analyze_page_with_vision(
-                            page,
-                            page_number=page_number,
-                            temp_root=temp_root,
-                            fallback_warning="Native text was sparse.",
-                            native_blocks=native_blocks,
-                        )
-                        if page_record["extraction_method"] in {"vision_helper", "mixed"}:
-                            used_vision_helper = True
-                        pages.append(page_record)
-                        continue
-
-                    pages.append(
-                        {
-                            "page_number": page_number,
-                            "extraction_method": "text_layer",
-                            "text_blocks": native_blocks,
-                            "warnings": [],
-                        }
-                    )
+                    page.get_pixmap(alpha=False).save(rendered_path)
+
+                plans.append(
+                    {
+                        "page_number": page_number,
+                        # Copies, so the cached index never aliases tool output.
+                        "native_blocks": [dict(block) for block in entry["text_blocks"]],
+                        "fallback_warning": entry["fallback_warning"],
+                        "rendered_path": rendered_path,
+                    }
+                )
 
-            pagination = build_range_pagination(
-                mode="page_range",
-                total_items=page_count,
-                returned_start=page_start,
-                returned_end=actual_end,
-                page_size=max(1, page_limit),
-                start_key="page_start",
-                end_key="page_end",
-                total_key="page_count",
-            )
-            summary = f"Read pages {page_start}-{actual_end} from {full_path.name}."
-            return build_tool_output(
-                result_type="pdf_read",
-                summary=summary,
-                data={
-                    "filepath": str(full_path),
-                    "page_count": page_count,
-                    "document_metadata": self._extract_document_metadata(document.metadata),
-                    "used_vision_helper": used_vision_helper,
-                    "pages": pages,
-                },
-                pagination=pagination,
-            )
+            return {
+                "page_count": page_count,
+                "page_end": actual_end,
+                "document_metadata": index["document_metadata"],
+                "pages": plans,
+            }
         finally:
-            document.close()
+            if document is not None:
+                document.close()
+
+    def _build_text_index(
+        self,
+        document: Any,
+        path: Path,
+        page_numbers: Optional[Iterable[int]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Extract the text layer of `page_numbers` (default: every page) and
+        persist it when the index is enabled. A partial index is never saved.
+        """
+        pages: Dict[str, Dict[str, Any]] = {}
+        if page_numbers is None:
+            page_numbers = range(1, len(document) + 1)
+        for page_number in page_numbers:
+            page = document.load_page(page_number - 1)
+            native_blocks = self._extract_text_blocks(page)
+            native_text = " ".join(block["text"] for block in native_blocks).strip()
+
+            fallback_warning: Optional[str] = None
+            if not native_blocks:
+                fallback_warning = "No native text layer detected."
+            elif self._is_sparse_text(native_text):
+                fallback_warning = "Native text was sparse."
+
+            pages[str(page_number)] = {
+                "text_blocks": native_blocks,
+                "needs_vision": fallback_warning is not None,
+                "fallback_warning": fallback_warning,
+            }
+
+        page_count = len(document)
+        document_metadata = (
+            self._extract_document_metadata(document.metadata) if page_count else {}
+        )
+        if self._text_index is None or len(pages) != page_count:
+            return {
+                "page_count": page_count,
+                "document_metadata": document_metadata,
+                "pages": pages,
+            }
+        return self._text_index.save(
+            path,
+            page_count=page_count,
+            document_metadata=document_metadata,
+            pages=pages,
+        )
 
     def _validate_file(self, path: Path) -> None:
         try:
@@ -234,18 +370,13 @@ class ReadPdfTool(BaseTool):
 
     async def _analyze_page_with_vision(
         self,
-        page: Any,
+        rendered_path: Path,
         *,
         page_number: int,
-        temp_root: Path,
         fallback_warning: str,
         native_blocks: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         warnings = [fallback_warning]
-        rendered_path = temp_root / f"page_{page_number}.png"
-        pixmap = page.get_pixmap(alpha=False)
-        pixmap.save(rendered_path)
-
         try:
             helper_result = await self._vision.analyze_image(
                 rendered_path,
@@ -280,13 +411,18 @@ class ReadPdfTool(BaseTool):
             return {
                 "page_number": page_number,
                 "extraction_method": "mixed",
+                "vision_cache_hit": bool(helper_result.get("cache_hit")),
+                "vision_input": helper_result.get("vision_input"),
                 "text_blocks": combined_blocks,
                 "warnings": warnings,
             }
 
         return {
             "page_number": page_number,
-            "extraction_method": "vision_helper",
+            "extraction_method": (
+                "vision_cache" if helper_result.get("cache_hit") else "vision_helper"
+            ),
+            "vision_input": helper_result.get("vision_input"),
             "text_blocks": vision_blocks,
             "warnings": warnings,
         }
@@ -311,5 +447,9 @@ class ReadPdfTool(BaseTool):
     @property
     def _vision(self) -> VisionHelperService:
         if self._vision_helper is None:
+            from protocol_monk.tools.document_operations.vision_helper_service import (
+                VisionHelperService,
+            )
+
             self._vision_helper = VisionHelperService(self.settings)
         return self._vision_helper
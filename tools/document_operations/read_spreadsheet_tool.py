@@ -1,29 +1,52 @@
 from __future__ import annotations
 
+import asyncio
 import csv
+import threading
+from collections import OrderedDict
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 
 from protocol_monk.exceptions.tools import ToolError
 from protocol_monk.tools.base import BaseTool
+from protocol_monk.tools.document_operations.spreadsheet_summary import (
+    parse_number,
+    summarize_columns,
+)
 from protocol_monk.tools.output_contract import build_range_pagination, build_tool_output
 
 
 class ReadSpreadsheetTool(BaseTool):
     """Read CSV and Excel workbooks as structured row slices."""
 
-    MAX_FILE_SIZE_BYTES = 8 * 1024 * 1024
+    MAX_FILE_SIZE_BYTES = 64 * 1024 * 1024
+    # xlrd always loads the whole workbook, so legacy .xls keeps the old cap.
+    MAX_XLS_FILE_SIZE_BYTES = 8 * 1024 * 1024
     DEFAULT_ROW_LIMIT = 100
+    # A CSV byte offset is remembered every N rows for seeking to later pages.
+    CSV_CHECKPOINT_INTERVAL = 1024
+    MAX_CACHED_ROW_INDEXES = 16
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        self._row_indexes: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+        self._row_index_lock = threading.Lock()
 
     @property
     def name(self) -> str:
         return "read_spreadsheet"
 
+    @property
+    def is_read_only(self) -> bool:
+        return True
+
     @property
     def description(self) -> str:
         return (
             "Read CSV or Excel spreadsheets as structured columns and row slices. "
-            "Defaults to the first 100 rows."
+            "Defaults to the first 100 rows; mode='summary' returns per-column "
+            "statistics instead of rows."
         )
 
     @property
@@ -46,12 +69,21 @@ class ReadSpreadsheetTool(BaseTool):
                     "description": "Maximum number of rows to return",
                     "default": self.DEFAULT_ROW_LIMIT,
                 },
+                "mode": {
+                    "type": "string",
+                    "enum": ["rows", "summary"],
+                    "description": (
+                        "'rows' returns a row window; 'summary' returns per-column "
+                        "types, null counts, min/max and sample values instead"
+                    ),
+                    "default": "rows",
+                },
             },
             "required": ["filepath"],
         }
 
     async def run(self, **kwargs) -> Dict[str, Any]:
-        return self._execute_sync(**kwargs)
+        return await asyncio.to_thread(self._execute_sync, **kwargs)
 
     def _execute_sync(self, **kwargs) -> Dict[str, Any]:
         filepath = kwargs.get("filepath")
@@ -66,6 +98,13 @@ class ReadSpreadsheetTool(BaseTool):
             kwargs.get("row_limit", self.DEFAULT_ROW_LIMIT) or self.DEFAULT_ROW_LIMIT
         )
         sheet_name = kwargs.get("sheet_name")
+        mode = str(kwargs.get("mode") or "rows").strip().lower()
+        if mode not in {"rows", "summary"}:
+            raise ToolError(
+                f"Unsupported spreadsheet read mode: {mode}",
+                user_hint="Spreadsheet mode must be 'rows' or 'summary'.",
+                details={"mode": mode},
+            )
         if row_start < 1:
             raise ToolError(
                 "row_start must be >= 1",
@@ -88,22 +127,19 @@ class ReadSpreadsheetTool(BaseTool):
                 details={"path": str(full_path)},
             )
 
-        if suffix == ".csv":
-            workbook = self._read_csv(full_path)
-        elif suffix == ".xlsx":
-            workbook = self._read_xlsx(full_path, sheet_name=sheet_name)
-        elif suffix == ".xls":
-            workbook = self._read_xls(full_path, sheet_name=sheet_name)
-        else:
+        if suffix not in {".csv", ".xlsx", ".xls"}:
             raise ToolError(
                 f"Unsupported spreadsheet format: {suffix or 'unknown'}",
                 user_hint="Supported spreadsheet formats are .csv, .xlsx, and .xls.",
                 details={"path": str(full_path), "suffix": suffix},
             )
 
-        total_rows = workbook["total_rows"]
-        total_columns = workbook["total_columns"]
-        rows = workbook["rows"]
+        row_index = self._get_row_index(full_path, suffix, sheet_name=sheet_name)
+        if mode == "summary":
+            return self._build_summary_output(full_path, suffix, row_index)
+
+        total_rows = row_index["total_rows"]
+        total_columns = row_index["total_columns"]
         actual_start = row_start
         actual_end = min(total_rows, row_start + row_limit - 1)
         if total_rows == 0:
@@ -116,13 +152,21 @@ class ReadSpreadsheetTool(BaseTool):
                 details={"row_start": row_start, "total_rows": total_rows},
             )
 
-        sliced_rows = rows[row_start - 1 : actual_end]
+        window_rows: List[List[Any]] = []
+        if actual_end >= actual_start:
+            window_rows = self._read_window(
+                full_path,
+                suffix,
+                row_index,
+                row_start=actual_start,
+                row_count=actual_end - actual_start + 1,
+            )
         row_records = [
             {
                 "row_number": row_start + index,
                 "values": self._pad_row(row, total_columns),
             }
-            for index, row in enumerate(sliced_rows)
+            for index, row in enumerate(window_rows)
         ]
 
         pagination = build_range_pagination(
@@ -136,7 +180,7 @@ class ReadSpreadsheetTool(BaseTool):
             total_key="total_rows",
         )
 
-        selected_sheet = workbook["selected_sheet"]
+        selected_sheet = row_index["selected_sheet"]
         summary_target = selected_sheet or full_path.name
         if actual_end >= actual_start:
             summary = f"Read rows {actual_start}-{actual_end} from {summary_target}."
@@ -149,11 +193,11 @@ class ReadSpreadsheetTool(BaseTool):
             data={
                 "filepath": str(full_path),
                 "format": suffix.lstrip("."),
-                "available_sheets": workbook["available_sheets"],
+                "available_sheets": row_index["available_sheets"],
                 "selected_sheet": selected_sheet,
                 "total_rows": total_rows,
                 "total_columns": total_columns,
-                "columns": self._build_columns(rows, total_columns),
+                "columns": self._build_columns(row_index["header"], total_columns),
                 "rows": row_records,
             },
             pagination=pagination,
@@ -175,30 +219,209 @@ class ReadSpreadsheetTool(BaseTool):
                 details={"path": str(path)},
             )
 
-        if stat.st_size > self.MAX_FILE_SIZE_BYTES:
+        max_size_bytes = (
+            self.MAX_XLS_FILE_SIZE_BYTES
+            if path.suffix.lower() == ".xls"
+            else self.MAX_FILE_SIZE_BYTES
+        )
+        if stat.st_size > max_size_bytes:
             raise ToolError(
                 "Spreadsheet is too large to load in one call.",
                 user_hint="Spreadsheet is too large for the document reader.",
                 details={
                     "path": str(path),
                     "actual_size_bytes": stat.st_size,
-                    "max_size_bytes": self.MAX_FILE_SIZE_BYTES,
+                    "max_size_bytes": max_size_bytes,
                 },
             )
 
-    def _read_csv(self, path: Path) -> Dict[str, Any]:
-        with path.open("r", encoding="utf-8", newline="") as handle:
-            reader = csv.reader(handle)
-            rows = [[self._normalize_cell(cell) for cell in row] for row in reader]
+    def _get_row_index(
+        self, path: Path, suffix: str, *, sheet_name: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Return the cached row index for one file revision and sheet.
+
+        The index holds sheet names, total row/column counts and the header
+        row, plus CSV byte-offset checkpoints. It is built by one streaming
+        pass and reused until the file's mtime or size changes.
+        """
+        stat = path.stat()
+        key = (str(path), suffix, sheet_name, stat.st_mtime_ns, stat.st_size)
+        with self._row_index_lock:
+            cached = self._row_indexes.get(key)
+            if cached is not None:
+                self._row_indexes.move_to_end(key)
+                return cached
+
+        if suffix == ".csv":
+            row_index = self._build_csv_index(path)
+        elif suffix == ".xlsx":
+            row_index = self._build_xlsx_index(path, sheet_name=sheet_name)
+        else:
+            row_index = self._build_xls_index(path, sheet_name=sheet_name)
+
+        with self._row_index_lock:
+            stale = [
+                existing
+                for existing in self._row_indexes
+                if existing[:3] == key[:3] and existing != key
+            ]
+            for existing in stale:
+                del self._row_indexes[existing]
+            self._row_indexes[key] = row_index
+            while len(self._row_indexes) > self.MAX_CACHED_ROW_INDEXES:
+                self._row_indexes.popitem(last=False)
+        return row_index
+
+    def _build_summary_output(
+        self, path: Path, suffix: str, row_index: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        total_rows = row_index["total_rows"]
+        total_columns = row_index["total_columns"]
+        header = row_index["header"]
+        # Every CSV cell is a string, so "has text" is not enough: a header
+        # row holds labels only, none of which read as a number.
+        labels = [cell for cell in header if cell not in (None, "")]
+        has_header = bool(labels) and all(
+            isinstance(cell, str) and parse_number(cell) is None for cell in labels
+        )
+        columns = self._build_columns(header if has_header else [], total_columns)
+
+        # The row index is keyed by file revision, so the summary cached on it
+        # is invalidated together with it.
+        column_stats = row_index.get("column_summary")
+        if column_stats is None:
+            rows = self._iter_rows(path, suffix, row_index)
+            if has_header:
+                next(rows, None)
+            column_stats = summarize_columns(
+                rows,
+                total_columns=total_columns,
+                labels=[column["label"] for column in columns],
+            )
+            row_index["column_summary"] = column_stats
+
+        summary_target = row_index["selected_sheet"] or path.name
+        data_rows = max(0, total_rows - 1) if has_header else total_rows
+        return build_tool_output(
+            result_type="spreadsheet_summary",
+            summary=(
+                f"Summarized {total_columns} columns over {data_rows} data rows "
+                f"from {summary_target}."
+            ),
+            data={
+                "filepath": str(path),
+                "format": suffix.lstrip("."),
+                "available_sheets": row_index["available_sheets"],
+                "selected_sheet": row_index["selected_sheet"],
+                "total_rows": total_rows,
+                "total_columns": total_columns,
+                "header_row": 1 if has_header else None,
+                "columns": column_stats,
+            },
+            pagination=None,
+        )
+
+    def _iter_rows(
+        self, path: Path, suffix: str, row_index: Dict[str, Any]
+    ) -> Iterator[List[Any]]:
+        """Stream every row of the indexed sheet without materializing it."""
+        if suffix == ".csv":
+            with path.open("rb") as handle:
+                for row, _end_offset in self._iter_csv_records(handle):
+                    yield row
+            return
+        if suffix == ".xlsx":
+            workbook = self._open_xlsx(path)
+            try:
+                for row in workbook[row_index["selected_sheet"]].iter_rows(
+                    values_only=True
+                ):
+                    yield [self._normalize_cell(cell) for cell in row]
+            finally:
+                workbook.close()
+            return
+        sheet, _available, _selected = self._open_xls_sheet(
+            path, sheet_name=row_index["selected_sheet"]
+        )
+        for rowx in range(sheet.nrows):
+            yield self._xls_row(sheet, rowx)
+
+    def _read_window(
+        self,
+        path: Path,
+        suffix: str,
+        row_index: Dict[str, Any],
+        *,
+        row_start: int,
+        row_count: int,
+    ) -> List[List[Any]]:
+        if suffix == ".csv":
+            return self._read_csv_window(
+                path, row_index, row_start=row_start, row_count=row_count
+            )
+        if suffix == ".xlsx":
+            return self._read_xlsx_window(
+                path, row_index, row_start=row_start, row_count=row_count
+            )
+        return self._read_xls_window(
+            path, row_index, row_start=row_start, row_count=row_count
+        )
+
+    def _iter_csv_records(
+        self, handle: BinaryIO
+    ) -> Iterator[Tuple[List[Any], int]]:
+        """Yield `(row, end_offset)` pairs, tracking byte offsets across records."""
+        position = {"offset": handle.tell()}
+
+        def _lines() -> Iterator[str]:
+            for raw_line in iter(handle.readline, b""):
+                position["offset"] += len(raw_line)
+                yield raw_line.decode("utf-8")
+
+        for row in csv.reader(_lines()):
+            yield [self._normalize_cell(cell) for cell in row], position["offset"]
+
+    def _build_csv_index(self, path: Path) -> Dict[str, Any]:
+        header: List[Any] = []
+        checkpoints = [0]
+        total_rows = 0
+        total_columns = 0
+        with path.open("rb") as handle:
+            for row, end_offset in self._iter_csv_records(handle):
+                if total_rows == 0:
+                    header = row
+                total_rows += 1
+                total_columns = max(total_columns, len(row))
+                if total_rows % self.CSV_CHECKPOINT_INTERVAL == 0:
+                    checkpoints.append(end_offset)
         return {
             "available_sheets": ["Sheet1"],
             "selected_sheet": "Sheet1",
-            "rows": rows,
-            "total_rows": len(rows),
-            "total_columns": max((len(row) for row in rows), default=0),
+            "header": header,
+            "total_rows": total_rows,
+            "total_columns": total_columns,
+            "checkpoints": checkpoints,
         }
 
-    def _read_xlsx(self, path: Path, *, sheet_name: Optional[str]) -> Dict[str, Any]:
+    def _read_csv_window(
+        self,
+        path: Path,
+        row_index: Dict[str, Any],
+        *,
+        row_start: int,
+        row_count: int,
+    ) -> List[List[Any]]:
+        checkpoint = (row_start - 1) // self.CSV_CHECKPOINT_INTERVAL
+        checkpoints = row_index["checkpoints"]
+        checkpoint = min(checkpoint, len(checkpoints) - 1)
+        skip = row_start - 1 - checkpoint * self.CSV_CHECKPOINT_INTERVAL
+        with path.open("rb") as handle:
+            handle.seek(checkpoints[checkpoint])
+            records = islice(self._iter_csv_records(handle), skip, skip + row_count)
+            return [row for row, _end_offset in records]
+
+    def _open_xlsx(self, path: Path) -> Any:
         try:
             from openpyxl import load_workbook
         except Exception as exc:  # pragma: no cover
@@ -207,8 +430,12 @@ class ReadSpreadsheetTool(BaseTool):
                 user_hint="Install openpyxl to read .xlsx files.",
                 details={"error": str(exc)},
             )
+        return load_workbook(path, data_only=True, read_only=True)
 
-        workbook = load_workbook(path, data_only=True, read_only=True)
+    def _build_xlsx_index(
+        self, path: Path, *, sheet_name: Optional[str]
+    ) -> Dict[str, Any]:
+        workbook = self._open_xlsx(path)
         try:
             available_sheets = list(workbook.sheetnames)
             selected_sheet = sheet_name or (available_sheets[0] if available_sheets else None)
@@ -222,22 +449,49 @@ class ReadSpreadsheetTool(BaseTool):
                     },
                 )
 
-            worksheet = workbook[selected_sheet]
-            rows = [
-                [self._normalize_cell(cell) for cell in row]
-                for row in worksheet.iter_rows(values_only=True)
-            ]
+            header: List[Any] = []
+            total_rows = 0
+            total_columns = 0
+            for row in workbook[selected_sheet].iter_rows(values_only=True):
+                if total_rows == 0:
+                    header = [self._normalize_cell(cell) for cell in row]
+                total_rows += 1
+                total_columns = max(total_columns, len(row))
             return {
                 "available_sheets": available_sheets,
                 "selected_sheet": selected_sheet,
-                "rows": rows,
-                "total_rows": len(rows),
-                "total_columns": max((len(row) for row in rows), default=0),
+                "header": header,
+                "total_rows": total_rows,
+                "total_columns": total_columns,
             }
         finally:
             workbook.close()
 
-    def _read_xls(self, path: Path, *, sheet_name: Optional[str]) -> Dict[str, Any]:
+    def _read_xlsx_window(
+        self,
+        path: Path,
+        row_index: Dict[str, Any],
+        *,
+        row_start: int,
+        row_count: int,
+    ) -> List[List[Any]]:
+        workbook = self._open_xlsx(path)
+        try:
+            worksheet = workbook[row_index["selected_sheet"]]
+            return [
+                [self._normalize_cell(cell) for cell in row]
+                for row in worksheet.iter_rows(
+                    min_row=row_start,
+                    max_row=row_start + row_count - 1,
+                    values_only=True,
+                )
+            ]
+        finally:
+            workbook.close()
+
+    def _open_xls_sheet(
+        self, path: Path, *, sheet_name: Optional[str]
+    ) -> Tuple[Any, List[str], Optional[str]]:
         try:
             import xlrd
         except Exception as exc:  # pragma: no cover
@@ -256,20 +510,42 @@ class ReadSpreadsheetTool(BaseTool):
                 user_hint=f"Available sheets: {', '.join(available_sheets)}",
                 details={"sheet_name": selected_sheet, "available_sheets": available_sheets},
             )
+        return workbook.sheet_by_name(selected_sheet), available_sheets, selected_sheet
 
-        sheet = workbook.sheet_by_name(selected_sheet)
-        rows = [
-            [self._normalize_cell(sheet.cell_value(rowx, colx)) for colx in range(sheet.ncols)]
-            for rowx in range(sheet.nrows)
+    def _xls_row(self, sheet: Any, rowx: int) -> List[Any]:
+        return [
+            self._normalize_cell(sheet.cell_value(rowx, colx))
+            for colx in range(sheet.ncols)
         ]
+
+    def _build_xls_index(
+        self, path: Path, *, sheet_name: Optional[str]
+    ) -> Dict[str, Any]:
+        sheet, available_sheets, selected_sheet = self._open_xls_sheet(
+            path, sheet_name=sheet_name
+        )
         return {
             "available_sheets": available_sheets,
             "selected_sheet": selected_sheet,
-            "rows": rows,
-            "total_rows": len(rows),
-            "total_columns": max((len(row) for row in rows), default=0),
+            "header": self._xls_row(sheet, 0) if sheet.nrows else [],
+            "total_rows": sheet.nrows,
+            "total_columns": sheet.ncols if sheet.nrows else 0,
         }
 
+    def _read_xls_window(
+        self,
+        path: Path,
+        row_index: Dict[str, Any],
+        *,
+        row_start: int,
+        row_count: int,
+    ) -> List[List[Any]]:
+        sheet, _available, _selected = self._open_xls_sheet(
+            path, sheet_name=row_index["selected_sheet"]
+        )
+        row_end = min(sheet.nrows, row_start + row_count - 1)
+        return [self._xls_row(sheet, rowx) for rowx in range(row_start - 1, row_end)]
+
     def _normalize_cell(self, value: Any) -> Any:
         if value is None:
             return None
@@ -287,10 +563,9 @@ class ReadSpreadsheetTool(BaseTool):
 
     def _build_columns(
         self,
-        rows: List[List[Any]],
+        headers: List[Any],
         total_columns: int,
     ) -> List[Dict[str, Any]]:
-        headers = rows[0] if rows else []
         columns = []
         for index in range(total_columns):
             label = None
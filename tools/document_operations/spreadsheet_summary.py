@@ -0,0 +1,189 @@
+"""Per-column statistics for spreadsheet `summary` reads."""
+
+from __future__ import annotations
+
+import math
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional
+
+SUMMARY_CHUNK_ROWS = 4096
+SAMPLE_VALUE_LIMIT = 3
+
+
+_NUMPY_UNSET = object()
+_numpy: Any = _NUMPY_UNSET
+
+
+def _load_numpy() -> Any:
+    """Import numpy on the first vectorized update; None when unavailable."""
+    global _numpy
+    if _numpy is _NUMPY_UNSET:
+        try:
+            import numpy
+        except Exception:  # pragma: no cover - optional dependency
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+
+def parse_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value) if math.isfinite(value) else None
+    try:
+        number = float(str(value).strip())
+    except ValueError:
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _json_number(value: float) -> int | float:
+    return int(value) if float(value).is_integer() else float(value)
+
+
+class ColumnAccumulator:
+    """
+    Streaming statistics for one column.
+
+    Values arrive in chunks. With NumPy available a chunk whose non-null
+    cells all parse as numbers is reduced in one vectorized step; anything
+    else falls back to per-cell accumulation.
+    """
+
+    def __init__(self) -> None:
+        self.null_count = 0
+        self.numeric_count = 0
+        self.text_count = 0
+        self.bool_count = 0
+        self.numeric_min: Optional[float] = None
+        self.numeric_max: Optional[float] = None
+        self.numeric_sum = 0.0
+        self.text_min_length: Optional[int] = None
+        self.text_max_length: Optional[int] = None
+        self.samples: List[Any] = []
+
+    def update(self, values: List[Any]) -> None:
+        present = [value for value in values if value is not None]
+        self.null_count += len(values) - len(present)
+        if not present:
+            return
+        self._collect_samples(present)
+        if self._update_numeric_vectorized(present):
+            return
+        for value in present:
+            self._update_one(value)
+
+    def _collect_samples(self, values: List[Any]) -> None:
+        for value in values:
+            if len(self.samples) >= SAMPLE_VALUE_LIMIT:
+                return
+            if value not in self.samples:
+                self.samples.append(value)
+
+    def _update_numeric_vectorized(self, values: List[Any]) -> bool:
+        np = _load_numpy()
+        if np is None or any(isinstance(value, bool) for value in values):
+            return False
+        try:
+            array = np.asarray(values, dtype=object).astype(np.float64)
+        except (TypeError, ValueError):
+            return False
+        if not np.isfinite(array).all():
+            return False
+        self._merge_numeric(
+            count=int(array.size),
+            low=float(array.min()),
+            high=float(array.max()),
+            total=float(array.sum()),
+        )
+        return True
+
+    def _update_one(self, value: Any) -> None:
+        if isinstance(value, bool):
+            self.bool_count += 1
+            return
+        number = parse_number(value)
+        if number is not None:
+            self._merge_numeric(count=1, low=number, high=number, total=number)
+            return
+        length = len(str(value))
+        self.text_count += 1
+        self.text_min_length = (
+            length if self.text_min_length is None else min(self.text_min_length, length)
+        )
+        self.text_max_length = (
+            length if self.text_max_length is None else max(self.text_max_length, length)
+        )
+
+    def _merge_numeric(self, *, count: int, low: float, high: float, total: float) -> None:
+        self.numeric_count += count
+        self.numeric_sum += total
+        self.numeric_min = low if self.numeric_min is None else min(self.numeric_min, low)
+        self.numeric_max = high if self.numeric_max is None else max(self.numeric_max, high)
+
+    @property
+    def inferred_type(self) -> str:
+        kinds = [
+            name
+            for name, count in (
+                ("numeric", self.numeric_count),
+                ("text", self.text_count),
+                ("boolean", self.bool_count),
+            )
+            if count
+        ]
+        if not kinds:
+            return "empty"
+        return kinds[0] if len(kinds) == 1 else "mixed"
+
+    def to_dict(self, *, index: int, label: str) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            "index": index,
+            "label": label,
+            "type": self.inferred_type,
+            "non_null_count": self.numeric_count + self.text_count + self.bool_count,
+            "null_count": self.null_count,
+        }
+        if self.numeric_count:
+            stats["min"] = _json_number(self.numeric_min)
+            stats["max"] = _json_number(self.numeric_max)
+            stats["mean"] = round(self.numeric_sum / self.numeric_count, 6)
+        if self.text_count:
+            stats["text_length_min"] = self.text_min_length
+            stats["text_length_max"] = self.text_max_length
+        if self.inferred_type == "mixed":
+            stats["type_counts"] = {
+                "numeric": self.numeric_count,
+                "text": self.text_count,
+                "boolean": self.bool_count,
+            }
+        stats["sample_values"] = list(self.samples)
+        return stats
+
+
+def summarize_columns(
+    rows: Iterable[List[Any]],
+    *,
+    total_columns: int,
+    labels: List[str],
+    chunk_rows: int = SUMMARY_CHUNK_ROWS,
+) -> List[Dict[str, Any]]:
+    """Consume `rows` once, chunk by chunk, and return per-column statistics."""
+    accumulators = [ColumnAccumulator() for _ in range(total_columns)]
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, max(1, chunk_rows)))
+        if not chunk:
+            break
+        for column_index, accumulator in enumerate(accumulators):
+            accumulator.update(
+                [
+                    row[column_index] if column_index < len(row) else None
+                    for row in chunk
+                ]
+            )
+    return [
+        accumulator.to_dict(index=index + 1, label=labels[index])
+        for index, accumulator in enumerate(accumulators)
+    ]
@@ -0,0 +1,138 @@
+"""Content-addressed on-disk cache for vision helper results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the analysis prompt or normalized payload shape changes so stale
+# entries stop matching instead of being served.
+VISION_CACHE_VERSION = 1
+
+
+def vision_cache_key(
+    image_bytes: bytes,
+    *,
+    model_name: str,
+    purpose: str,
+    variant: str = "",
+) -> str:
+    """Key on the original bytes; `variant` names how they were preprocessed."""
+    digest = hashlib.sha256()
+    digest.update(
+        f"v{VISION_CACHE_VERSION}\0{model_name}\0{purpose}\0{variant}\0".encode("utf-8")
+    )
+    digest.update(image_bytes)
+    return digest.hexdigest()
+
+
+class VisionResultCache:
+    """
+    Store normalized vision payloads as one JSON file per key.
+
+    Entries are keyed by the SHA-256 of the image bytes, model name and
+    purpose. Sizes are tracked in an in-memory LRU index that is built from
+    one directory scan on first use; a hit refreshes the entry's mtime (so
+    the order survives restarts), and eviction drops the least recently used
+    entries once the total exceeds `max_bytes`. Methods do blocking file I/O
+    and are meant to run in a worker thread.
+    """
+
+    def __init__(self, cache_dir: Path, *, max_bytes: int):
+        self._cache_dir = Path(cache_dir)
+        self._max_bytes = max(1, int(max_bytes))
+        self._lock = threading.Lock()
+        # key -> size in bytes, least recently used first.
+        self._index: Optional["OrderedDict[str, int]"] = None
+        self._total_bytes = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._entry_path(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            self._forget(key)
+            return None
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Discarding unreadable vision cache entry %s: %s", path, exc)
+            path.unlink(missing_ok=True)
+            self._forget(key)
+            return None
+        if not isinstance(payload, dict):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            index = self._load_index()
+            if key in index:
+                index.move_to_end(key)
+        return payload
+
+    def put(self, key: str, payload: Dict[str, Any]) -> None:
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                dir=path.parent,
+                delete=False,
+                suffix=".tmp",
+            ) as handle:
+                json.dump(payload, handle, ensure_ascii=False, separators=(",", ":"))
+                tmp_path = handle.name
+            os.replace(tmp_path, path)
+            size = path.stat().st_size
+        except OSError as exc:
+            logger.warning("Failed to write vision cache entry %s: %s", path, exc)
+            return
+        with self._lock:
+            index = self._load_index()
+            self._total_bytes += size - index.pop(key, 0)
+            index[key] = size
+            self._evict(index)
+
+    def _entry_path(self, key: str) -> Path:
+        return self._cache_dir / key[:2] / f"{key}.json"
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            if self._index is not None and key in self._index:
+                self._total_bytes -= self._index.pop(key)
+
+    def _load_index(self) -> "OrderedDict[str, int]":
+        """Scan the cache directory once; callers must hold the lock."""
+        if self._index is not None:
+            return self._index
+        entries = []
+        for path in self._cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        entries.sort()
+        self._index = OrderedDict((key, size) for _mtime, key, size in entries)
+        self._total_bytes = sum(self._index.values())
+        return self._index
+
+    def _evict(self, index: "OrderedDict[str, int]") -> None:
+        while self._total_bytes > self._max_bytes and index:
+            key, size = index.popitem(last=False)
+            self._entry_path(key).unlink(missing_ok=True)
+            self._total_bytes -= size
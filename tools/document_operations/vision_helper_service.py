@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-from ollama import AsyncClient
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from protocol_monk.config.settings import Settings
 from protocol_monk.exceptions.tools import ToolError
+from protocol_monk.tools.document_operations.image_preprocessing import (
+    prepare_vision_image,
+)
+from protocol_monk.tools.document_operations.vision_cache import (
+    VisionResultCache,
+    vision_cache_key,
+)
+
+if TYPE_CHECKING:
+    from ollama import AsyncClient
 
 logger = logging.getLogger(__name__)
 
@@ -17,13 +26,43 @@ logger = logging.getLogger(__name__)
 class VisionHelperService:
     """Ollama-backed helper for image understanding and OCR-like extraction."""
 
-    def __init__(self, settings: Settings, client: Optional[AsyncClient] = None):
+    def __init__(
+        self,
+        settings: Settings,
+        client: Optional[AsyncClient] = None,
+        cache: Optional[VisionResultCache] = None,
+    ):
         self._settings = settings
-        headers: Dict[str, str] = {}
-        api_key = getattr(settings, "ollama_api_key", None)
-        if api_key:
-            headers["Authorization"] = f"Bearer {api_key}"
-        self._client = client or AsyncClient(host=settings.ollama_host, headers=headers)
+        self._client_instance = client
+        self._cache = cache if cache is not None else self._build_cache(settings)
+
+    @staticmethod
+    def _build_cache(settings: Settings) -> Optional[VisionResultCache]:
+        if not getattr(settings, "document_vision_cache_enabled", True):
+            return None
+        resolved_paths = getattr(settings, "resolved_paths", None)
+        if resolved_paths is None:
+            return None
+        max_mb = int(getattr(settings, "document_vision_cache_max_mb", 128) or 128)
+        return VisionResultCache(
+            resolved_paths.state_home / "cache" / "vision",
+            max_bytes=max_mb * 1024 * 1024,
+        )
+
+    @property
+    def _client(self) -> AsyncClient:
+        # The Ollama SDK is only imported once a document actually needs vision.
+        if self._client_instance is None:
+            from ollama import AsyncClient
+
+            headers: Dict[str, str] = {}
+            api_key = getattr(self._settings, "ollama_api_key", None)
+            if api_key:
+                headers["Authorization"] = f"Bearer {api_key}"
+            self._client_instance = AsyncClient(
+                host=self._settings.ollama_host, headers=headers
+            )
+        return self._client_instance
 
     async def analyze_image(
         self,
@@ -39,7 +78,35 @@ class VisionHelperService:
 
         model_name = self._resolve_model_name()
 
-        encoded_image = base64.b64encode(image_path.read_bytes()).decode("ascii")
+        image_bytes = image_path.read_bytes()
+        max_edge, image_format, quality = self._preprocessing_profile()
+        cache_key = None
+        if self._cache is not None:
+            cache_key = vision_cache_key(
+                image_bytes,
+                model_name=model_name,
+                purpose=purpose,
+                variant=f"{image_format}:{max_edge}:{quality}",
+            )
+            cached = await asyncio.to_thread(self._cache.get, cache_key)
+            if cached is not None:
+                return {
+                    **self._normalize_payload(cached),
+                    "cache_hit": True,
+                    "vision_input": {
+                        "original_bytes": len(image_bytes),
+                        "sent_bytes": 0,
+                    },
+                }
+
+        prepared = await asyncio.to_thread(
+            prepare_vision_image,
+            image_bytes,
+            max_edge=max_edge,
+            image_format=image_format,
+            quality=quality,
+        )
+        encoded_image = base64.b64encode(prepared.data).decode("ascii")
         prompt = self._build_analysis_prompt(purpose)
         raw_response = await self._request_json_with_image(
             model_name=model_name,
@@ -62,7 +129,22 @@ class VisionHelperService:
                     details={"raw_response": raw_response[:1000]},
                 )
 
-        return self._normalize_payload(parsed)
+        normalized = self._normalize_payload(parsed)
+        if self._cache is not None and cache_key is not None:
+            await asyncio.to_thread(self._cache.put, cache_key, normalized)
+        return {
+            **normalized,
+            "cache_hit": False,
+            "vision_input": prepared.to_metadata(),
+        }
+
+    def _preprocessing_profile(self) -> tuple[int, str, int]:
+        max_edge = int(getattr(self._settings, "document_vision_max_edge", 1568) or 1568)
+        image_format = str(
+            getattr(self._settings, "document_vision_image_format", "jpeg") or "jpeg"
+        ).lower()
+        quality = int(getattr(self._settings, "document_vision_image_quality", 85) or 85)
+        return max_edge, image_format, quality
 
     def _resolve_model_name(self) -> str:
         explicit_model = str(
@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
+import hashlib
+import os
 from pathlib import Path
 from typing import List, Optional, Tuple, Dict, Any
 
 from protocol_monk.exceptions.tools import ToolError
 from protocol_monk.tools.base import BaseTool
 from protocol_monk.tools.output_contract import (
+    DEFAULT_READ_PAGE_LINES,
+    RESULT_METADATA_KEY,
     build_line_pagination,
     build_tool_output,
+    encode_lines,
+    resolve_line_encoding,
     summarize_line_range,
 )
 
@@ -15,17 +21,35 @@ class ReadFileTool(BaseTool):
     """Tool for reading specific lines from a file."""
 
     MAX_FILE_SIZE_BYTES: int = 1 * 1024 * 1024  # 1 MB limit
-    DEFAULT_PAGE_LINES: int = 200
+    DEFAULT_PAGE_LINES: int = DEFAULT_READ_PAGE_LINES
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        self._file_tracker = None
+
+    def attach_file_tracker(self, tracker) -> None:
+        """
+        Let the tool see which reads are still live in context (a FileTracker).
+        Without one, every call returns the file content.
+        """
+        self._file_tracker = tracker
 
     @property
     def name(self) -> str:
         return "read_file"
 
+    @property
+    def is_read_only(self) -> bool:
+        return True
+
     @property
     def description(self) -> str:
         return (
-            "Read file contents as structured line records. "
-            "Defaults to the first 200 lines unless a line range is provided."
+            "Read file contents with their 1-based line numbers. "
+            "Defaults to the first 200 lines unless a line range is provided. "
+            "If the same range is already in context and the file is unchanged, "
+            "returns a short 'unchanged' result instead; pass force=true to "
+            "re-send the content."
         )
 
     @property
@@ -48,6 +72,13 @@ class ReadFileTool(BaseTool):
                     "type": "integer",
                     "description": "Ending line number (1-based, optional, inclusive).",
                 },
+                "force": {
+                    "type": "boolean",
+                    "description": (
+                        "Return the content even if an identical read is already "
+                        "in context (optional, default false)."
+                    ),
+                },
             },
             "required": ["filepath"],
         }
@@ -69,18 +100,29 @@ class ReadFileTool(BaseTool):
         # Validator is initialized in BaseTool
         cleaned_path = self.path_validator.validate_path(filepath, must_exist=False)
 
-        # 1. Read File
-        lines = self._validate_and_read(cleaned_path)
-
-        # 2. Extract Range
         start = kwargs.get("line_start")
         end = kwargs.get("line_end")
+        force = kwargs.get("force") is True
+
+        # 1. Skip the read entirely if the live copy's mtime and size still match
+        prior = None if force else self._live_read(cleaned_path, start, end)
+        if prior is not None and self._stat_matches(cleaned_path, prior):
+            return self._build_unchanged_output(str(cleaned_path), start, end, prior)
+
+        # 2. Read File
+        lines, file_stat = self._validate_and_read(cleaned_path)
+
+        # 3. Extract Range
         selected_lines, actual_start, actual_end = self._extract_range(
             lines, start, end
         )
+        fingerprint = self._fingerprint(selected_lines, len(lines))
+        if prior is not None and prior.fingerprint == fingerprint:
+            # Touched but identical (e.g. rewritten with the same content)
+            return self._build_unchanged_output(str(cleaned_path), start, end, prior)
 
-        # 3. Format Output
-        return self._build_output(
+        # 4. Format Output
+        output = self._build_output(
             str(cleaned_path),
             total_lines=len(lines),
             lines=selected_lines,
@@ -89,8 +131,68 @@ class ReadFileTool(BaseTool):
             actual_start=actual_start,
             actual_end=actual_end,
         )
+        output[RESULT_METADATA_KEY] = {
+            "read_fingerprint": {
+                "content": fingerprint,
+                "mtime_ns": file_stat.st_mtime_ns,
+                "size": file_stat.st_size,
+                "range_key": list(self.range_key(start, end)),
+            }
+        }
+        return output
 
-    def _validate_and_read(self, full_path: Path) -> List[str]:
+    @staticmethod
+    def range_key(
+        start: Optional[int], end: Optional[int]
+    ) -> Tuple[int, Optional[int]]:
+        """Normalized requested range used to match repeated reads."""
+        return (start if start else 1, end if end else None)
+
+    def _live_read(self, path: Path, start: Optional[int], end: Optional[int]):
+        if self._file_tracker is None:
+            return None
+        return self._file_tracker.get_read(str(path), *self.range_key(start, end))
+
+    @staticmethod
+    def _stat_matches(path: Path, prior) -> bool:
+        try:
+            file_stat = path.stat()
+        except OSError:
+            return False
+        return (
+            file_stat.st_mtime_ns == prior.mtime_ns and file_stat.st_size == prior.size
+        )
+
+    @staticmethod
+    def _fingerprint(lines: List[str], total_lines: int) -> str:
+        digest = hashlib.sha256(f"{total_lines}\n".encode("utf-8"))
+        for line in lines:
+            digest.update(line.encode("utf-8"))
+            digest.update(b"\n")
+        return digest.hexdigest()[:16]
+
+    def _build_unchanged_output(
+        self,
+        filepath: str,
+        start: Optional[int],
+        end: Optional[int],
+        prior,
+    ) -> Dict[str, Any]:
+        return build_tool_output(
+            result_type="file_read_unchanged",
+            summary=(
+                f"{filepath} is unchanged since tool call {prior.tool_call_id}; "
+                "that result is still in context. Use force=true to re-read."
+            ),
+            data={
+                "path": filepath,
+                "requested_range": {"line_start": start, "line_end": end},
+                "unchanged_since": prior.message_id,
+                "unchanged_since_tool_call_id": prior.tool_call_id,
+            },
+        )
+
+    def _validate_and_read(self, full_path: Path) -> Tuple[List[str], os.stat_result]:
         try:
             file_stat = full_path.stat()
             if file_stat.st_size > self.MAX_FILE_SIZE_BYTES:
@@ -106,7 +208,7 @@ class ReadFileTool(BaseTool):
                 )
 
             content = full_path.read_text(encoding="utf-8")
-            return content.splitlines()
+            return content.splitlines(), file_stat
 
         except FileNotFoundError:
             raise ToolError(
@@ -167,11 +269,12 @@ class ReadFileTool(BaseTool):
         actual_start: int,
         actual_end: int,
     ) -> Dict[str, Any]:
-        line_records = [
-            {"line_number": actual_start + index, "text": line}
-            for index, line in enumerate(lines)
-        ]
-        returned_count = len(line_records)
+        line_records = encode_lines(
+            lines,
+            start=actual_start,
+            encoding=resolve_line_encoding(self.settings),
+        )
+        returned_count = len(lines)
         page_size = returned_count or self.DEFAULT_PAGE_LINES
         pagination = build_line_pagination(
             total_lines=total_lines,
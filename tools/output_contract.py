@@ -5,6 +5,21 @@ from typing import Any, Dict, List, Optional, Tuple
 
 TOOL_OUTPUT_SCHEMA_VERSION = "tool_output.v1"
 DEFAULT_STREAM_CHAR_LIMIT = 4000
+# Lines read_file returns when no range end is given; context masking uses it
+# to tell which lines a default read covered.
+DEFAULT_READ_PAGE_LINES = 200
+# Key a tool may add to its output for runtime-only bookkeeping. The executor
+# moves it into ToolResult.metadata, so it never reaches the model.
+RESULT_METADATA_KEY = "_result_metadata"
+
+# How line-oriented output (file reads, process streams) is encoded:
+# - records:  [{"line_number": N, "text": "..."}, ...] (original form)
+# - columnar: {"encoding": "columnar", "start": N, "lines": ["...", ...]}
+# - numbered: {"encoding": "numbered", "start": N, "text": "N|...\nN+1|..."}
+# Records roughly double the tokens of the raw text once JSON-encoded, but
+# they stay the fallback: compact encodings are opt-in per model or family.
+LINE_ENCODINGS = ("records", "columnar", "numbered")
+DEFAULT_LINE_ENCODING = "records"
 
 
 def build_tool_output(
@@ -23,6 +38,55 @@ def build_tool_output(
     }
 
 
+def encode_lines(
+    lines: List[str],
+    *,
+    start: int = 1,
+    encoding: str = "records",
+) -> Any:
+    if encoding == "columnar":
+        return {"encoding": "columnar", "start": start, "lines": list(lines)}
+    if encoding == "numbered":
+        return {
+            "encoding": "numbered",
+            "start": start,
+            "text": "\n".join(
+                f"{start + index}|{line}" for index, line in enumerate(lines)
+            ),
+        }
+    return [
+        {"line_number": start + index, "text": line}
+        for index, line in enumerate(lines)
+    ]
+
+
+def resolve_line_encoding(settings: Any) -> str:
+    """
+    Pick the line encoding for the active model.
+
+    An explicit TOOL_LINE_ENCODING wins; with `auto`, the active model's
+    `tool_line_encoding` from models.json is used, then the family mapping
+    in TOOL_LINE_ENCODING_BY_FAMILY, then DEFAULT_LINE_ENCODING.
+    """
+    configured = str(getattr(settings, "tool_line_encoding", "auto") or "auto")
+    if configured in LINE_ENCODINGS:
+        return configured
+
+    model_config = getattr(settings, "_active_model_config", None)
+    if isinstance(model_config, dict):
+        per_model = str(model_config.get("tool_line_encoding") or "").strip().lower()
+        if per_model in LINE_ENCODINGS:
+            return per_model
+
+    family = str(getattr(settings, "model_family", "") or "").strip().lower()
+    by_family = getattr(settings, "tool_line_encoding_by_family", None) or {}
+    if isinstance(by_family, dict):
+        per_family = str(by_family.get(family) or "").strip().lower()
+        if per_family in LINE_ENCODINGS:
+            return per_family
+    return DEFAULT_LINE_ENCODING
+
+
 def count_lines(text: str) -> int:
     if not text:
         return 0
@@ -33,6 +97,7 @@ def build_text_stream(
     text: str,
     *,
     char_limit: int = DEFAULT_STREAM_CHAR_LIMIT,
+    line_encoding: str = "records",
 ) -> Dict[str, Any]:
     normalized = str(text or "")
     returned_text = normalized[:char_limit]
@@ -47,10 +112,7 @@ def build_text_stream(
         "returned_char_count": len(returned_text),
         "truncated": omitted_char_count > 0,
         "omitted_char_count": omitted_char_count,
-        "lines": [
-            {"line_number": index + 1, "text": line}
-            for index, line in enumerate(returned_lines)
-        ],
+        "lines": encode_lines(returned_lines, start=1, encoding=line_encoding),
     }
 
 
@@ -196,6 +258,7 @@ def build_process_output(
     stderr: str,
     extra_data: Optional[Dict[str, Any]] = None,
     parse_json_streams: bool = False,
+    line_encoding: str = "records",
 ) -> Dict[str, Any]:
     data: Dict[str, Any] = {
         "command": command,
@@ -208,8 +271,8 @@ def build_process_output(
         output_format, parsed_output = detect_json_stream_output(stdout, stderr)
         data["output_format"] = output_format
         data["parsed_output"] = parsed_output
-    data["stdout"] = build_text_stream(stdout)
-    data["stderr"] = build_text_stream(stderr)
+    data["stdout"] = build_text_stream(stdout, line_encoding=line_encoding)
+    data["stderr"] = build_text_stream(stderr, line_encoding=line_encoding)
 
     return build_tool_output(
         result_type=result_type,
@@ -229,6 +292,7 @@ def build_git_operation_output(
     git_result: Dict[str, Any],
     stdout: str,
     stderr: str,
+    line_encoding: str = "records",
 ) -> Dict[str, Any]:
     data: Dict[str, Any] = {
         "operation": operation,
@@ -236,8 +300,8 @@ def build_git_operation_output(
         "cwd": cwd,
         "exit_code": exit_code,
         "git_result": git_result,
-        "stdout": build_text_stream(stdout),
-        "stderr": build_text_stream(stderr),
+        "stdout": build_text_stream(stdout, line_encoding=line_encoding),
+        "stderr": build_text_stream(stderr, line_encoding=line_encoding),
     }
     return build_tool_output(
         result_type="git_operation",
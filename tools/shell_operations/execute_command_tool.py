@@ -4,7 +4,10 @@ from typing import Dict, Any, Tuple
 from protocol_monk.exceptions.tools import ToolError
 from protocol_monk.tools.base import BaseTool
 from protocol_monk.config.settings import Settings
-from protocol_monk.tools.output_contract import build_process_output
+from protocol_monk.tools.output_contract import (
+    build_process_output,
+    resolve_line_encoding,
+)
 from protocol_monk.tools.shell_operations.process_runner import run_shell_command
 
 
@@ -103,6 +106,7 @@ class ExecuteCommandTool(BaseTool):
                     "shell": True,
                 },
                 parse_json_streams=True,
+                line_encoding=resolve_line_encoding(self.settings),
             )
 
         except subprocess.TimeoutExpired:
@@ -4,7 +4,10 @@ from typing import Any, Dict, List, Optional, Sequence, Tuple
 from protocol_monk.config.settings import Settings
 from protocol_monk.exceptions.tools import ToolError
 from protocol_monk.tools.base import BaseTool
-from protocol_monk.tools.output_contract import build_git_operation_output
+from protocol_monk.tools.output_contract import (
+    build_git_operation_output,
+    resolve_line_encoding,
+)
 from protocol_monk.tools.shell_operations.process_runner import run_exec_command
 
 
@@ -104,6 +107,7 @@ class GitOperationTool(BaseTool):
                 git_result=git_result,
                 stdout=result.stdout,
                 stderr=result.stderr,
+                line_encoding=resolve_line_encoding(self.settings),
             )
 
         except Exception as e:
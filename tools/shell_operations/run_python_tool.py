@@ -9,7 +9,11 @@ from protocol_monk.exceptions.base import log_exception
 from protocol_monk.exceptions.tools import ToolError
 from protocol_monk.tools.base import BaseTool
 from protocol_monk.config.settings import Settings
-from protocol_monk.tools.output_contract import build_process_output, build_tool_output
+from protocol_monk.tools.output_contract import (
+    build_process_output,
+    build_tool_output,
+    resolve_line_encoding,
+)
 from protocol_monk.tools.shell_operations.process_runner import run_exec_command
 
 
@@ -96,6 +100,7 @@ class RunPythonTool(BaseTool):
                     "shell": False,
                 },
                 parse_json_streams=True,
+                line_encoding=resolve_line_encoding(self.settings),
             )
             if result.returncode != 0:
                 raise ToolError(
@@ -285,19 +285,50 @@ def _format_value(value: Any) -> str:
     return json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
 
 
-def _format_line_records(value: Any) -> list[str]:
-    if not isinstance(value, list):
+def _iter_line_records(value: Any) -> list[tuple[Optional[int], str]]:
+    """Decode any of the output contract's line encodings to (number, text)."""
+    if isinstance(value, list):
+        records: list[tuple[Optional[int], str]] = []
+        for item in value:
+            if not isinstance(item, dict):
+                continue
+            number = item.get("line_number")
+            records.append(
+                (None if number is None else int(number), str(item.get("text", "")))
+            )
+        return records
+    if not isinstance(value, dict):
         return []
+
+    raw_start = value.get("start")
+    start = raw_start if isinstance(raw_start, int) and raw_start > 0 else 1
+    encoding = value.get("encoding")
+    if encoding == "columnar" and isinstance(value.get("lines"), list):
+        return [
+            (start + index, str(line)) for index, line in enumerate(value["lines"])
+        ]
+    if encoding == "numbered" and isinstance(value.get("text"), str):
+        text = value["text"]
+        if not text:
+            return []
+        records = []
+        for index, raw_line in enumerate(text.split("\n")):
+            number, separator, line = raw_line.partition("|")
+            if separator and number.isdigit():
+                records.append((int(number), line))
+            else:
+                records.append((start + index, raw_line))
+        return records
+    return []
+
+
+def _format_line_records(value: Any) -> list[str]:
     lines: list[str] = []
-    for item in value:
-        if not isinstance(item, dict):
-            continue
-        number = item.get("line_number")
-        text = str(item.get("text", ""))
+    for number, text in _iter_line_records(value):
         if number is None:
             lines.append(text)
         else:
-            lines.append(f"{int(number):>4}│ {text}")
+            lines.append(f"{number:>4}│ {text}")
     return lines
 
 
@@ -358,11 +389,9 @@ def _measure_view(
 
     data = output.get("data")
     if isinstance(data, dict):
-        line_records = data.get("lines")
-        if isinstance(line_records, list):
-            char_candidates.append(
-                sum(len(str(item.get("text", ""))) for item in line_records if isinstance(item, dict))
-            )
+        line_records = _iter_line_records(data.get("lines"))
+        if line_records:
+            char_candidates.append(sum(len(text) for _number, text in line_records))
             line_candidates.append(len(line_records))
 
         for key in ("stdout", "stderr"):
@@ -411,6 +440,8 @@ def _build_result_sections(
 ) -> list[ToolOutputSection]:
     if result_type == "spreadsheet_read":
         return _build_spreadsheet_sections(data)
+    if result_type == "spreadsheet_summary":
+        return _build_spreadsheet_summary_sections(data)
     if result_type == "pdf_read":
         return _build_pdf_sections(data)
     if result_type == "image_read":
@@ -439,6 +470,35 @@ def _build_spreadsheet_sections(data: dict[str, Any]) -> list[ToolOutputSection]
     return sections
 
 
+def _build_spreadsheet_summary_sections(
+    data: dict[str, Any],
+) -> list[ToolOutputSection]:
+    sections: list[ToolOutputSection] = []
+    metadata_lines = [
+        f"{key}: {_format_value(value)}"
+        for key, value in data.items()
+        if key != "columns"
+    ]
+    if metadata_lines:
+        sections.append(ToolOutputSection(title="Metadata", lines=tuple(metadata_lines)))
+
+    column_lines: list[str] = []
+    for item in data.get("columns") or []:
+        if not isinstance(item, dict):
+            continue
+        stats = ", ".join(
+            f"{key}={_format_value(value)}"
+            for key, value in item.items()
+            if key not in {"index", "label"}
+        )
+        label = str(item.get("label", ""))
+        column_lines.append(f"{int(item.get('index') or 0):>4}│ {label}: {stats}")
+    if column_lines:
+        sections.append(ToolOutputSection(title="Columns", lines=tuple(column_lines)))
+
+    return sections
+
+
 def _build_pdf_sections(data: dict[str, Any]) -> list[ToolOutputSection]:
     sections: list[ToolOutputSection] = []
     metadata_lines = [
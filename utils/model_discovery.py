@@ -6,6 +6,7 @@ Queries Ollama directly using `list` and `show`, extracts actual model metadata,
 and persists it with support for user overrides.
 """
 
+import asyncio
 import json
 import logging
 import re
@@ -17,6 +18,9 @@ from ollama import AsyncClient
 
 logger = logging.getLogger("ModelDiscovery")
 
+# Strong references keep fire-and-forget verification tasks alive until done.
+_BACKGROUND_REFRESH_TASKS: set[asyncio.Task] = set()
+
 
 class ModelDiscovery:
     def __init__(
@@ -25,14 +29,29 @@ class ModelDiscovery:
         self._models_path = models_json_path
         self._client = AsyncClient(host=ollama_host)
 
-    async def discover_and_update(self, force_refresh: bool = False) -> Dict[str, Any]:
+    async def discover_and_update(
+        self, force_refresh: bool = False, verify_in_background: bool = False
+    ) -> Dict[str, Any]:
         """
         Discover models via Ollama and update local cache.
         Preserves user overrides between runs.
+
+        With verify_in_background, a fresh cache is returned immediately and the
+        live model list is checked afterwards; any refresh lands on disk for the
+        next session.
         """
         existing = self._load_existing_config()
         cached_is_fresh = not force_refresh and self._is_config_fresh(existing)
 
+        if cached_is_fresh and verify_in_background:
+            task = asyncio.create_task(
+                self._verify_cached_config(existing), name="ollama-model-refresh"
+            )
+            _BACKGROUND_REFRESH_TASKS.add(task)
+            task.add_done_callback(_BACKGROUND_REFRESH_TASKS.discard)
+            logger.info("Using cached model configuration; verifying in background.")
+            return existing
+
         if cached_is_fresh:
             try:
                 live_model_names = await self._query_ollama_models()
@@ -59,6 +78,22 @@ class ModelDiscovery:
         logger.info(f"Discovered {len(config['models'])} models.")
         return config
 
+    async def _verify_cached_config(self, existing: Dict[str, Any]) -> None:
+        """Refresh models.json in the background if the live model list drifted."""
+        try:
+            live_model_names = await self._query_ollama_models()
+            if self._model_names_match(existing, live_model_names):
+                return
+            logger.info(
+                "Live Ollama model list changed; refreshing cached model configuration."
+            )
+            config = await self._build_config(live_model_names, existing)
+            self._save_config(config)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("Background model verification failed: %s", exc)
+
     def _load_existing_config(self) -> Dict[str, Any]:
         """Load existing models.json if present."""
         if self._models_path.exists():
@@ -438,6 +473,9 @@ class ModelDiscovery:
             config["default_model"] = existing_default
         elif model_names:
             config["default_model"] = model_names[0]
+        existing_utility = existing.get("utility_model")
+        if existing_utility in config["models"]:
+            config["utility_model"] = existing_utility
 
         return config
 
@@ -464,9 +502,12 @@ async def discover_models(
     models_json_path: Path,
     ollama_host: str = "http://localhost:11434",
     force_refresh: bool = False,
+    verify_in_background: bool = False,
 ) -> Dict[str, Any]:
     """
     Main public interface to trigger discovery process.
     """
     discovery = ModelDiscovery(models_json_path, ollama_host)
-    return await discovery.discover_and_update(force_refresh)
+    return await discovery.discover_and_update(
+        force_refresh, verify_in_background=verify_in_background
+    )
@@ -6,6 +6,7 @@ import json
 import logging
 import os
 import re
+import tempfile
 from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
@@ -28,11 +29,17 @@ class OpenRouterModelDiscovery:
         base_url: str = "https://openrouter.ai/api/v1",
         api_key: str | None = None,
         timeout_seconds: int = 20,
+        catalog_cache_path: Path | None = None,
     ):
         self._models_path = Path(models_json_path)
         self._base_url = str(base_url or "https://openrouter.ai/api/v1").rstrip("/")
         self._api_key = (api_key or os.getenv("OPENROUTER_API_KEY") or "").strip()
         self._timeout_seconds = max(1, int(timeout_seconds))
+        # Enables ETag/Last-Modified revalidation; callers resolve it under
+        # settings.resolved_paths.state_home. None always downloads in full.
+        self._catalog_cache_path = (
+            Path(catalog_cache_path) if catalog_cache_path is not None else None
+        )
 
     def build_updated_config(
         self,
@@ -156,11 +163,24 @@ class OpenRouterModelDiscovery:
         if self._api_key:
             headers["Authorization"] = f"Bearer {self._api_key}"
 
+        cached = self._load_catalog_cache()
+        if cached is not None and cached.get("url") == url:
+            if cached.get("etag"):
+                headers["If-None-Match"] = str(cached["etag"])
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = str(cached["last_modified"])
+        else:
+            cached = None
+
         req = urllib_request.Request(url, headers=headers, method="GET")
         try:
             with urllib_request.urlopen(req, timeout=self._timeout_seconds) as response:
                 payload = json.loads(response.read().decode("utf-8"))
+                response_headers = response.headers
         except urllib_error.HTTPError as exc:
+            if exc.code == 304 and cached is not None:
+                logger.info("OpenRouter catalog not modified; using cached copy.")
+                return self._extract_catalog_data(cached)
             body = exc.read().decode("utf-8", errors="replace")
             raise ConfigError(
                 f"OpenRouter models request failed ({exc.code}): {body}"
@@ -173,12 +193,63 @@ class OpenRouterModelDiscovery:
             raise ConfigError(
                 f"OpenRouter models response is not valid JSON: {exc}"
             ) from exc
+        except (TimeoutError, OSError) as exc:
+            raise ConfigError(f"OpenRouter models request failed: {exc}") from exc
+
+        catalog = self._extract_catalog_data(payload)
+        self._save_catalog_cache(
+            {
+                "url": url,
+                "etag": response_headers.get("ETag"),
+                "last_modified": response_headers.get("Last-Modified"),
+                "fetched_at": datetime.now().isoformat(),
+                "data": catalog,
+            }
+        )
+        return catalog
 
-        data = payload.get("data")
+    @staticmethod
+    def _extract_catalog_data(payload: Any) -> List[Dict[str, Any]]:
+        data = payload.get("data") if isinstance(payload, dict) else None
         if not isinstance(data, list):
             raise ConfigError("OpenRouter models response missing 'data' array.")
         return [item for item in data if isinstance(item, dict)]
 
+    def _load_catalog_cache(self) -> Dict[str, Any] | None:
+        if self._catalog_cache_path is None or not self._catalog_cache_path.exists():
+            return None
+        try:
+            cached = json.loads(self._catalog_cache_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning(
+                "Ignoring unreadable OpenRouter catalog cache %s: %s",
+                self._catalog_cache_path,
+                exc,
+            )
+            return None
+        if not isinstance(cached, dict) or not isinstance(cached.get("data"), list):
+            return None
+        return cached
+
+    def _save_catalog_cache(self, cache_entry: Dict[str, Any]) -> None:
+        if self._catalog_cache_path is None:
+            return
+        path = self._catalog_cache_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                dir=path.parent,
+                delete=False,
+                suffix=".tmp",
+            ) as handle:
+                json.dump(cache_entry, handle, ensure_ascii=False)
+                tmp_path = handle.name
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Failed to write OpenRouter catalog cache %s: %s", path, exc)
+
     @staticmethod
     def _catalog_by_id(catalog: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         indexed: Dict[str, Dict[str, Any]] = {}
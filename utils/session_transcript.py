@@ -8,16 +8,27 @@ import time
 import uuid
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from protocol_monk.protocol.bus import EventBus
 from protocol_monk.protocol.events import EventTypes
+from protocol_monk.utils.transcript_format import (
+    IndexedTranscriptWriter,
+    JsonlTranscriptWriter,
+    PendingBlock,
+)
+from protocol_monk.utils.transcript_retention import TranscriptRetentionManifest
 
 logger = logging.getLogger("SessionTranscript")
 
 
 class SessionTranscriptSink:
-    """Append-only JSONL recorder for all event bus activity."""
+    """
+    Append-only recorder for all event bus activity.
+
+    `transcript_format="jsonl"` writes one line per event; `"indexed"` writes
+    compressed blocks plus a sidecar index (see utils.transcript_format).
+    """
 
     def __init__(
         self,
@@ -25,39 +36,80 @@ class SessionTranscriptSink:
         workspace_root: Path,
         max_sessions: int = 200,
         max_total_bytes: int = 250 * 1024 * 1024,
+        compress_pruned: bool = False,
+        transcript_format: str = "jsonl",
+        codec: str = "auto",
     ):
         self._bus = bus
         self._workspace_root = Path(workspace_root)
         self._session_id = f"{int(time.time())}-{uuid.uuid4().hex[:8]}"
         self._sequence = 0
         self._lock = asyncio.Lock()
+        # Serializes block writes so they land in the order they were taken.
+        self._flush_lock = asyncio.Lock()
         self._schema_version = 2
         self._max_sessions = max(1, int(max_sessions))
         self._max_total_bytes = max(1, int(max_total_bytes))
-        self._path = (
-            self._workspace_root
-            / ".protocol_monk"
-            / "sessions"
-            / f"{self._session_id}.jsonl"
-        )
+        self._compress_pruned = bool(compress_pruned)
+        self._prune_task: asyncio.Task | None = None
+        session_dir = self._workspace_root / ".protocol_monk" / "sessions"
+        if transcript_format == "indexed":
+            self._writer = IndexedTranscriptWriter(
+                session_dir / f"{self._session_id}{IndexedTranscriptWriter.suffix}",
+                session_id=self._session_id,
+                codec=codec,
+            )
+        else:
+            self._writer = JsonlTranscriptWriter(
+                session_dir / f"{self._session_id}{JsonlTranscriptWriter.suffix}"
+            )
+        self._path = self._writer.path
 
     @property
     def path(self) -> Path:
         return self._path
 
+    @property
+    def prune_task(self) -> asyncio.Task | None:
+        return self._prune_task
+
     async def start(self) -> None:
         """Create session file and subscribe to all known event types."""
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._prune_retention()
 
         await self._append("session_start", {"session_id": self._session_id})
-        self._prune_retention()
 
         for event_type in EventTypes:
             await self._bus.subscribe(
                 event_type, self._make_event_handler(event_type.value)
             )
 
+        # Retention pruning stats every transcript, so keep it off the boot path.
+        self._prune_task = asyncio.create_task(
+            asyncio.to_thread(self._prune_retention),
+            name="session-transcript-prune",
+        )
+
+    async def stop(self) -> None:
+        """Flush any buffered records (indexed format) and wait for pruning."""
+        async with self._lock:
+            block = self._writer.take_block()
+        await self._write_block(block)
+        if self._prune_task is not None:
+            # The prune thread can't be cancelled; let it finish before the
+            # caller tears the workspace down under it.
+            (outcome,) = await asyncio.gather(self._prune_task, return_exceptions=True)
+            if isinstance(outcome, Exception):
+                logger.warning("Transcript retention pruning failed: %s", outcome)
+
+    async def _write_block(self, block: Optional[PendingBlock]) -> None:
+        if block is None:
+            return
+        # Compression and file I/O run off the event loop; appends keep
+        # buffering into the next block meanwhile.
+        async with self._flush_lock:
+            await asyncio.to_thread(self._writer.write_block, block)
+
     def _make_event_handler(self, event_name: str):
         async def _handler(payload: Any) -> None:
             await self._append(event_name, payload)
@@ -78,9 +130,15 @@ class SessionTranscriptSink:
         self._sequence += 1
 
         line = json.dumps(record, ensure_ascii=True, separators=(",", ":"))
+        block = None
         async with self._lock:
-            with self._path.open("a", encoding="utf-8") as f:
-                f.write(line + "\n")
+            if self._writer.write(
+                line,
+                event_type=event_type,
+                turn_id=record["correlation"].get("turn_id"),
+            ):
+                block = self._writer.take_block()
+        await self._write_block(block)
 
     def _extract_correlation(self, payload: Any) -> Dict[str, Any]:
         if not isinstance(payload, dict):
@@ -113,32 +171,18 @@ class SessionTranscriptSink:
         return correlation
 
     def _prune_retention(self) -> None:
-        session_dir = self._path.parent
-        files = sorted(
-            session_dir.glob("*.jsonl"),
-            key=lambda p: p.stat().st_mtime if p.exists() else 0,
-            reverse=True,
+        manifest = TranscriptRetentionManifest(self._path.parent)
+        manifest.load()
+        manifest.refresh(open_names=frozenset({self._path.name}))
+        manifest.prune(
+            max_sessions=self._max_sessions,
+            max_total_bytes=self._max_total_bytes,
+            compress=self._compress_pruned,
         )
-        kept = 0
-        total_bytes = 0
-        for file_path in files:
-            try:
-                file_size = file_path.stat().st_size
-            except OSError:
-                continue
-
-            should_keep = kept < self._max_sessions and (
-                total_bytes + file_size <= self._max_total_bytes or kept == 0
-            )
-            if should_keep:
-                kept += 1
-                total_bytes += file_size
-                continue
-
-            try:
-                file_path.unlink()
-            except OSError as exc:
-                logger.warning("Failed to prune session transcript %s: %s", file_path, exc)
+        try:
+            manifest.save()
+        except OSError as exc:
+            logger.warning("Failed to write transcript manifest %s: %s", manifest.path, exc)
 
     def _serialize(self, payload: Any) -> Any:
         if payload is None:
@@ -0,0 +1,182 @@
+"""Per-phase startup tracing for boot metrics and `--profile-startup` runs."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+STARTUP_METRICS_SCHEMA_VERSION = 1
+
+
+@dataclass
+class StartupPhase:
+    name: str
+    kind: str
+    started_at: float
+    ended_at: Optional[float] = None
+    background: bool = False
+    modules_loaded: Optional[int] = None
+
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        if self.ended_at is None:
+            return None
+        return self.ended_at - self.started_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        duration = self.duration_seconds
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "background": self.background,
+            "start_ms": round(self.started_at * 1000, 3),
+            "end_ms": None if self.ended_at is None else round(self.ended_at * 1000, 3),
+            "duration_ms": None if duration is None else round(duration * 1000, 3),
+            "modules_loaded": self.modules_loaded,
+        }
+
+
+class StartupProfiler:
+    """
+    Record monotonic start/end times for boot phases.
+
+    Phases are recorded even when profiling is disabled so callers never need
+    to branch; only rendering is gated on `enabled`. Each foreground phase also
+    records how many modules it pulled into `sys.modules`, which is the cheap
+    way to spot import-time cost without an import hook.
+    """
+
+    def __init__(self, *, enabled: bool = False, origin: Optional[float] = None):
+        self.enabled = bool(enabled)
+        self._origin = time.perf_counter() if origin is None else float(origin)
+        self._phases: List[StartupPhase] = []
+        self._marks: Dict[str, float] = {}
+
+    @property
+    def phases(self) -> List[StartupPhase]:
+        return list(self._phases)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._origin
+
+    def mark(self, name: str) -> float:
+        """Record a named instant, e.g. `ready`, relative to the origin."""
+        offset = self.elapsed()
+        self._marks[name] = offset
+        return offset
+
+    def record(
+        self,
+        name: str,
+        *,
+        started_at: float,
+        ended_at: Optional[float] = None,
+        kind: str = "init",
+        background: bool = False,
+        modules_loaded: Optional[int] = None,
+    ) -> StartupPhase:
+        """Record a phase from absolute perf_counter timestamps."""
+        phase = StartupPhase(
+            name=name,
+            kind=kind,
+            started_at=started_at - self._origin,
+            ended_at=None if ended_at is None else ended_at - self._origin,
+            background=background,
+            modules_loaded=modules_loaded,
+        )
+        self._phases.append(phase)
+        return phase
+
+    @contextmanager
+    def phase(
+        self, name: str, *, kind: str = "init", background: bool = False
+    ) -> Iterator[StartupPhase]:
+        modules_before = len(sys.modules)
+        phase = self.record(
+            name,
+            started_at=time.perf_counter(),
+            kind=kind,
+            background=background,
+        )
+        try:
+            yield phase
+        finally:
+            phase.ended_at = self.elapsed()
+            phase.modules_loaded = len(sys.modules) - modules_before
+
+    def track_task(
+        self, name: str, task: asyncio.Future, *, kind: str = "init"
+    ) -> StartupPhase:
+        """Record a background task as a phase that closes when the task finishes."""
+        phase = self.record(
+            name, started_at=time.perf_counter(), kind=kind, background=True
+        )
+
+        def _close(_task: asyncio.Future) -> None:
+            phase.ended_at = self.elapsed()
+
+        task.add_done_callback(_close)
+        return phase
+
+    def to_dict(self) -> Dict[str, Any]:
+        phases = sorted(self._phases, key=lambda item: item.started_at)
+        import_ms = sum(
+            phase.duration_seconds * 1000
+            for phase in phases
+            if phase.kind == "import" and phase.duration_seconds is not None
+        )
+        ready = self._marks.get("ready")
+        return {
+            "schema_version": STARTUP_METRICS_SCHEMA_VERSION,
+            "recorded_at": time.time(),
+            "pid": os.getpid(),
+            "time_to_ready_ms": None if ready is None else round(ready * 1000, 3),
+            "import_ms": round(import_ms, 3),
+            "modules_loaded": len(sys.modules),
+            "marks_ms": {
+                name: round(offset * 1000, 3) for name, offset in self._marks.items()
+            },
+            "phases": [phase.to_dict() for phase in phases],
+        }
+
+    def write_json(self, path: Path) -> Path:
+        """Atomically write the current metrics snapshot to `path`."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=path.parent,
+            delete=False,
+            suffix=".tmp",
+        ) as handle:
+            json.dump(self.to_dict(), handle, indent=2)
+            handle.write("\n")
+            tmp_path = handle.name
+        os.replace(tmp_path, path)
+        return path
+
+    def render_timeline(self, title: str = "Startup timeline") -> str:
+        lines = [f"{title} (total {self.elapsed() * 1000:.1f} ms)"]
+        for phase in sorted(self._phases, key=lambda item: item.started_at):
+            duration = phase.duration_seconds
+            duration_text = (
+                "pending" if duration is None else f"{duration * 1000:9.1f} ms"
+            )
+            marker = " [bg]" if phase.background else ""
+            modules = (
+                f"  (+{phase.modules_loaded} modules)" if phase.modules_loaded else ""
+            )
+            lines.append(
+                f"  +{phase.started_at * 1000:9.1f} ms  {duration_text:>12}  "
+                f"{phase.kind:<6} {phase.name}{marker}{modules}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,414 @@
+"""Session transcript storage formats: plain JSONL and block-indexed.
+
+The indexed format stores transcript lines in independently compressed blocks
+(`<session>.blocks`) plus an append-only sidecar index (`<session>.blocks.idx`:
+JSON lines, a header then one line per block) recording each block's byte
+offset and which line numbers inside it belong to which event type and
+turn_id. Readers can then decompress only the blocks that hold the turns or
+event classes they need and parse only the matching lines. The sidecar suffix
+deliberately matches no transcript glob, so listings and retention see one
+entry per indexed session.
+
+Both codecs produce self-delimiting frames, so a gzip `.blocks` file is also a
+valid multi-member gzip stream (`zcat` works) and a zstd one a valid zstd
+stream.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import zstandard
+except Exception:  # pragma: no cover - optional dependency
+    zstandard = None
+
+logger = logging.getLogger("SessionTranscript")
+
+TRANSCRIPT_FORMATS = ("jsonl", "indexed")
+INDEXED_DATA_SUFFIX = ".blocks"
+INDEXED_INDEX_SUFFIX = ".blocks.idx"
+INDEX_VERSION = 2
+
+
+def resolve_codec(requested: str = "auto") -> str:
+    """Pick a block codec; `auto` prefers zstd when zstandard is installed."""
+    normalized = (requested or "auto").strip().lower()
+    if normalized == "auto":
+        return "zstd" if zstandard is not None else "gzip"
+    if normalized == "zstd" and zstandard is None:
+        logger.warning("zstandard is not installed; using gzip transcript blocks.")
+        return "gzip"
+    if normalized not in {"zstd", "gzip"}:
+        raise ValueError(f"Unknown transcript codec: {requested}")
+    return normalized
+
+
+def _compress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd transcript blocks.")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def index_path_for(data_path: Path) -> Path:
+    data_path = Path(data_path)
+    return data_path.with_name(
+        data_path.name[: -len(INDEXED_DATA_SUFFIX)] + INDEXED_INDEX_SUFFIX
+    )
+
+
+class JsonlTranscriptWriter:
+    """Append one JSON line per record (the original transcript format)."""
+
+    suffix = ".jsonl"
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def write(self, line: str, *, event_type: str, turn_id: str | None) -> bool:
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
+        return False
+
+    def take_block(self) -> None:
+        return None
+
+    def flush(self) -> None:
+        return None
+
+
+@dataclass
+class PendingBlock:
+    """Lines detached from the writer buffer, waiting to be compressed."""
+
+    lines: List[bytes]
+    raw_bytes: int
+    event_types: Dict[str, List[int]] = field(default_factory=dict)
+    turn_ids: Dict[str, List[int]] = field(default_factory=dict)
+
+
+class IndexedTranscriptWriter:
+    """
+    Buffer lines into compressed blocks and append them to the sidecar index.
+
+    `write` only buffers and reports when a block is due. `take_block` then
+    detaches the buffer and `write_block` compresses and appends it; the
+    latter is blocking and must be called in `take_block` order, which lets
+    async callers run it in a worker thread. `flush` does both inline.
+    """
+
+    suffix = INDEXED_DATA_SUFFIX
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        session_id: str,
+        codec: str = "auto",
+        block_max_records: int = 512,
+        block_max_bytes: int = 256 * 1024,
+        flush_interval_seconds: float = 5.0,
+    ):
+        self.path = Path(path)
+        self.index_path = index_path_for(self.path)
+        self._session_id = session_id
+        self._codec = resolve_codec(codec)
+        self._block_max_records = max(1, int(block_max_records))
+        self._block_max_bytes = max(1, int(block_max_bytes))
+        self._flush_interval_seconds = float(flush_interval_seconds)
+        self._offset = 0
+        self._header_written = False
+        self._buffer: List[bytes] = []
+        self._buffer_bytes = 0
+        self._buffer_started_at = 0.0
+        self._event_lines: Dict[str, List[int]] = {}
+        self._turn_lines: Dict[str, List[int]] = {}
+
+    def write(self, line: str, *, event_type: str, turn_id: str | None) -> bool:
+        """Buffer one line; returns True when the pending block should be flushed."""
+        if not self._buffer:
+            self._buffer_started_at = time.monotonic()
+        line_no = len(self._buffer)
+        encoded = line.encode("utf-8") + b"\n"
+        self._buffer.append(encoded)
+        self._buffer_bytes += len(encoded)
+        self._event_lines.setdefault(event_type, []).append(line_no)
+        if turn_id:
+            self._turn_lines.setdefault(str(turn_id), []).append(line_no)
+
+        return (
+            len(self._buffer) >= self._block_max_records
+            or self._buffer_bytes >= self._block_max_bytes
+            or time.monotonic() - self._buffer_started_at >= self._flush_interval_seconds
+        )
+
+    def take_block(self) -> Optional[PendingBlock]:
+        """Detach the buffered lines, or return None when nothing is pending."""
+        if not self._buffer:
+            return None
+        block = PendingBlock(
+            lines=self._buffer,
+            raw_bytes=self._buffer_bytes,
+            event_types=self._event_lines,
+            turn_ids=self._turn_lines,
+        )
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._event_lines = {}
+        self._turn_lines = {}
+        return block
+
+    def write_block(self, block: Optional[PendingBlock]) -> None:
+        """Compress `block`, append it to the data file, then index it."""
+        if block is None:
+            return
+        payload = _compress(self._codec, b"".join(block.lines))
+        with self.path.open("ab") as f:
+            f.write(payload)
+
+        entries = []
+        if not self._header_written:
+            entries.append(
+                {
+                    "version": INDEX_VERSION,
+                    "session_id": self._session_id,
+                    "codec": self._codec,
+                }
+            )
+        entries.append(
+            {
+                "offset": self._offset,
+                "length": len(payload),
+                "records": len(block.lines),
+                "raw_bytes": block.raw_bytes,
+                "event_types": block.event_types,
+                "turn_ids": block.turn_ids,
+            }
+        )
+        # Data goes first, so an index line never points past the data file.
+        with self.index_path.open("a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._header_written = True
+        self._offset += len(payload)
+
+    def flush(self) -> None:
+        """Compress and append the pending block inline."""
+        self.write_block(self.take_block())
+
+
+class IndexedTranscriptReader:
+    """Random access over an indexed transcript via its sidecar index."""
+
+    def __init__(self, data_path: Path):
+        self.path = Path(data_path)
+        self.index_path = index_path_for(self.path)
+        self._index = self._load_index()
+        self._codec = str(self._index.get("codec") or "gzip")
+
+    def _load_index(self) -> Dict[str, Any]:
+        with self.index_path.open("rb") as handle:
+            lines = handle.read().split(b"\n")
+        # A line without its newline is a block the writer never finished indexing.
+        complete = lines[:-1]
+        if not complete:
+            raise ValueError(f"Empty transcript index: {self.index_path}")
+        header = json.loads(complete[0])
+        if header.get("version") != INDEX_VERSION:
+            raise ValueError(
+                f"Unsupported transcript index version in {self.index_path}: "
+                f"{header.get('version')}"
+            )
+        header["blocks"] = [json.loads(line) for line in complete[1:] if line.strip()]
+        header["record_count"] = sum(int(block["records"]) for block in header["blocks"])
+        return header
+
+    @property
+    def record_count(self) -> int:
+        return int(self._index.get("record_count", 0))
+
+    def event_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for block in self._index["blocks"]:
+            for event_type, lines in block["event_types"].items():
+                counts[event_type] = counts.get(event_type, 0) + len(lines)
+        return counts
+
+    def turn_ids(self) -> List[str]:
+        seen: Dict[str, None] = {}
+        for block in self._index["blocks"]:
+            for turn_id in block["turn_ids"]:
+                seen.setdefault(turn_id, None)
+        return list(seen)
+
+    def iter_raw_lines(
+        self,
+        *,
+        event_types: Optional[Iterable[str]] = None,
+        turn_ids: Optional[Iterable[str]] = None,
+    ) -> Iterator[bytes]:
+        """
+        Yield raw JSON lines matching every given filter, in transcript order.
+
+        Blocks with no matching lines are skipped without being read.
+        """
+        wanted_events = set(event_types) if event_types is not None else None
+        wanted_turns = set(turn_ids) if turn_ids is not None else None
+        with self.path.open("rb") as handle:
+            for block in self._index["blocks"]:
+                selected = self._select_lines(block, wanted_events, wanted_turns)
+                if selected is not None and not selected:
+                    continue
+                handle.seek(int(block["offset"]))
+                lines = _decompress(self._codec, handle.read(int(block["length"])))
+                lines = lines.splitlines()
+                if selected is None:
+                    yield from lines
+                else:
+                    for line_no in sorted(selected):
+                        yield lines[line_no]
+
+    def iter_numbered_lines(
+        self,
+        *,
+        start_record: int = 0,
+        event_types: Optional[Iterable[str]] = None,
+    ) -> Iterator[tuple[int, bytes]]:
+        """
+        Yield `(record_number, raw_line)` from `start_record` on.
+
+        Blocks that end before `start_record`, or that hold no line of the
+        given `event_types`, are skipped without being read.
+        """
+        wanted_events = set(event_types) if event_types is not None else None
+        first_record = 0
+        with self.path.open("rb") as handle:
+            for block in self._index["blocks"]:
+                block_records = int(block["records"])
+                block_start = first_record
+                first_record += block_records
+                if first_record <= start_record:
+                    continue
+                selected = self._select_lines(block, wanted_events, None)
+                if selected is not None:
+                    selected = {
+                        line_no
+                        for line_no in selected
+                        if block_start + line_no >= start_record
+                    }
+                    if not selected:
+                        continue
+                handle.seek(int(block["offset"]))
+                lines = _decompress(self._codec, handle.read(int(block["length"])))
+                lines = lines.splitlines()
+                if selected is None:
+                    line_numbers = range(max(0, start_record - block_start), len(lines))
+                else:
+                    line_numbers = sorted(selected)
+                for line_no in line_numbers:
+                    yield block_start + line_no, lines[line_no]
+
+    def iter_records(
+        self,
+        *,
+        event_types: Optional[Iterable[str]] = None,
+        turn_ids: Optional[Iterable[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        for raw in self.iter_raw_lines(event_types=event_types, turn_ids=turn_ids):
+            try:
+                record = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict):
+                yield record
+
+    @staticmethod
+    def _select_lines(
+        block: Dict[str, Any],
+        wanted_events: Optional[set],
+        wanted_turns: Optional[set],
+    ) -> Optional[set]:
+        if wanted_events is None and wanted_turns is None:
+            return None
+        selected: Optional[set] = None
+        if wanted_events is not None:
+            selected = set()
+            for event_type in wanted_events:
+                selected.update(block["event_types"].get(event_type, ()))
+        if wanted_turns is not None:
+            turn_lines: set = set()
+            for turn_id in wanted_turns:
+                turn_lines.update(block["turn_ids"].get(turn_id, ()))
+            selected = turn_lines if selected is None else selected & turn_lines
+        return selected
+
+
+def is_indexed_transcript(path: Path) -> bool:
+    return Path(path).name.endswith(INDEXED_DATA_SUFFIX)
+
+
+def iter_transcript_lines(
+    path: Path, *, event_types: Optional[Iterable[str]] = None
+) -> Iterator[bytes]:
+    """
+    Yield raw transcript lines from any supported format.
+
+    For indexed transcripts `event_types` is applied through the index; for
+    JSONL (plain or .gz) every line is yielded and callers filter.
+    """
+    path = Path(path)
+    if is_indexed_transcript(path):
+        yield from IndexedTranscriptReader(path).iter_raw_lines(event_types=event_types)
+        return
+    opener = gzip.open if path.name.endswith(".gz") else open
+    with opener(path, "rb") as handle:
+        yield from handle
+
+
+def iter_transcript_records(
+    path: Path, *, event_types: Optional[Iterable[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield decoded transcript records from any supported format."""
+    wanted = set(event_types) if event_types is not None else None
+    for raw in iter_transcript_lines(path, event_types=wanted):
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            record = json.loads(raw)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(record, dict):
+            continue
+        if wanted is not None and record.get("event_type") not in wanted:
+            continue
+        yield record
+
+
+def list_session_transcripts(sessions_dir: Path) -> List[Path]:
+    """Return transcripts of every format, newest first."""
+    sessions_dir = Path(sessions_dir)
+    candidates = [
+        path
+        for pattern in ("*.jsonl", "*.jsonl.gz", f"*{INDEXED_DATA_SUFFIX}")
+        for path in sessions_dir.glob(pattern)
+    ]
+    return sorted(
+        candidates,
+        key=lambda path: path.stat().st_mtime if path.exists() else 0,
+        reverse=True,
+    )
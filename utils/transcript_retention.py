@@ -0,0 +1,227 @@
+"""Incremental size/mtime manifest for session transcript retention."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List
+
+from protocol_monk.utils.transcript_format import (
+    INDEXED_DATA_SUFFIX,
+    index_path_for,
+    is_indexed_transcript,
+)
+
+logger = logging.getLogger("SessionTranscript")
+
+MANIFEST_FILENAME = "manifest.json"
+TRANSCRIPT_SUFFIXES = (".jsonl", ".jsonl.gz", INDEXED_DATA_SUFFIX)
+
+
+@dataclass
+class TranscriptEntry:
+    size: int
+    mtime: float
+    compressed: bool = False
+    # Open entries belong to a session that may still be appending; their size
+    # is re-read on the next pass instead of trusted.
+    open: bool = False
+
+
+class TranscriptRetentionManifest:
+    """
+    Track transcript sizes without statting the whole session directory.
+
+    The manifest is refreshed with one directory listing per pass: only files
+    that are new to the manifest or still marked open are stat'ed. An indexed
+    session is one entry keyed by its `.blocks` file, with the sidecar index
+    included in its size. All methods
+    are synchronous and meant to run in a worker thread.
+    """
+
+    VERSION = 1
+
+    def __init__(self, session_dir: Path):
+        self._session_dir = Path(session_dir)
+        self._path = self._session_dir / MANIFEST_FILENAME
+        self._entries: Dict[str, TranscriptEntry] = {}
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def entries(self) -> Dict[str, TranscriptEntry]:
+        return dict(self._entries)
+
+    def load(self) -> None:
+        self._entries = {}
+        if not self._path.exists():
+            return
+        try:
+            raw = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Rebuilding unreadable transcript manifest %s: %s", self._path, exc)
+            return
+        if not isinstance(raw, dict) or raw.get("version") != self.VERSION:
+            return
+        files = raw.get("files")
+        if not isinstance(files, dict):
+            return
+        for name, entry in files.items():
+            if not isinstance(entry, dict):
+                continue
+            try:
+                self._entries[str(name)] = TranscriptEntry(
+                    size=int(entry["size"]),
+                    mtime=float(entry["mtime"]),
+                    compressed=bool(entry.get("compressed", False)),
+                    open=bool(entry.get("open", False)),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    def save(self) -> None:
+        payload = {
+            "version": self.VERSION,
+            "files": {name: asdict(entry) for name, entry in self._entries.items()},
+        }
+        self._session_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=self._session_dir,
+            delete=False,
+            suffix=".tmp",
+        ) as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+            tmp_path = handle.name
+        os.replace(tmp_path, self._path)
+
+    def refresh(self, *, open_names: frozenset[str] = frozenset()) -> None:
+        """Sync the manifest with the directory, statting only unknown/open files."""
+        present = {
+            name
+            for name in os.listdir(self._session_dir)
+            if name.endswith(TRANSCRIPT_SUFFIXES)
+        }
+        for name in list(self._entries):
+            if name not in present:
+                del self._entries[name]
+
+        for name in present:
+            entry = self._entries.get(name)
+            if entry is not None and not entry.open and name not in open_names:
+                continue
+            path = self._session_dir / name
+            try:
+                stat = path.stat()
+            except OSError:
+                self._entries.pop(name, None)
+                continue
+            size, mtime = stat.st_size, stat.st_mtime
+            if is_indexed_transcript(path):
+                # The index sidecar is part of the session: counted, aged and
+                # deleted with its .blocks file, never archived on its own.
+                try:
+                    index_stat = index_path_for(path).stat()
+                except OSError:
+                    pass
+                else:
+                    size += index_stat.st_size
+                    mtime = max(mtime, index_stat.st_mtime)
+            self._entries[name] = TranscriptEntry(
+                size=size,
+                mtime=mtime,
+                compressed=name.endswith(".gz"),
+                open=name in open_names,
+            )
+
+    def prune(
+        self,
+        *,
+        max_sessions: int,
+        max_total_bytes: int,
+        compress: bool = False,
+    ) -> List[str]:
+        """
+        Apply retention newest-first and return the names that were removed.
+
+        Plain transcripts count toward `max_sessions`; with `compress`, plain
+        transcripts that fall outside the window are gzip-archived instead of
+        deleted. Archives only count toward the byte budget. Indexed
+        transcripts are already block-compressed and are never re-archived.
+        """
+        removed: List[str] = []
+        kept = 0
+        total_bytes = 0
+        ordered = sorted(
+            self._entries.items(), key=lambda item: item[1].mtime, reverse=True
+        )
+        for name, entry in ordered:
+            if not entry.compressed:
+                should_keep = entry.open or (
+                    kept < max_sessions
+                    and (total_bytes + entry.size <= max_total_bytes or kept == 0)
+                )
+                if should_keep:
+                    kept += 1
+                    total_bytes += entry.size
+                    continue
+                if compress and name.endswith(".jsonl"):
+                    archived = self._compress(name, entry)
+                    if archived is not None:
+                        name, entry = archived
+                    # Fall through: the archive must still fit the byte budget.
+
+            if entry.compressed and total_bytes + entry.size <= max_total_bytes:
+                total_bytes += entry.size
+                continue
+
+            if self._delete(name):
+                removed.append(name)
+        return removed
+
+    def _compress(
+        self, name: str, entry: TranscriptEntry
+    ) -> tuple[str, TranscriptEntry] | None:
+        source = self._session_dir / name
+        target_name = f"{name}.gz"
+        target = self._session_dir / target_name
+        try:
+            with source.open("rb") as src, gzip.open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.utime(target, (entry.mtime, entry.mtime))
+            archived_size = target.stat().st_size
+            source.unlink()
+        except OSError as exc:
+            logger.warning("Failed to compress session transcript %s: %s", source, exc)
+            target.unlink(missing_ok=True)
+            return None
+
+        del self._entries[name]
+        archived = TranscriptEntry(
+            size=archived_size, mtime=entry.mtime, compressed=True
+        )
+        self._entries[target_name] = archived
+        return target_name, archived
+
+    def _delete(self, name: str) -> bool:
+        path = self._session_dir / name
+        try:
+            path.unlink()
+            if is_indexed_transcript(path):
+                index_path_for(path).unlink(missing_ok=True)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning("Failed to prune session transcript %s: %s", path, exc)
+            return False
+        self._entries.pop(name, None)
+        return True